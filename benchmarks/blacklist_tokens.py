@@ -0,0 +1,72 @@
+"""
+Время добавления всех токенов пользователя в черный список в зависимости от их кол-ва:
+INSERT ... SELECT (BlacklistTokenRepo.add_user_tokens) против загрузки токенов и
+добавления BlacklistToken через ORM.
+
+Запуск: python -m benchmarks.blacklist_tokens, см. benchmarks/utils.py
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.utils import get_engine, measure, print_table, scratch_tables
+from src.data.database.models.jwt import BlacklistToken, OutstandingToken
+from src.data.repositories.blacklist_token import BlacklistTokenRepo
+from src.data.repositories.outstanding_token import OutstandingTokenRepo
+from src.domain.jwt_token.dto.filter import OutstandingTokenFilterSchema
+
+TOKEN_COUNTS = (10, 100, 1000, 10000)
+OTHER_USERS_TOKENS = 100000
+"Токены других пользователей, чтобы запрос выполнялся не по пустой таблице"
+
+
+async def fill_tokens(session: AsyncSession) -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+    rows = [
+        {"user_id": user_id, "jti": f"{user_id}-{i}", "token": "t", "expires_at": expires_at}
+        for user_id, count in [(0, OTHER_USERS_TOKENS), *enumerate(TOKEN_COUNTS, start=1)]
+        for i in range(count)
+    ]
+    for start in range(0, len(rows), 10000):
+        await session.execute(sa.insert(OutstandingToken), rows[start : start + 10000])
+    await session.commit()
+    await session.execute(sa.text("ANALYZE outstanding_tokens"))
+
+
+async def main() -> None:
+    engine = get_engine()
+    tables = (OutstandingToken.__table__, BlacklistToken.__table__)
+    async with scratch_tables(engine, *tables), AsyncSession(engine) as session:
+        await fill_tokens(session)
+
+        async def clear_blacklist() -> None:
+            await session.execute(sa.delete(BlacklistToken))
+            await session.commit()
+
+        rows = []
+        for user_id, count in enumerate(TOKEN_COUNTS, start=1):
+
+            async def insert_select() -> None:
+                await BlacklistTokenRepo(session).add_user_tokens(user_id)
+                await session.commit()
+
+            async def orm() -> None:
+                tokens = await OutstandingTokenRepo(session).list(
+                    OutstandingTokenFilterSchema(user_id=user_id, in_blacklist=False)
+                )
+                session.add_all([BlacklistToken(outstanding_token_id=t.id) for t in tokens])
+                await session.commit()
+
+            orm_ms = await measure(orm, setup=clear_blacklist)
+            insert_select_ms = await measure(insert_select, setup=clear_blacklist)
+            rows.append((count, orm_ms, insert_select_ms, orm_ms / insert_select_ms))
+
+    await engine.dispose()
+    print_table(("tokens", "orm ms", "insert select ms", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Время получения N-ой страницы списка пользователей в админке: LimitOffsetPagination
+(с точным и приблизительным общим кол-вом) против KeysetPagination.
+
+Запуск: python -m benchmarks.keyset_pagination, см. benchmarks/utils.py
+"""
+
+import asyncio
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.utils import get_engine, measure, print_table, scratch_tables
+from src.common.repository import CountMode
+from src.data.admin_repositories.user import UserAdminRepo
+from src.data.database.models.user.user import User
+from src.domain.user.dto.admin import UserAdminFilterSchema
+
+USERS = 200000
+PAGE_SIZE = 20
+PAGES = (1, 100, 1000, 5000, 9999)
+ORDERINGS = (["id"], ["email"])
+
+
+async def fill_users(session: AsyncSession) -> None:
+    rows = [
+        {
+            "first_name": "First",
+            "last_name": f"Last {i % 1000}",
+            "email": f"user{(i * 7919) % USERS}@example.com",
+            "hashed_password": "",
+        }
+        for i in range(USERS)
+    ]
+    for start in range(0, len(rows), 10000):
+        await session.execute(sa.insert(User), rows[start : start + 10000])
+    await session.commit()
+    await session.execute(sa.text("ANALYZE users"))
+
+
+async def main() -> None:
+    engine = get_engine()
+    async with scratch_tables(engine, User.__table__), AsyncSession(engine) as session:
+        await fill_users(session)
+        repo = UserAdminRepo(session)
+
+        rows = []
+        for order in ORDERINGS:
+            for page in PAGES:
+                offset = (page - 1) * PAGE_SIZE
+                offset_params = UserAdminFilterSchema(order=order, pagination=(offset, PAGE_SIZE))
+                cursor = ""
+                if page > 1:
+                    previous = UserAdminFilterSchema(
+                        order=order, pagination=(offset - PAGE_SIZE, PAGE_SIZE)
+                    )
+                    cursor = (await repo.list_with_count(previous)).next_cursor or ""
+                keyset_params = UserAdminFilterSchema(order=order, cursor=(cursor, PAGE_SIZE))
+
+                async def offset_exact() -> None:
+                    await repo.list_with_count(offset_params)
+
+                async def offset_estimate() -> None:
+                    await repo.list_with_count(offset_params, CountMode.ESTIMATE)
+
+                async def keyset() -> None:
+                    page_items = await repo.list_with_count(keyset_params)
+                    assert len(page_items.items) == PAGE_SIZE
+
+                rows.append(
+                    (
+                        ",".join(order),
+                        page,
+                        await measure(offset_exact),
+                        await measure(offset_estimate),
+                        await measure(keyset),
+                    )
+                )
+
+    await engine.dispose()
+    print_table(("order", "page", "offset exact ms", "offset estimate ms", "keyset ms"), rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Общие функции бенчмарков.
+
+Бенчмарки создают и удаляют свои таблицы, поэтому запускаются только на отдельной базе
+данных, asyncpg DSN которой задан в BENCHMARK_POSTGRES_DSN:
+BENCHMARK_POSTGRES_DSN=postgresql+asyncpg://postgres@localhost:5432/bench \\
+python -m benchmarks.<name>
+"""
+
+import os
+import statistics
+import sys
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+DSN_ENV = "BENCHMARK_POSTGRES_DSN"
+
+
+def get_engine() -> AsyncEngine:
+    dsn = os.environ.get(DSN_ENV)
+    if not dsn:
+        sys.exit(f"{DSN_ENV} is not set, see benchmarks/utils.py")
+    return create_async_engine(dsn)
+
+
+@asynccontextmanager
+async def scratch_tables(engine: AsyncEngine, *tables: sa.Table) -> AsyncIterator[None]:
+    """Пустые таблицы на время бенчмарка. Индексы, для которых нет расширения
+    PostgreSQL (например, pg_trgm), пропускаются"""
+    async with engine.begin() as conn:
+        for table in reversed(tables):
+            await conn.execute(sa.schema.DropTable(table, if_exists=True))
+        for table in tables:
+            await conn.execute(sa.schema.CreateTable(table))
+            for index in table.indexes:
+                try:
+                    async with conn.begin_nested():
+                        await conn.execute(sa.schema.CreateIndex(index))
+                except DBAPIError as e:
+                    print(f"Skip index {index.name}: {e.orig}", file=sys.stderr)
+    try:
+        yield
+    finally:
+        async with engine.begin() as conn:
+            for table in reversed(tables):
+                await conn.execute(sa.schema.DropTable(table, if_exists=True))
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any]],
+    repeat: int = 5,
+    setup: Callable[[], Awaitable[Any]] | None = None,
+) -> float:
+    """Медиана времени выполнения func в миллисекундах. setup выполняется перед каждым
+    запуском и в замер не входит"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            await setup()
+        started_at = perf_counter()
+        await func()
+        timings.append((perf_counter() - started_at) * 1000)
+    return statistics.median(timings)
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    cells = [list(map(str, headers))] + [
+        [f"{value:.2f}" if isinstance(value, float) else str(value) for value in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for row in cells:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,16 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.common.database.stats import QueryCacheStats
+from src.common.dependencies.current_admin_user import CurrentAdminUser
+
+router = APIRouter()
+
+
+@router.get("/query-cache", status_code=200, response_model=dict[str, int])
+@inject
+async def query_cache_stats_route(
+    _: CurrentAdminUser,
+    query_cache_stats: QueryCacheStats = Depends(Provide["gateways.query_cache_stats"]),
+):
+    return query_cache_stats.as_dict()
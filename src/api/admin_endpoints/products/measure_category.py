@@ -4,7 +4,7 @@ from dependency_injector.wiring import Provider
 from fastapi import Query
 
 from src.common.admin.api.base_router import BaseAdminRouter
-from src.common.admin.api.types import AdminQueries
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod
 from src.data.database.models.product import MeasureCategory
 from src.domain.products.measure_category.dto.admin import (
     MeasureCategoryAdminCreateSchema,
@@ -35,6 +35,7 @@ class MeasureCategoryAdminRouter(
     create_schema = MeasureCategoryAdminCreateSchema
     update_schema = MeasureCategoryAdminUpdateSchema
     filter_schema = MeasureCategoryAdminFilterSchema
+    bulk_methods = [BulkAPIMethod.import_view]
     queries = MeasureCategoryAdminQueries
     repository_attr_name = "measure_category_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
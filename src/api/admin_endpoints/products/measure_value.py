@@ -4,7 +4,7 @@ from dependency_injector.wiring import Provider
 from fastapi import Query
 
 from src.common.admin.api.base_router import BaseAdminRouter
-from src.common.admin.api.types import AdminQueries
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod
 from src.data.database.models.product import MeasureValue
 from src.domain.products.measure_value.dto.admin import (
     MeasureValueListSchema,
@@ -35,6 +35,7 @@ class MeasureValueAdminRouter(
     create_schema = MeasureValueAdminCreateSchema
     update_schema = MeasureValueAdminUpdateSchema
     filter_schema = MeasureValueAdminFilterSchema
+    bulk_methods = [BulkAPIMethod.import_view]
     queries = MeasureValueAdminQueries
     repository_attr_name = "measure_value_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
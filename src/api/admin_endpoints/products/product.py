@@ -5,7 +5,7 @@ from dependency_injector.wiring import Provider
 from fastapi import Query
 
 from src.common.admin.api.base_router import BaseAdminRouter
-from src.common.admin.api.types import AdminQueries
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod
 from src.data.database.models.product import Product
 from src.domain.products.product.dto.admin import (
     ProductAdminFilterSchema,
@@ -37,6 +37,7 @@ class ProductAdminRouter(
     create_schema = ProductAdminCreateSchema
     update_schema = ProductAdminUpdateSchema
     filter_schema = ProductAdminFilterSchema
+    bulk_methods = BulkAPIMethod.values()
     queries = ProductAdminQueries
     repository_attr_name = "product_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
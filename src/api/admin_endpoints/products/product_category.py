@@ -8,7 +8,7 @@ from starlette.responses import Response
 
 from src.common.admin.api.base_router import BaseAdminRouter
 from src.common.admin.api.decorators import action
-from src.common.admin.api.types import AdminQueries, HTTPMethod
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod, HTTPMethod
 from src.common.admin.enums import ModelLinkAction
 from src.common.dependencies.current_admin_user import CurrentAdminUser
 from src.data.database.models.product import ProductCategory
@@ -43,6 +43,7 @@ class ProductCategoryAdminRouter(
     create_schema = ProductCategoryAdminCreateSchema
     update_schema = ProductCategoryAdminUpdateSchema
     filter_schema = ProductCategoryAdminFilterSchema
+    bulk_methods = [BulkAPIMethod.import_view]
     queries = ProductCategoryAdminQueries
     repository_attr_name = "product_category_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
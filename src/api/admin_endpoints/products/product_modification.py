@@ -4,7 +4,7 @@ from dependency_injector.wiring import Provider
 from fastapi import Query
 
 from src.common.admin.api.base_router import BaseAdminRouter
-from src.common.admin.api.types import AdminQueries
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod
 from src.data.database.models.product import ProductModification
 from src.domain.products.product_modification.dto.admin import (
     ProductModificationListSchema,
@@ -35,6 +35,7 @@ class ProductModificationAdminRouter(
     create_schema = ProductModificationAdminCreateSchema
     update_schema = ProductModificationAdminUpdateSchema
     filter_schema = ProductModificationAdminFilterSchema
+    bulk_methods = [BulkAPIMethod.import_view]
     queries = ProductModificationAdminQueries
     repository_attr_name = "product_modification_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
@@ -5,7 +5,7 @@ from dependency_injector.wiring import Provider
 from fastapi import Query
 
 from src.common.admin.api.base_router import BaseAdminRouter
-from src.common.admin.api.types import AdminQueries
+from src.common.admin.api.types import AdminQueries, BulkAPIMethod
 from src.data.database.models.product import ProductModificationValue
 from src.domain.products.product_modification_value.dto.admin import (
     ProductModificationValueListSchema,
@@ -37,6 +37,7 @@ class ProductModificationValueAdminRouter(
     create_schema = ProductModificationValueAdminCreateSchema
     update_schema = ProductModificationValueAdminUpdateSchema
     filter_schema = ProductModificationValueAdminFilterSchema
+    bulk_methods = BulkAPIMethod.values()
     queries = ProductModificationValueAdminQueries
-    repository_attr_name = "product_modification_admin"
+    repository_attr_name = "product_modification_value_admin"
     uow_factory = Provider["repositories.uow"]  # type: ignore
@@ -12,7 +12,6 @@ from src.common.admin.api.types import AdminQueries, HTTPMethod
 from src.common.dependencies.current_admin_user import CurrentAdminUser
 from src.data.database.models.user import User
 from src.domain.user.admin_use_cases.change_password import ChangePasswordAdmin
-from src.domain.user.admin_use_cases.create_user import CreateUserAdmin
 from src.domain.user.dto.admin import (
     UserAdminFilterSchema,
     UserAdminCreateSchema,
@@ -45,7 +44,7 @@ class UserAdminRouter(
     filter_schema = UserAdminFilterSchema
     queries = UserAdminQueries
     repository_attr_name = "user_admin"
-    create_use_case = CreateUserAdmin
+    create_use_case = Provider["use_cases.create_user_admin"]  # type: ignore
     uow_factory = Provider["repositories.uow"]  # type: ignore
 
     @action(
@@ -7,18 +7,17 @@ from src.common.exceptions.error_codes import ErrorCode
 from src.common.exceptions.http_exceptions import AppHTTPException
 from src.data.database.models.user import User
 from src.domain.jwt_token.enums import JwtTokenType
-from src.domain.jwt_token.use_cases.decode_jwt_token import DecodeJwtToken
-from src.domain.user.dto.filter import UserFilterSchema
-from src.domain.user.use_cases.retrieve_user import RetrieveUser
+from src.domain.user.use_cases.retrieve_user_by_jwt_token import RetrieveUserByJwtToken
 
 
 @inject
 async def get_current_user_from_refresh_token(
     refresh_token: str = Body(..., embed=True),
-    decode_jwt_token: DecodeJwtToken = Depends(Provide["use_cases.decode_jwt_token"]),
-    retrieve_user: RetrieveUser = Depends(Provide["use_cases.retrieve_user"]),
+    retrieve_user_by_jwt_token: RetrieveUserByJwtToken = Depends(
+        Provide["use_cases.retrieve_user_by_jwt_token"]
+    ),
 ) -> User | None:
-    decoded_token, token_in_blacklist = await decode_jwt_token(
+    user, token_in_blacklist = await retrieve_user_by_jwt_token(
         token=refresh_token, token_type=JwtTokenType.REFRESH
     )
     if token_in_blacklist:
@@ -28,7 +27,7 @@ async def get_current_user_from_refresh_token(
             message="Invalid token",
         )
 
-    return await retrieve_user(data=UserFilterSchema(id=decoded_token.user_id))
+    return user
 
 
 CurrentUserFromRefreshToken = Annotated[User, Depends(get_current_user_from_refresh_token)]
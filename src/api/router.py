@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from src.api.admin_endpoints.database import router as database_admin_router
 from src.api.admin_endpoints.products.measure_category import MeasureCategoryAdminRouter
 from src.api.admin_endpoints.products.measure_value import MeasureValueAdminRouter
 from src.api.admin_endpoints.products.product import ProductAdminRouter
@@ -41,6 +42,9 @@ def include_admin_endpoint_routers() -> APIRouter:
         prefix="/product-modification-values",
         tags=["Admin Product Modification Value"],
     )
+    endpoint_router.include_router(
+        database_admin_router, prefix="/database", tags=["Admin Database"]
+    )
 
     return endpoint_router
 
@@ -0,0 +1,22 @@
+"""
+Удаление истекших JWT токенов.
+
+Запуск: python -m src.cli.delete_expired_jwt_tokens [--batch-size N]
+"""
+import argparse
+import asyncio
+
+from src.containers import container
+
+
+async def main(batch_size: int | None) -> None:
+    use_case = container.use_cases.delete_expired_jwt_tokens()
+    deleted = await use_case(batch_size=batch_size)
+    print(f"Deleted {deleted} expired tokens")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete expired JWT tokens")
+    parser.add_argument("--batch-size", type=int, default=None, help="Tokens per transaction")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,77 @@
+"""
+Импорт справочников каталога из CSV или NDJSON.
+
+Запуск: python -m src.cli.import_catalogue <resource> <path> [--format csv|ndjson]
+[--batch-size N]
+
+Файл читается построчно, строки проверяются схемой создания и вставляются пачками.
+Справочники импортируются в порядке зависимостей: measure_categories, measure_values,
+product_categories, product_modifications, product_modification_values, products.
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from src.common.admin.use_cases.import_objects import AdminImportUseCase
+from src.common.utils.import_rows import ROW_PARSERS, RowParseError
+from src.containers import container
+from src.domain.products.measure_category.dto.admin import MeasureCategoryAdminCreateSchema
+from src.domain.products.measure_value.dto.admin import MeasureValueAdminCreateSchema
+from src.domain.products.product.dto.admin import ProductAdminCreateSchema
+from src.domain.products.product_category.dto.admin import ProductCategoryAdminCreateSchema
+from src.domain.products.product_modification.dto.admin import (
+    ProductModificationAdminCreateSchema,
+)
+from src.domain.products.product_modification_value.dto.admin import (
+    ProductModificationValueAdminCreateSchema,
+)
+
+RESOURCES = {
+    "measure_categories": ("measure_category_admin", MeasureCategoryAdminCreateSchema),
+    "measure_values": ("measure_value_admin", MeasureValueAdminCreateSchema),
+    "product_categories": ("product_category_admin", ProductCategoryAdminCreateSchema),
+    "product_modifications": ("product_modification_admin", ProductModificationAdminCreateSchema),
+    "product_modification_values": (
+        "product_modification_value_admin",
+        ProductModificationValueAdminCreateSchema,
+    ),
+    "products": ("product_admin", ProductAdminCreateSchema),
+}
+
+
+async def main(resource: str, path: Path, file_format: str, batch_size: int) -> None:
+    repository_attr_name, create_schema = RESOURCES[resource]
+    use_case = AdminImportUseCase(
+        uow=container.repositories.uow(),
+        repository_attr_name=repository_attr_name,
+        create_schema=create_schema,
+        batch_size=batch_size,
+    )
+    with path.open(encoding="utf-8-sig", newline="") as file:
+        try:
+            report = await use_case(ROW_PARSERS[file_format](file))
+        except RowParseError as e:
+            raise SystemExit(f"Invalid file, batches before the row were imported. {e}")
+
+    print(
+        f"Imported {report.created} of {report.total} rows in {report.duration_seconds:.1f} s "
+        f"({report.rows_per_second:.0f} rows/s), failed: {report.failed}"
+    )
+    for error in report.errors:
+        print(f"Row {error['row']}: {error['field']}: {error['message']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import catalogue data from CSV or NDJSON")
+    parser.add_argument("resource", choices=RESOURCES)
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format", choices=ROW_PARSERS, default=None, help="Defaults to the file extension"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction")
+    args = parser.parse_args()
+    file_format = args.format or args.path.suffix.lstrip(".")
+    if file_format not in ROW_PARSERS:
+        parser.error("Unknown file format, use --format")
+    asyncio.run(main(args.resource, args.path, file_format, args.batch_size))
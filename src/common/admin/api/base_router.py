@@ -1,32 +1,57 @@
 import abc
+import codecs
 import inspect
 from typing import Any, Callable, Generic, Type
 
 from dependency_injector.wiring import inject
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import ValidationError
-from starlette.responses import Response
-
-from src.common.admin.api.types import APIMethod, AdminQueries, QueriesType, AnnotationKey
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from pydantic import ValidationError, conlist, create_model
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from src.common.admin.api.types import (
+    APIMethod,
+    BulkAPIMethod,
+    FileFormat,
+    AdminQueries,
+    QueriesType,
+    AnnotationKey,
+    TOTAL_COUNT_HEADER,
+    NEXT_CURSOR_HEADER,
+)
 from src.common.admin.interfaces import (
+    IAdminBulkCreateUseCase,
+    IAdminBulkDeleteUseCase,
+    IAdminBulkUpdateUseCase,
+    IAdminImportUseCase,
     IAdminListUseCase,
     IAdminCreateUseCase,
     IAdminRetrieveUseCase,
     IAdminUpdateFilesUseCase,
     IAdminDeleteUseCase,
     IAdminUpdateUseCase,
+    ImportReport,
+)
+from src.common.admin.use_cases.bulk import (
+    AdminBulkCreateUseCase,
+    AdminBulkDeleteUseCase,
+    AdminBulkUpdateUseCase,
 )
 from src.common.admin.use_cases.create import AdminCreateUseCase
 from src.common.admin.use_cases.delete import AdminDeleteUseCase
+from src.common.admin.use_cases.import_objects import AdminImportUseCase
 from src.common.admin.use_cases.list import AdminListUseCase
 from src.common.admin.use_cases.retrieve import AdminRetrieveUseCase
 from src.common.admin.use_cases.update import AdminUpdateUseCase
 from src.common.admin.use_cases.update_files import AdminUpdateFilesUseCase
 from src.common.dependencies.current_admin_user import get_current_admin_user, CurrentAdminUser
 from src.common.dto import OrmModel, BaseOutSchema
+from src.common.exceptions.use_case_exceptions import ImportFileHTTPException
 from src.common.repository import ModelEntity
 from src.common.types.python_types import IdType, AdminFilterSchema, SchemaInType
 from src.common.uow import BaseUnitOfWork
+from src.common.utils.export import iter_csv, iter_ndjson
+from src.common.utils.import_rows import ROW_PARSERS, RowParseError
 from src.data.database.models.user import User
 
 
@@ -36,6 +61,9 @@ class BaseAdminRouter(
     APIRouter,
 ):
     methods: list = APIMethod.values()
+    bulk_methods: list = []
+    "Массовые операции (BulkAPIMethod), по умолчанию отключены"
+    bulk_max_items: int = 1000
 
     id_type: Type = int
     uow_factory: Callable[..., BaseUnitOfWork]
@@ -57,14 +85,25 @@ class BaseAdminRouter(
     update_use_case: Callable[..., IAdminUpdateUseCase] = AdminUpdateUseCase
     delete_use_case: Callable[..., IAdminDeleteUseCase] = AdminDeleteUseCase
     update_files_use_case: Callable[..., IAdminUpdateFilesUseCase] = AdminUpdateFilesUseCase
+    bulk_create_use_case: Callable[..., IAdminBulkCreateUseCase] = AdminBulkCreateUseCase
+    bulk_update_use_case: Callable[..., IAdminBulkUpdateUseCase] = AdminBulkUpdateUseCase
+    bulk_delete_use_case: Callable[..., IAdminBulkDeleteUseCase] = AdminBulkDeleteUseCase
+    import_use_case: Callable[..., IAdminImportUseCase] = AdminImportUseCase
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.add_endpoints()
 
     def add_endpoints(self) -> None:
+        # Маршруты /explain, /export и /bulk регистрируются раньше /{object_id}
         crud_views: dict[str, Callable] = {
             APIMethod.list_view: self.add_list_endpoint,
+            APIMethod.explain_view: self.add_explain_endpoint,
+            APIMethod.export_view: self.add_export_endpoint,
+            BulkAPIMethod.bulk_create_view: self.add_bulk_create_endpoint,
+            BulkAPIMethod.bulk_update_view: self.add_bulk_update_endpoint,
+            BulkAPIMethod.bulk_delete_view: self.add_bulk_delete_endpoint,
+            BulkAPIMethod.import_view: self.add_import_endpoint,
             APIMethod.create_view: self.add_create_endpoint,
             APIMethod.retrieve_view: self.add_retrieve_endpoint,
             APIMethod.update_view: self.add_update_endpoint,
@@ -75,13 +114,13 @@ class BaseAdminRouter(
             crud_views[APIMethod.update_files_view] = self.add_update_file_links_endpoint
 
         for view_name, add_view_method in crud_views.items():
-            if view_name in self.methods:
+            if view_name in self.methods or view_name in self.bulk_methods:
                 add_view_method()
 
     def add_list_endpoint(self) -> None:
         @inject
         async def list_view(
-            _: CurrentAdminUser, queries: QueriesType = Depends()
+            _: CurrentAdminUser, response: Response, queries: QueriesType = Depends()
         ) -> list[ModelEntity]:
             use_case = await self._list_use_case_factory()
             try:
@@ -91,8 +130,19 @@ class BaseAdminRouter(
                     detail=e.errors(), status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
                 )
 
-            results = await use_case(schema)
-            return results  # type: ignore
+            fields = self._get_selected_fields(queries)
+            page = await use_case.list_with_count(
+                schema, queries.count_mode, list(self.list_schema.__fields__)
+            )
+            if page.total_count is not None:
+                response.headers[TOTAL_COUNT_HEADER] = str(page.total_count)
+            if page.next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+            if fields is None:
+                return page.items  # type: ignore
+
+            content = [self._encode_list_item(item, fields) for item in page.items]
+            return JSONResponse(content, headers=dict(response.headers))  # type: ignore
 
         list_view.__annotations__[AnnotationKey.QUERIES] = self.queries
 
@@ -105,6 +155,33 @@ class BaseAdminRouter(
             response_model=list[self.list_schema],  # type: ignore
         )
 
+    def add_explain_endpoint(self) -> None:
+        async def explain_view(
+            _: CurrentAdminUser,
+            queries: QueriesType = Depends(),
+            analyze: bool = Query(False, description="EXPLAIN ANALYZE, executes the queries"),
+            buffers: bool = Query(False, description="Buffer usage, only with analyze"),
+        ) -> dict[str, list[dict[str, Any]]]:
+            use_case = await self._list_use_case_factory()
+            try:
+                schema = self.filter_schema.from_orm(queries)
+            except ValidationError as e:
+                raise HTTPException(
+                    detail=e.errors(), status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+
+            return await use_case.explain(schema, analyze=analyze, buffers=buffers)
+
+        explain_view.__annotations__[AnnotationKey.QUERIES] = self.queries
+
+        self.add_api_route(
+            "/explain",
+            endpoint=explain_view,
+            summary="Explain list queries",
+            methods=["GET"],
+            status_code=status.HTTP_200_OK,
+        )
+
     def add_create_endpoint(self) -> None:
         async def create_view(new_object: SchemaInType, _: CurrentAdminUser) -> ModelEntity:
             use_case = await self._create_use_case_factory()
@@ -121,6 +198,155 @@ class BaseAdminRouter(
             status_code=status.HTTP_201_CREATED,
         )
 
+    def add_export_endpoint(self) -> None:
+        async def export_view(
+            _: CurrentAdminUser,
+            queries: QueriesType = Depends(),
+            export_format: FileFormat = Query(FileFormat.CSV, alias="format"),
+        ) -> StreamingResponse:
+            use_case = await self._list_use_case_factory()
+            try:
+                schema = self.filter_schema.from_orm(queries)
+            except ValidationError as e:
+                raise HTTPException(
+                    detail=e.errors(), status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+
+            fields = self._get_selected_fields(queries)
+            rows = (
+                self._encode_list_item(entity, fields) async for entity in use_case.export(schema)
+            )
+            filename = f"{self.entity_class.__tablename__}.{export_format.value}"
+            if export_format == FileFormat.CSV:
+                header = fields or list(self.list_schema.__fields__)
+                content, media_type = iter_csv(rows, header), "text/csv"
+            else:
+                content, media_type = iter_ndjson(rows), "application/x-ndjson"
+            return StreamingResponse(
+                content,
+                media_type=media_type,
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
+
+        export_view.__annotations__[AnnotationKey.QUERIES] = self.queries
+
+        self.add_api_route(
+            "/export",
+            endpoint=export_view,
+            summary="Export",
+            description="All objects matching the filters. _start, _end, _cursor and _count "
+            "are ignored",
+            methods=["GET"],
+            response_class=StreamingResponse,
+            status_code=status.HTTP_200_OK,
+        )
+
+    def _get_selected_fields(self, queries: AdminQueries) -> list[str] | None:
+        """Поля list_schema из параметра _fields, id всегда первым. None - все поля"""
+        fields = queries.fields
+        if fields is None:
+            return None
+        unknown = set(fields) - set(self.list_schema.__fields__)
+        if unknown:
+            raise HTTPException(
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        return ["id", *(field for field in fields if field != "id")]
+
+    def _encode_list_item(self, entity: ModelEntity, fields: list[str] | None) -> Any:
+        """Сериализация через list_schema, как в response_model списка"""
+        include = set(fields) if fields is not None else None
+        return jsonable_encoder(self.list_schema.from_orm(entity), include=include)
+
+    def add_bulk_create_endpoint(self) -> None:
+        async def bulk_create_view(
+            new_objects: list[SchemaInType], _: CurrentAdminUser
+        ) -> list[ModelEntity]:
+            use_case = await self._bulk_create_use_case_factory()
+            return await use_case(new_objects)
+
+        bulk_create_view.__annotations__[AnnotationKey.NEW_OBJECTS] = conlist(
+            self.create_schema, min_items=1, max_items=self.bulk_max_items
+        )
+
+        self.add_api_route(
+            "/bulk",
+            bulk_create_view,
+            summary="Bulk create",
+            methods=["POST"],
+            response_model=list[self.retrieve_schema],  # type: ignore
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    def add_bulk_update_endpoint(self) -> None:
+        async def bulk_update_view(
+            updated_objects: list[SchemaInType], _: CurrentAdminUser
+        ) -> list[ModelEntity]:
+            use_case = await self._bulk_update_use_case_factory()
+            return await use_case(updated_objects)
+
+        bulk_update_schema = create_model(
+            f"Bulk{self.update_schema.__name__}",
+            __base__=self.update_schema,
+            id=(self.id_type, ...),
+        )
+        bulk_update_view.__annotations__[AnnotationKey.UPDATED_OBJECTS] = conlist(
+            bulk_update_schema, min_items=1, max_items=self.bulk_max_items
+        )
+
+        self.add_api_route(
+            "/bulk",
+            bulk_update_view,
+            summary="Bulk update",
+            methods=["PATCH"],
+            response_model=list[self.retrieve_schema],  # type: ignore
+            status_code=status.HTTP_200_OK,
+        )
+
+    def add_bulk_delete_endpoint(self) -> None:
+        async def bulk_delete_view(
+            _: CurrentAdminUser, object_ids: list[IdType] = Query(..., alias="id")
+        ) -> Response:
+            use_case = await self._bulk_delete_use_case_factory()
+            await use_case(object_ids)
+            return Response(status_code=status.HTTP_204_NO_CONTENT)  # type: ignore
+
+        bulk_delete_view.__annotations__[AnnotationKey.OBJECT_IDS] = conlist(
+            self.id_type, min_items=1, max_items=self.bulk_max_items
+        )
+
+        self.add_api_route(
+            "/bulk",
+            endpoint=bulk_delete_view,
+            summary="Bulk delete",
+            methods=["DELETE"],
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+
+    def add_import_endpoint(self) -> None:
+        async def import_view(
+            _: CurrentAdminUser,
+            file: UploadFile = File(...),
+            file_format: FileFormat = Query(FileFormat.CSV, alias="format"),
+        ) -> ImportReport:
+            use_case = await self._import_use_case_factory()
+            # Файл читается use case в пуле потоков, а не в event loop
+            lines = codecs.iterdecode(file.file, "utf-8-sig")
+            try:
+                return await use_case(ROW_PARSERS[file_format](lines))
+            except RowParseError as e:
+                raise ImportFileHTTPException(e.row, e.message)
+
+        self.add_api_route(
+            "/import",
+            endpoint=import_view,
+            summary="Import from CSV or NDJSON",
+            methods=["POST"],
+            response_model=ImportReport,
+            status_code=status.HTTP_200_OK,
+        )
+
     def add_retrieve_endpoint(self) -> None:
         async def retrieve_view(object_id: IdType, _: CurrentAdminUser) -> ModelEntity:
             use_case = await self._retrieve_use_case_factory()
@@ -246,3 +472,43 @@ class BaseAdminRouter(
         if inspect.isawaitable(use_case):
             use_case = await use_case
         return use_case
+
+    async def _bulk_create_use_case_factory(self) -> IAdminBulkCreateUseCase:
+        use_case = self.bulk_create_use_case(
+            uow=self.uow_factory(),
+            repository_attr_name=self.repository_attr_name,
+            filter_schema_class=self.filter_schema,
+        )
+        if inspect.isawaitable(use_case):
+            use_case = await use_case
+        return use_case
+
+    async def _bulk_update_use_case_factory(self) -> IAdminBulkUpdateUseCase:
+        use_case = self.bulk_update_use_case(
+            uow=self.uow_factory(),
+            repository_attr_name=self.repository_attr_name,
+            filter_schema_class=self.filter_schema,
+        )
+        if inspect.isawaitable(use_case):
+            use_case = await use_case
+        return use_case
+
+    async def _bulk_delete_use_case_factory(self) -> IAdminBulkDeleteUseCase:
+        use_case = self.bulk_delete_use_case(
+            uow=self.uow_factory(),
+            repository_attr_name=self.repository_attr_name,
+            filter_schema_class=self.filter_schema,
+        )
+        if inspect.isawaitable(use_case):
+            use_case = await use_case
+        return use_case
+
+    async def _import_use_case_factory(self) -> IAdminImportUseCase:
+        use_case = self.import_use_case(
+            uow=self.uow_factory(),
+            repository_attr_name=self.repository_attr_name,
+            create_schema=self.create_schema,
+        )
+        if inspect.isawaitable(use_case):
+            use_case = await use_case
+        return use_case
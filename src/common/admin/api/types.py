@@ -5,6 +5,7 @@ from typing import Generic, TypeVar, Callable, Awaitable
 from choicesenum import ChoicesEnum
 from fastapi import Query
 
+from src.common.filters.enums import CountMode
 from src.common.types.python_types import IdType
 
 
@@ -15,6 +16,24 @@ class APIMethod(ChoicesEnum):
     update_view = "update_view"
     delete_view = "delete_view"
     update_files_view = "update_file_links_view"
+    explain_view = "explain_view"
+    export_view = "export_view"
+
+
+class BulkAPIMethod(ChoicesEnum):
+    bulk_create_view = "bulk_create_view"
+    bulk_update_view = "bulk_update_view"
+    bulk_delete_view = "bulk_delete_view"
+    import_view = "import_view"
+
+
+class FileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 class HTTPMethod(ChoicesEnum):
@@ -29,6 +48,9 @@ class AnnotationKey(str, Enum):
     NEW_OBJECT = "new_object"
     OBJECT_ID = "object_id"
     UPDATED_OBJECT = "updated_object"
+    NEW_OBJECTS = "new_objects"
+    UPDATED_OBJECTS = "updated_objects"
+    OBJECT_IDS = "object_ids"
 
 
 @dataclass
@@ -38,14 +60,39 @@ class AdminQueries(Generic[IdType]):
     _order: str | None = Query("ASC", regex="^(ASC|DESC)$")
     _start: int = Query(0)
     _end: int = Query(10)
+    _cursor: str | None = Query(None, description="Cursor from the X-Next-Cursor header")
+    _count: CountMode = Query(
+        CountMode.EXACT, description="X-Total-Count mode: exact or planner estimate"
+    )
+    _fields: str | None = Query(
+        None, description="Comma separated list schema fields to return, id is always included"
+    )
 
     def __post_init__(self) -> None:
         self._ids: list[IdType] | None = self.id
         self.id = None
 
     @property
-    def pagination(self) -> tuple[int, int]:
-        return self._start, (self._end - self._start) if self._end > self._start else 0
+    def limit(self) -> int:
+        return (self._end - self._start) if self._end > self._start else 0
+
+    @property
+    def pagination(self) -> tuple[int, int] | None:
+        return (self._start, self.limit) if not self._cursor else None
+
+    @property
+    def cursor(self) -> tuple[str, int] | None:
+        return (self._cursor, self.limit) if self._cursor else None
+
+    @property
+    def count_mode(self) -> CountMode:
+        return self._count
+
+    @property
+    def fields(self) -> list[str] | None:
+        if not self._fields:
+            return None
+        return [field.strip() for field in self._fields.split(",") if field.strip()]
 
     @property
     def order(self) -> list[str] | None:
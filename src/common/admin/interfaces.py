@@ -1,8 +1,9 @@
 import abc
-from dataclasses import dataclass
-from typing import Generic, Type, ClassVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Generic, Iterable, Sequence, Type, ClassVar
 
-from src.common.repository import ModelEntity
+from src.common.filters.enums import CountMode
+from src.common.repository import ListPage, ModelEntity
 from src.common.types.python_types import (
     IdType,
     AdminFilterSchema,
@@ -37,7 +38,28 @@ class IAdminListUseCase(
         ...
 
     @abc.abstractmethod
-    async def count(self, filter_schema: AdminFilterSchema) -> int:
+    async def count(
+        self, filter_schema: AdminFilterSchema, mode: CountMode = CountMode.EXACT
+    ) -> int:
+        ...
+
+    @abc.abstractmethod
+    async def list_with_count(
+        self,
+        filter_schema: AdminFilterSchema,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Sequence[str] | None = None,
+    ) -> ListPage[ModelEntity]:
+        ...
+
+    @abc.abstractmethod
+    def export(self, filter_schema: AdminFilterSchema) -> AsyncIterator[ModelEntity]:
+        ...
+
+    @abc.abstractmethod
+    async def explain(
+        self, filter_schema: AdminFilterSchema, analyze: bool = False, buffers: bool = False
+    ) -> dict[str, list[dict[str, Any]]]:
         ...
 
     @abc.abstractmethod
@@ -82,6 +104,65 @@ class IAdminDeleteUseCase(Generic[IdType], abc.ABC):
         ...
 
 
+@dataclass
+class IAdminBulkCreateUseCase(Generic[SchemaInType, ModelEntity], abc.ABC):
+    uow: BaseUnitOfWork
+    repository_attr_name: str
+    filter_schema_class: Type[AdminFilterSchema]
+
+    @abc.abstractmethod
+    async def __call__(self, new_objects: Sequence[SchemaInType]) -> list[ModelEntity]:
+        ...
+
+
+@dataclass
+class IAdminBulkUpdateUseCase(Generic[SchemaInType, ModelEntity], abc.ABC):
+    uow: BaseUnitOfWork
+    repository_attr_name: str
+    filter_schema_class: Type[AdminFilterSchema]
+
+    @abc.abstractmethod
+    async def __call__(self, updated_objects: Sequence[SchemaInType]) -> list[ModelEntity]:
+        ...
+
+
+@dataclass
+class IAdminBulkDeleteUseCase(Generic[IdType], abc.ABC):
+    uow: BaseUnitOfWork
+    repository_attr_name: str
+    filter_schema_class: Type[AdminFilterSchema]
+
+    @abc.abstractmethod
+    async def __call__(self, object_ids: Sequence[IdType]) -> None:
+        ...
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    """Ошибки по строкам: row - номер строки данных начиная с 1, message, error_code и field.
+    У строки может быть несколько ошибок, по одной на поле"""
+    duration_seconds: float = 0
+    rows_per_second: float = 0
+
+
+@dataclass
+class IAdminImportUseCase(Generic[SchemaInType], abc.ABC):
+    uow: BaseUnitOfWork
+    repository_attr_name: str
+    create_schema: Type[SchemaInType]
+    batch_size: int = 1000
+    max_errors: int = 1000
+    "Максимальное кол-во ошибок в отчете, остальные учитываются только в failed"
+
+    @abc.abstractmethod
+    async def __call__(self, rows: Iterable[Any]) -> ImportReport:
+        ...
+
+
 @dataclass
 class IAdminUpdateFilesUseCase(Generic[IdType, SchemaInType, ModelEntity], abc.ABC):
     uow: BaseUnitOfWork
@@ -0,0 +1,128 @@
+from typing import Any, Awaitable, Callable, Sequence
+
+from sqlalchemy.exc import IntegrityError
+
+from src.common.admin.interfaces import (
+    IAdminBulkCreateUseCase,
+    IAdminBulkDeleteUseCase,
+    IAdminBulkUpdateUseCase,
+)
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.exceptions.handlers.exception_handlers import handle_integrity_exception
+from src.common.exceptions.use_case_exceptions import BulkOperationHTTPException
+from src.common.repository import BaseRepo, ModelEntity
+from src.common.types.python_types import AdminFilterSchema, IdType, SchemaInType
+from src.common.uow import BaseUnitOfWork
+
+BulkStatement = Callable[[Sequence[Any]], Awaitable[Sequence[Any]]]
+
+
+async def execute_bulk_with_errors(
+    uow: BaseUnitOfWork, statement: BulkStatement, items: Sequence[Any]
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Выполнение массового запроса в SAVEPOINT. При ошибке целостности запрос повторяется
+    для каждого элемента в отдельном SAVEPOINT, чтобы получить ошибки по элементам.
+    Элементы с ошибками пропускаются, index в ошибке - позиция элемента в items"""
+    try:
+        async with uow.savepoint():
+            return list(await statement(items)), []
+    except IntegrityError:
+        pass
+
+    results: list[Any] = []
+    errors: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        try:
+            async with uow.savepoint():
+                results.extend(await statement([item]))
+        except IntegrityError as e:
+            errors.append({"index": index, **handle_integrity_exception(e)._asdict()})
+    return results, errors
+
+
+async def execute_bulk(
+    uow: BaseUnitOfWork, statement: BulkStatement, items: Sequence[Any]
+) -> list[Any]:
+    """Выполнение массового запроса, см. execute_bulk_with_errors. Если есть ошибки,
+    выбрасывается BulkOperationHTTPException и транзакция откатывается"""
+    results, errors = await execute_bulk_with_errors(uow, statement, items)
+    if errors:
+        raise BulkOperationHTTPException(errors)
+    return results
+
+
+def not_found_errors(ids: Sequence[Any], existing_ids: set[Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "index": index,
+            "message": "Object does not exist",
+            "error_code": ErrorCode.NOT_FOUND,
+            "field": "id",
+        }
+        for index, object_id in enumerate(ids)
+        if object_id not in existing_ids
+    ]
+
+
+async def list_in_order(
+    repository: BaseRepo, filter_schema_class: type[AdminFilterSchema], ids: Sequence[Any]
+) -> list[ModelEntity]:
+    entities = await repository.list(filter_schema_class(ids=ids))
+    entities_by_id = {entity.id: entity for entity in entities}  # type: ignore
+    return [entities_by_id[object_id] for object_id in ids]
+
+
+class AdminBulkCreateUseCase(IAdminBulkCreateUseCase[SchemaInType, ModelEntity]):
+    async def __call__(self, new_objects: Sequence[SchemaInType]) -> list[ModelEntity]:
+        values = [new_object.dict(exclude_unset=True) for new_object in new_objects]
+        async with self.uow:
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            ids = await execute_bulk(self.uow, repository.bulk_create, values)
+            self.uow.mark_changed(repository.model.__tablename__)
+            await self.uow.commit()
+            return await list_in_order(repository, self.filter_schema_class, ids)
+
+
+class AdminBulkUpdateUseCase(IAdminBulkUpdateUseCase[SchemaInType, ModelEntity]):
+    async def __call__(self, updated_objects: Sequence[SchemaInType]) -> list[ModelEntity]:
+        values = [updated_object.dict(exclude_unset=True) for updated_object in updated_objects]
+        ids = [value["id"] for value in values]
+        async with self.uow:
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            errors = not_found_errors(ids, await repository.existing_ids(ids))
+            if errors:
+                raise BulkOperationHTTPException(errors)
+
+            await execute_bulk(self.uow, repository.bulk_update, values)
+            self.uow.mark_changed(repository.model.__tablename__)
+            await self.uow.commit()
+            return await list_in_order(repository, self.filter_schema_class, ids)
+
+
+class AdminBulkDeleteUseCase(IAdminBulkDeleteUseCase[IdType]):
+    async def __call__(self, object_ids: Sequence[IdType]) -> None:
+        async with self.uow:
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            if repository.supports_returning_delete:
+                deleted_ids = await execute_bulk(self.uow, repository.bulk_delete, object_ids)
+                errors = not_found_errors(object_ids, set(deleted_ids))
+                if errors:
+                    raise BulkOperationHTTPException(errors)
+
+                self.uow.mark_changed(repository.model.__tablename__)
+                await self.uow.commit()
+                return
+
+            # Связи многие-ко-многим и обнуление внешних ключей выполняются только ORM,
+            # поэтому записи загружаются и удаляются по одной, как в AdminDeleteUseCase
+            entities = await repository.list(self.filter_schema_class(ids=object_ids))
+            entities_by_id = {entity.id: entity for entity in entities}  # type: ignore
+            errors = not_found_errors(object_ids, set(entities_by_id))
+            if errors:
+                raise BulkOperationHTTPException(errors)
+
+            async def delete_entities(ids: Sequence[IdType]) -> Sequence[Any]:
+                return await repository.delete_all([entities_by_id[i] for i in dict.fromkeys(ids)])
+
+            await execute_bulk(self.uow, delete_entities, object_ids)
+            await self.uow.commit()
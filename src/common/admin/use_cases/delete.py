@@ -9,6 +9,16 @@ class AdminDeleteUseCase(IAdminDeleteUseCase[IdType]):
     async def __call__(self, object_id: IdType) -> None:
         async with self.uow:
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            if repository.supports_returning_delete:
+                try:
+                    await repository.delete_returning(object_id)
+                except NotFoundException:
+                    raise NotFoundHTTPException
+
+                self.uow.mark_changed(repository.model.__tablename__)
+                await self.uow.commit()
+                return
+
             try:
                 entity = await repository.retrieve(self.filter_schema_class(id=object_id))
             except NotFoundException:
@@ -0,0 +1,94 @@
+from time import perf_counter
+from typing import Any, Iterable
+
+from pydantic import ValidationError
+from starlette.concurrency import iterate_in_threadpool
+
+from src.common.admin.interfaces import IAdminImportUseCase, ImportReport
+from src.common.admin.use_cases.bulk import execute_bulk_with_errors
+from src.common.database.lookups import ForeignKeyCache
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.repository import BaseRepo
+from src.common.types.python_types import SchemaInType
+from src.common.utils.import_rows import batched
+
+
+class AdminImportUseCase(IAdminImportUseCase[SchemaInType]):
+    """Импорт строк пачками по batch_size: проверка схемой создания и внешних ключей,
+    вставка одним INSERT и commit на каждую пачку. Строки с ошибками пропускаются.
+    Пачки читаются из rows в пуле потоков: чтение файла и разбор строк не блокируют event loop"""
+
+    async def __call__(self, rows: Iterable[Any]) -> ImportReport:
+        report = ImportReport()
+        started_at = perf_counter()
+        async with self.uow:
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            foreign_keys = ForeignKeyCache(self.uow.session, repository.model)
+            batches = batched(enumerate(rows, start=1), self.batch_size)
+            async for batch in iterate_in_threadpool(batches):
+                await self._import_batch(repository, foreign_keys, batch, report)
+
+        report.duration_seconds = perf_counter() - started_at
+        if report.duration_seconds:
+            report.rows_per_second = report.total / report.duration_seconds
+        return report
+
+    async def _import_batch(
+        self,
+        repository: BaseRepo,
+        foreign_keys: ForeignKeyCache,
+        batch: list[tuple[int, Any]],
+        report: ImportReport,
+    ) -> None:
+        report.total += len(batch)
+        parsed: list[tuple[int, dict[str, Any]]] = []
+        for row_number, row in batch:
+            try:
+                values = self.create_schema.parse_obj(row).dict(exclude_unset=True)
+            except ValidationError as e:
+                errors = [
+                    {
+                        "message": error["msg"],
+                        "error_code": ErrorCode.VALIDATION_ERROR,
+                        "field": ".".join(str(loc) for loc in error["loc"]),
+                    }
+                    for error in e.errors()
+                ]
+                self._add_errors(report, row_number, errors)
+                continue
+            parsed.append((row_number, values))
+
+        valid: list[tuple[int, dict[str, Any]]] = []
+        missing = await foreign_keys.find_missing([values for _, values in parsed])
+        for (row_number, values), missing_fields in zip(parsed, missing):
+            if missing_fields:
+                errors = [
+                    {
+                        "message": "Foreign key doesn't exists",
+                        "error_code": ErrorCode.FOREIGN_KEY_ERROR,
+                        "field": field,
+                    }
+                    for field in missing_fields
+                ]
+                self._add_errors(report, row_number, errors)
+                continue
+            valid.append((row_number, values))
+
+        if not valid:
+            return
+
+        ids, errors = await execute_bulk_with_errors(
+            self.uow, repository.bulk_create, [values for _, values in valid]
+        )
+        for error in errors:
+            row_number, _ = valid[error.pop("index")]
+            self._add_errors(report, row_number, [error])
+        report.created += len(ids)
+        self.uow.mark_changed(repository.model.__tablename__)
+        await self.uow.commit()
+
+    def _add_errors(self, report: ImportReport, row: int, errors: list[dict[str, Any]]) -> None:
+        """Ошибки строки, по одной на каждое поле, строка учитывается в failed один раз"""
+        report.failed += 1
+        for error in errors[: max(self.max_errors - len(report.errors), 0)]:
+            report.errors.append({"row": row, **error})
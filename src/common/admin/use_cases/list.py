@@ -1,5 +1,11 @@
+from typing import Any, AsyncIterator, Sequence
+
 from src.common.admin.interfaces import IAdminListUseCase
-from src.common.repository import ModelEntity, SpecsSchema, FacetsSchema, BaseRepo
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.exceptions.repository_exceptions import InvalidCursorException
+from src.common.exceptions.use_case_exceptions import UseCaseHTTPException
+from src.common.filters.enums import CountMode
+from src.common.repository import ModelEntity, SpecsSchema, FacetsSchema, BaseRepo, ListPage
 from src.common.types.python_types import AdminFilterSchema
 
 
@@ -7,22 +13,57 @@ class AdminListUseCase(
     IAdminListUseCase[AdminFilterSchema, ModelEntity, SpecsSchema, FacetsSchema],
 ):
     async def __call__(self, filter_schema: AdminFilterSchema) -> list[ModelEntity]:
-        async with self.uow:
+        async with self.uow.replica():
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
             results = await repository.list(filter_schema)
         return results  # type: ignore
 
-    async def count(self, filter_schema: AdminFilterSchema) -> int:
-        async with self.uow:
+    async def list_with_count(
+        self,
+        filter_schema: AdminFilterSchema,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Sequence[str] | None = None,
+    ) -> ListPage[ModelEntity]:
+        async with self.uow.replica():
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            try:
+                return await repository.list_with_count(filter_schema, count_mode, fields)
+            except InvalidCursorException:
+                raise UseCaseHTTPException(
+                    message="Invalid cursor", error_code=ErrorCode.INVALID_CURSOR, field="_cursor"
+                )
+
+    async def count(
+        self, filter_schema: AdminFilterSchema, mode: CountMode = CountMode.EXACT
+    ) -> int:
+        async with self.uow.replica():
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
-            return await repository.count(filter_schema)
+            return await repository.count(filter_schema, mode)
 
     async def specs(self, filter_schema: AdminFilterSchema) -> SpecsSchema:
-        async with self.uow:
+        async with self.uow.replica():
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
             return await repository.specs(filter_schema)
 
     async def facets(self, filter_schema: AdminFilterSchema) -> FacetsSchema:
-        async with self.uow:
+        async with self.uow.replica():
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
             return await repository.facets(filter_schema)
+
+    async def export(self, filter_schema: AdminFilterSchema) -> AsyncIterator[ModelEntity]:
+        async with self.uow.replica():
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            async for entity in repository.stream(filter_schema):
+                yield entity
+
+    async def explain(
+        self, filter_schema: AdminFilterSchema, analyze: bool = False, buffers: bool = False
+    ) -> dict[str, list[dict[str, Any]]]:
+        async with self.uow.replica():
+            repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            try:
+                return await repository.explain(filter_schema, analyze=analyze, buffers=buffers)
+            except InvalidCursorException:
+                raise UseCaseHTTPException(
+                    message="Invalid cursor", error_code=ErrorCode.INVALID_CURSOR, field="_cursor"
+                )
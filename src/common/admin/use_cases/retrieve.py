@@ -7,7 +7,7 @@ from src.common.types.python_types import IdType
 
 class AdminRetrieveUseCase(IAdminRetrieveUseCase[IdType, ModelEntity]):
     async def __call__(self, object_id: IdType) -> ModelEntity:
-        async with self.uow:
+        async with self.uow.replica():
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
             try:
                 return await repository.retrieve(self.filter_schema_class(id=object_id))
@@ -7,14 +7,25 @@ from src.common.types.python_types import IdType, SchemaInType
 
 class AdminUpdateUseCase(IAdminUpdateUseCase[IdType, SchemaInType, ModelEntity]):
     async def __call__(self, object_id: IdType, updated_object: SchemaInType) -> ModelEntity:
+        data = updated_object.dict(exclude_unset=True)
         async with self.uow:
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
+            if data and repository.supports_returning_update:
+                try:
+                    entity = await repository.update_returning(object_id, data)
+                except NotFoundException:
+                    raise NotFoundHTTPException
+
+                self.uow.mark_changed(repository.model.__tablename__)
+                await self.uow.commit()
+                return entity
+
             try:
                 entity = await repository.retrieve(self.filter_schema_class(id=object_id))
             except NotFoundException:
                 raise NotFoundHTTPException
 
-            for attr_name, attr_value in updated_object.dict(exclude_unset=True).items():
+            for attr_name, attr_value in data.items():
                 setattr(entity, attr_name, attr_value)
 
             await self.uow.commit()
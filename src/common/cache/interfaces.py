@@ -0,0 +1,25 @@
+import abc
+from typing import Any
+
+
+class ICacheBackend(abc.ABC):
+    """Асинхронное хранилище кэша. Реализация может хранить данные в памяти процесса
+    или во внешнем хранилище"""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """
+        :param key: Ключ
+        :param value: Значение
+        :param ttl: Время жизни записи в секундах. None - значение хранилища по умолчанию,
+        0 - без ограничения
+        """
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
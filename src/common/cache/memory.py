@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Iterator, TypeVar
+
+from src.common.cache.interfaces import ICacheBackend
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class InMemoryTTLCache(Generic[_K, _V]):
+    """Ограниченный по размеру LRU кэш в памяти процесса с временем жизни записей"""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """
+        :param maxsize: Максимальное кол-во записей, при превышении вытесняются самые старые
+        :param ttl: Время жизни записи по умолчанию в секундах, None - без ограничения
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[_K, tuple[_V, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.has(key)
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(list(self._data))
+
+    def has(self, key: _K) -> bool:
+        """Есть ли актуальная запись. В отличие от get не меняет порядок вытеснения"""
+        try:
+            _, expires_at = self._data[key]
+        except KeyError:
+            return False
+
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return False
+        return True
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        try:
+            value, expires_at = self._data[key]
+        except KeyError:
+            return default
+
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: _K,
+        value: _V,
+        ttl: float | None = None,
+        expires_at: float | None = None,
+    ) -> None:
+        """
+        :param key: Ключ
+        :param value: Значение
+        :param ttl: Время жизни записи в секундах, перекрывает значение по умолчанию
+        :param expires_at: Unix timestamp, после которого запись считается устаревшей.
+        Итоговое время жизни - минимальное из ttl и expires_at
+        """
+        if self.maxsize <= 0:
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        deadlines = [d for d in (expires_at, time.time() + ttl if ttl else None) if d]
+        deadline = min(deadlines) if deadlines else None
+        if deadline is not None and deadline <= time.time():
+            return
+
+        self._data[key] = (value, deadline)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: _K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """Хранилище кэша в памяти процесса"""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """
+        :param maxsize: Максимальное кол-во записей
+        :param ttl: Время жизни записи по умолчанию в секундах
+        """
+        self._cache: InMemoryTTLCache[str, Any] = InMemoryTTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import uuid
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from src.common.cache.interfaces import ICacheBackend
+
+_T = TypeVar("_T")
+
+
+class QueryResultCache:
+    """
+    Кэш результатов запросов на чтение (specs, facets).
+    Ключ записи включает версии таблиц, от которых зависит результат. Инвалидация меняет
+    версию таблицы, поэтому старые записи перестают использоваться и вытесняются по ttl.
+    """
+
+    version_key_prefix = "table_version"
+
+    def __init__(self, backend: ICacheBackend, ttl: float | None = None) -> None:
+        """
+        :param backend: Хранилище кэша
+        :param ttl: Время жизни результата в секундах
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        tables: Iterable[str],
+        params: dict[str, Any],
+        func: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """
+        :param namespace: Пространство имен ключа (репозиторий и метод)
+        :param tables: Таблицы, изменение которых инвалидирует результат
+        :param params: Параметры запроса
+        :param func: Вычисление результата при промахе
+        """
+        key = await self._make_key(namespace, tables, params)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cached
+
+        result = await func()
+        await self.backend.set(key, result, ttl=self.ttl)
+        return result
+
+    async def invalidate(self, *tables: str) -> None:
+        for table in tables:
+            await self.backend.set(self._version_key(table), uuid.uuid4().hex, ttl=0)
+
+    async def _make_key(self, namespace: str, tables: Iterable[str], params: dict) -> str:
+        versions = [await self._get_version(table) for table in sorted(tables)]
+        # Параметры нормализуются: порядок ключей и пустые значения не влияют на ключ
+        normalized = {k: v for k, v in params.items() if v not in (None, [], (), {}, "")}
+        payload = json.dumps([namespace, versions, normalized], sort_keys=True, default=str)
+        return f"{namespace}:{hashlib.sha1(payload.encode()).hexdigest()}"
+
+    async def _get_version(self, table: str) -> str:
+        version = await self.backend.get(self._version_key(table))
+        if version is None:
+            # Версия могла быть вытеснена: новая версия не совпадет ни с одним старым ключом
+            version = uuid.uuid4().hex
+            await self.backend.set(self._version_key(table), version, ttl=0)
+        return version
+
+    def _version_key(self, table: str) -> str:
+        return f"{self.version_key_prefix}:{table}"
@@ -0,0 +1,25 @@
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CHANGED_TABLES_KEY = "changed_tables"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session: Session, flush_context: object) -> None:
+    """Сбор таблиц, измененных через ORM, для инвалидации кэша после commit"""
+    tables = session.info.setdefault(CHANGED_TABLES_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+
+def mark_changed(session: Session, *tables: str) -> None:
+    """Отметка таблиц, измененных запросами вне ORM (insert, update, delete)"""
+    session.info.setdefault(CHANGED_TABLES_KEY, set()).update(tables)
+
+
+def pop_changed_tables(session: Session) -> set[str]:
+    return session.info.pop(CHANGED_TABLES_KEY, set())
@@ -1,11 +1,55 @@
-from asyncio import current_task
+from asyncio import Semaphore, current_task
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
+from src.common.database.profiling import QueryProfiler
+from src.common.database.stats import QueryCacheStats
 
-def get_db_session(config: dict):
-    async_engine = create_async_engine(config["dsn"], echo=False, future=True)
+
+def get_db_engine(
+    config: dict,
+    dsn: str | None = None,
+    query_cache_stats: QueryCacheStats | None = None,
+    query_profiler: QueryProfiler | None = None,
+) -> AsyncEngine:
+    engine = create_async_engine(
+        dsn or config["dsn"],
+        echo=False,
+        future=True,
+        query_cache_size=config["query_cache_size"],
+        pool_size=config["pool_size"],
+        max_overflow=config["max_overflow"],
+        pool_timeout=config["pool_timeout"],
+        pool_recycle=config["pool_recycle"],
+        pool_pre_ping=config["pool_pre_ping"],
+        connect_args={
+            # Кэш подготовленных выражений asyncpg и SQLAlchemy. 0 - для работы через pgbouncer
+            "statement_cache_size": config["statement_cache_size"],
+            "prepared_statement_cache_size": config["statement_cache_size"],
+        },
+    )
+    if query_cache_stats is not None:
+        query_cache_stats.attach(engine)
+    if query_profiler is not None:
+        query_profiler.attach(engine)
+    return engine
+
+
+def get_db_session(
+    config: dict,
+    dsn: str | None = None,
+    query_cache_stats: QueryCacheStats | None = None,
+    query_profiler: QueryProfiler | None = None,
+):
+    async_engine = get_db_engine(config, dsn, query_cache_stats, query_profiler)
     return async_scoped_session(
         sessionmaker(  # type: ignore
             async_engine,
@@ -14,3 +58,51 @@ def get_db_session(config: dict):
         ),
         scopefunc=current_task,
     )
+
+
+def get_replica_db_session(
+    config: dict,
+    query_cache_stats: QueryCacheStats | None = None,
+    query_profiler: QueryProfiler | None = None,
+):
+    """Сессия реплики только для чтения. None, если реплика не настроена"""
+    if not config.get("replica_dsn"):
+        return None
+    return get_db_session(
+        config,
+        dsn=config["replica_dsn"],
+        query_cache_stats=query_cache_stats,
+        query_profiler=query_profiler,
+    )
+
+
+class ParallelSessionFactory:
+    """Короткоживущие сессии из пула соединений для параллельного выполнения независимых
+    запросов на чтение. Кол-во одновременно открытых сессий ограничено семафором, лимит
+    должен быть меньше размера пула, чтобы оставить соединения для остальных запросов"""
+
+    def __init__(self, session_factory: sessionmaker, limit: int) -> None:
+        """
+        :param session_factory: Фабрика сессий движка для чтения
+        :param limit: Максимальное кол-во одновременно открытых сессий
+        """
+        self.session_factory = session_factory
+        self.semaphore = Semaphore(limit)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        async with self.semaphore:
+            async with self.session_factory() as session:
+                yield session
+
+
+def get_parallel_session_factory(
+    config: dict,
+    scoped_session: async_scoped_session,
+    replica_scoped_session: async_scoped_session | None = None,
+) -> ParallelSessionFactory | None:
+    """Фабрика параллельных сессий на реплике или основной базе. None, если отключена"""
+    if config["parallel_sessions_limit"] <= 0:
+        return None
+    read_session = replica_scoped_session if replica_scoped_session is not None else scoped_session
+    return ParallelSessionFactory(read_session.session_factory, config["parallel_sessions_limit"])
@@ -0,0 +1,71 @@
+import json
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN для запроса SQLAlchemy с сохранением связанных параметров"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any, analyze: bool = False, buffers: bool = False) -> None:
+        """
+        :param statement: Запрос
+        :param analyze: Выполнить запрос и получить фактические показатели (EXPLAIN ANALYZE)
+        :param buffers: Статистика использования буферов, только вместе с analyze
+        """
+        self.statement = statement
+        self.analyze = analyze
+        self.buffers = buffers
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    options = ["FORMAT JSON"]
+    if element.analyze:
+        options.append("ANALYZE")
+        if element.buffers:
+            options.append("BUFFERS")
+    return f"EXPLAIN ({', '.join(options)}) {compiler.process(element.statement, **kw)}"
+
+
+class ExplainSession:
+    """Обертка над AsyncSession, сохраняющая SQL, параметры и план каждого выполняемого
+    запроса. Запрос выполняется после EXPLAIN, чтобы вызывающий код получил результат,
+    поэтому с analyze запрос выполняется дважды"""
+
+    def __init__(self, session: AsyncSession, analyze: bool = False, buffers: bool = False):
+        """
+        :param session: Сессия, в которой выполняются запросы
+        :param analyze: Использовать EXPLAIN ANALYZE
+        :param buffers: Статистика использования буферов, только вместе с analyze
+        """
+        self.session = session
+        self.analyze = analyze
+        self.buffers = buffers
+        self.plans: list[dict[str, Any]] = []
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        if not isinstance(statement, Explain):
+            explain = Explain(statement, analyze=self.analyze, buffers=self.buffers)
+            plan = (await self.session.execute(explain)).scalar()
+            compiled = statement.compile(dialect=postgresql.dialect())
+            self.plans.append(
+                {
+                    "sql": str(compiled),
+                    "params": compiled.params,
+                    "plan": json.loads(plan) if isinstance(plan, str) else plan,
+                }
+            )
+        return await self.session.execute(statement, *args, **kwargs)
+
+    def pop_plans(self) -> list[dict[str, Any]]:
+        plans, self.plans = self.plans, []
+        return plans
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
@@ -0,0 +1,11 @@
+from sqlalchemy import Index
+
+
+def trigram_index(table_name: str, column: str) -> Index:
+    """GIN индекс pg_trgm для поиска ILIKE '%...%' по колонке (см. TrigramILikeFilter)"""
+    return Index(
+        f"ix_{table_name}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
@@ -0,0 +1,34 @@
+from typing import Any, Sequence
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.database.mixins import BaseClass
+
+
+class ForeignKeyCache:
+    """Проверка существования значений внешних ключей модели с кэшированием результатов.
+    Каждое значение запрашивается из базы данных один раз"""
+
+    def __init__(self, session: AsyncSession, model: type[BaseClass]) -> None:
+        self.session = session
+        self.columns = {
+            key: next(iter(column.foreign_keys)).column
+            for key, column in inspect(model).columns.items()
+            if column.foreign_keys
+        }
+        self._existing: dict[str, set[Any]] = {key: set() for key in self.columns}
+        self._missing: dict[str, set[Any]] = {key: set() for key in self.columns}
+
+    async def find_missing(self, rows: Sequence[dict[str, Any]]) -> list[list[str]]:
+        """Поля с несуществующими значениями внешних ключей для каждой строки"""
+        for key, target in self.columns.items():
+            values = {row[key] for row in rows if row.get(key) is not None}
+            unknown = values - self._existing[key] - self._missing[key]
+            if not unknown:
+                continue
+            existing = set((await self.session.scalars(select(target).where(target.in_(unknown)))))
+            self._existing[key] |= existing
+            self._missing[key] |= unknown - existing
+
+        return [[key for key in self.columns if row.get(key) in self._missing[key]] for row in rows]
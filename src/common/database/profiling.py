@@ -0,0 +1,97 @@
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestQueryStats:
+    """Статистика запросов к базе данных в рамках одного HTTP запроса"""
+
+    statements: int = 0
+    duration: float = 0
+    "Суммарное время выполнения в секундах"
+    rows: int = 0
+    """Сумма rowcount драйвера: строки INSERT, UPDATE, DELETE и строки SELECT, если драйвер
+    сообщает их кол-во при выполнении (asyncpg без server-side курсора). Строки, получаемые
+    через server-side курсор (stream), не учитываются"""
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+request_query_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+"""Статистика текущего HTTP запроса. Объект общий для задач, созданных в запросе
+(параллельные сессии), так как контекст копируется вместе со ссылкой на него"""
+
+
+class QueryProfiler:
+    """Учет запросов в статистике текущего HTTP запроса и логирование медленных запросов"""
+
+    def __init__(self, slow_query_threshold_ms: float = 0) -> None:
+        """
+        :param slow_query_threshold_ms: Запросы дольше порога логируются с параметрами,
+        значения которых скрыты. 0 - не логировать
+        """
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        # Время хранится в контексте выполнения, а не в соединении: для запроса с ошибкой
+        # after_cursor_execute не вызывается, и значение не должно оставаться в соединении
+        context._query_start_time = perf_counter()
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration = perf_counter() - context._query_start_time
+        stats = request_query_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.duration += duration
+            stats.rows += max(cursor.rowcount, 0)
+
+        duration_ms = duration * 1000
+        if self.slow_query_threshold_ms and duration_ms >= self.slow_query_threshold_ms:
+            logger.warning(
+                "Slow query %.1f ms: %s; parameters: %s",
+                duration_ms,
+                statement,
+                redact_parameters(parameters),
+                extra={"duration_ms": duration_ms, "statement": statement},
+            )
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Замена значений параметров запроса на названия их типов"""
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return type(parameters)(redact_parameters(value) for value in parameters)
+    return f"<{type(parameters).__name__}>"
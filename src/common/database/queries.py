@@ -0,0 +1,12 @@
+import sqlalchemy as sa
+from sqlalchemy.sql import Select
+
+
+def selects_whole_table(query: Select) -> bool:
+    """Запрос выбирает все строки одной таблицы: без условий, join, группировки, DISTINCT,
+    LIMIT, OFFSET и опций загрузки. Сортировка не учитывается"""
+    froms = query.get_final_froms()
+    if query.whereclause is not None or len(froms) != 1 or not isinstance(froms[0], sa.Table):
+        return False
+    plain = sa.select(*[description["expr"] for description in query.column_descriptions])
+    return query.order_by(None).compare(plain)
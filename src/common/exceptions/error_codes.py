@@ -7,3 +7,6 @@ class ErrorCode(str, Enum):
     UNIQUE_ERROR = "unique_error"
     FOREIGN_KEY_ERROR = "foreign_key_error"
     INSTANCE_ALREADY_UNLINKED = "instance_already_unlinked"
+    INVALID_CURSOR = "invalid_cursor"
+    BULK_OPERATION_ERROR = "bulk_operation_error"
+    VALIDATION_ERROR = "validation_error"
@@ -2,10 +2,14 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from src.common.exceptions.base_exceptions import BaseHTTPException
+from src.common.exceptions.use_case_exceptions import (
+    BulkOperationHTTPException,
+    ImportFileHTTPException,
+)
 
 
 def use_case_http_exception_handler(request: Request, exc: BaseHTTPException):
-    return JSONResponse(
-        status_code=exc.status,
-        content={"message": exc.message, "error_code": exc.error_code, "field": exc.field},
-    )
+    content = {"message": exc.message, "error_code": exc.error_code, "field": exc.field}
+    if isinstance(exc, (BulkOperationHTTPException, ImportFileHTTPException)):
+        content["errors"] = exc.errors
+    return JSONResponse(status_code=exc.status, content=content)
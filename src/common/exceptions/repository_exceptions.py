@@ -1,2 +1,6 @@
 class NotFoundException(Exception):
     ...
+
+
+class InvalidCursorException(Exception):
+    ...
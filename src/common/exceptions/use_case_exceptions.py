@@ -1,3 +1,5 @@
+from typing import Any
+
 from src.common.exceptions.base_exceptions import BaseHTTPException
 from src.common.exceptions.error_codes import ErrorCode
 
@@ -20,3 +22,30 @@ class NotFoundHTTPException(BaseHTTPException):
     def __init__(self, message: str | None = None):
         if message:
             self.message = message
+
+
+class BulkOperationHTTPException(BaseHTTPException):
+    """Ошибка массовой операции. Изменения не сохраняются, errors содержит ошибки по
+    элементам: index - позиция элемента в запросе, message, error_code и field"""
+
+    status: int = 400
+    error_code = ErrorCode.BULK_OPERATION_ERROR
+    field: str = "non_field"
+    message: str = "Bulk operation failed, no changes were saved"
+
+    def __init__(self, errors: list[dict[str, Any]]):
+        self.errors = errors
+
+
+class ImportFileHTTPException(BaseHTTPException):
+    """Файл импорта не читается. Пачки строк до row уже сохранены"""
+
+    status: int = 422
+    error_code = ErrorCode.VALIDATION_ERROR
+    field: str = "file"
+
+    def __init__(self, row: int, message: str):
+        self.message = f"Invalid file at row {row}: {message}"
+        self.errors = [
+            {"row": row, "message": message, "error_code": self.error_code, "field": self.field}
+        ]
@@ -11,11 +11,13 @@ from .filters import (
     Filter,
     ILikeFilter,
     InFilter,
+    KeysetPagination,
     LimitOffsetPagination,
     MethodFilter,
     NumberFilter,
     OrderingFilter,
     RangeFilter,
+    TrigramILikeFilter,
     YearMonthFilter,
 )
 from .filterset import FilterSet
@@ -23,9 +25,11 @@ from .filterset import FilterSet
 __all__ = (
     "FilterSet",
     "LimitOffsetPagination",
+    "KeysetPagination",
     "Filter",
     "InFilter",
     "ILikeFilter",
+    "TrigramILikeFilter",
     "CharFilter",
     "CharInFilter",
     "EnumFilter",
@@ -1,9 +1,14 @@
 import abc
+import base64
+import binascii
+import copy
+import json
 import operator as operators
+from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Type
 
 import sqlalchemy as sa
-from pydantic import BaseModel, parse_obj_as
+from pydantic import BaseModel, ValidationError, parse_obj_as
 from sqlalchemy import cast, func
 from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +17,7 @@ from sqlalchemy.sql import ColumnElement, Select
 
 from src.common.database.mixins import BaseClass
 from src.common.enums import ChoicesEnum
+from src.common.exceptions.repository_exceptions import InvalidCursorException
 from src.common.filters.constants import EMPTY_VALUES
 from src.common.filters.interfaces import IBaseFilter
 from src.common.filters.schemas import ChoiceSchema, NumberFilterSpecsSchema
@@ -20,6 +26,11 @@ if TYPE_CHECKING:
     from src.common.filters.interfaces import IFilterSet
 
 
+def with_criteria(condition: ColumnElement, criteria: ColumnElement | None) -> ColumnElement:
+    """Условие агрегата, дополненное условием criteria общего запроса"""
+    return condition if criteria is None else sa.and_(condition, criteria)
+
+
 class BaseFilter(IBaseFilter):
     """Абстрактный класс фильтра"""
 
@@ -33,12 +44,29 @@ class BaseFilter(IBaseFilter):
     "Показатель того, что фильтр имплементировал метод получения specs в колонке основного запроса"
     has_facets_columns: bool = False
     "Показатель того, что фильтр имплементировал метод получения facets в колонке основного запроса"
+    requires_parent: bool = False
+    "Фильтру нужен экземпляр FilterSet. Остальные фильтры общие для всех экземпляров FilterSet"
+    supports_columns_criteria: bool = True
+    "Колонки specs и facets фильтра поддерживают условие criteria"
+
+    def bind(self, parent: "IFilterSet") -> "BaseFilter":
+        """Фильтр для экземпляра FilterSet. Фильтры без parent не копируются"""
+        if not self.requires_parent:
+            return self
+        filter_ = copy.copy(self)
+        filter_.parent = parent
+        return filter_
 
     @abc.abstractmethod
     def filter(self, query: Select, value: Any) -> Select:
         """Метод реализующий фильтрацию"""
         ...
 
+    def criteria(self, value: Any) -> ColumnElement | None:
+        """Условие WHERE, которое фильтр добавляет в запрос. None, если значение пустое или
+        фильтр меняет запрос иначе (join, сортировка, пагинация)"""
+        return None
+
     async def specs(self, session: AsyncSession, query: Select) -> bool | list | dict | None:
         """Метод реализующий получение specs"""
         raise NotImplementedError
@@ -47,12 +75,20 @@ class BaseFilter(IBaseFilter):
         """Метод реализующий получение facets"""
         raise NotImplementedError
 
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        """Метод реализующий получение specs в колонке общего запроса"""
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        """Метод реализующий получение specs в колонке общего запроса
+        :param criteria: Условие FILTER (WHERE ...) для агрегатов колонки
+        """
         raise NotImplementedError
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        """Метод реализующий получение facets в колонке общего запроса"""
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        """Метод реализующий получение facets в колонке общего запроса
+        :param criteria: Условие FILTER (WHERE ...) для агрегатов колонки
+        """
         raise NotImplementedError
 
 
@@ -80,20 +116,24 @@ class Filter(BaseFilter):
         self.nullable = nullable
 
     def filter(self, query: Select, value: Any) -> Select:
+        criteria = self.criteria(value)
+        return query if criteria is None else query.where(criteria)
+
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = getattr(self.model, self.field) == value
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class InFilter(Filter):
-    def filter(self, query: Select, value: Sequence) -> Select:
+    def criteria(self, value: Sequence) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = getattr(self.model, self.field).in_(value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class CharFilter(Filter):
@@ -134,14 +174,16 @@ class CharFilter(Filter):
         self.order_by_attr = order_by_attr
         self.enum_type = enum_type
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         if not any([self.display_attr, self.enum_type]):
             return sa.select(sa.text("1")).label(self.field_name), lambda x: None
 
         field = sa.cast(getattr(self.model, self.field), sa.String)
         bundle = (
             func.array_agg(aggregate_order_by(sa.distinct(field), field.asc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -207,12 +249,12 @@ class CharFilter(Filter):
 class CharInFilter(CharFilter):
     """Фильтр по вхождению строки в список"""
 
-    def filter(self, query: Select, value: Sequence) -> Select:
+    def criteria(self, value: Sequence) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = getattr(self.model, self.field).in_(value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class EnumFilter(Filter):
@@ -223,11 +265,13 @@ class EnumFilter(Filter):
     has_specs_columns: bool = True
     has_facets_columns: bool = True
 
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         bundle = (
             func.array_agg(aggregate_order_by(sa.distinct(field), field.asc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -236,8 +280,10 @@ class EnumFilter(Filter):
 
         return bundle, parse
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        bundle, _ = self.specs_columns()
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        bundle, _ = self.specs_columns(criteria)
 
         def parse(result: Any) -> list:
             return result if result else []
@@ -262,12 +308,12 @@ class EnumFilter(Filter):
 class EnumInFilter(EnumFilter):
     """Фильтр по вхождению enum в список"""
 
-    def filter(self, query: Select, value: Sequence) -> Select:
+    def criteria(self, value: Sequence) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = getattr(self.model, self.field).in_(value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class DatePartFilter(Filter):
@@ -297,14 +343,16 @@ class DatePartFilter(Filter):
         super().__init__(model=model, field=field, exclude=exclude, nullable=nullable)
         self.date_part = date_part
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = sa.extract(self.date_part, getattr(self.model, self.field)) == value
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         date_part: ColumnElement = sa.cast(
             sa.extract(self.date_part, field),
@@ -313,7 +361,7 @@ class DatePartFilter(Filter):
 
         bundle = (
             func.array_agg(aggregate_order_by(sa.distinct(date_part), date_part.desc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -322,7 +370,9 @@ class DatePartFilter(Filter):
 
         return bundle, parse
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         date_part: ColumnElement = sa.cast(
             sa.extract(self.date_part, field),
@@ -331,7 +381,7 @@ class DatePartFilter(Filter):
 
         bundle = (
             func.array_agg(aggregate_order_by(sa.distinct(date_part), date_part.desc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -357,15 +407,15 @@ class DatePartFilter(Filter):
 class DatePartInFilter(DatePartFilter):
     """Фильтр по вхождению определнной части даты в список"""
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = sa.extract(
             self.date_part,
             getattr(self.model, self.field),
         ).in_(value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class YearMonthFilter(Filter):
@@ -395,24 +445,26 @@ class YearMonthFilter(Filter):
         super().__init__(model=model, field=field, exclude=exclude, nullable=nullable)
         self.specs_schema = specs_schema
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         field = getattr(self.model, self.field)
         year_part, month_part = sa.extract("year", field), sa.func.to_char(field, sa.text("'MM'"))
         value_field = sa.func.concat(year_part, sa.text("'-'"), month_part)
         expression = value_field == value
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         year, month = sa.extract("year", field), sa.func.to_char(field, sa.text("'MM'"))
         date_part = sa.func.concat(year, sa.text("'-'"), month)
 
         bundle = (
             func.array_agg(aggregate_order_by(sa.distinct(date_part), date_part.desc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -425,8 +477,10 @@ class YearMonthFilter(Filter):
 
         return bundle, parse
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        bundle, _ = self.specs_columns()
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        bundle, _ = self.specs_columns(criteria)
 
         def parse(result: Any) -> dict:
             return result if result else []
@@ -484,9 +538,9 @@ class RangeFilter(Filter):
         super().__init__(model=model, field=field, exclude=exclude, nullable=nullable)
         self.specs_schema = specs_schema
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
         min_value, max_value = value
 
         expressions = []
@@ -495,14 +549,22 @@ class RangeFilter(Filter):
             expressions.append(column >= min_value)
         if max_value is not None:
             expressions.append(column <= max_value)
+        if not expressions:
+            return None
         expression = sa.and_(*expressions)
-        return query.where(~expression if self.exclude else expression)
-
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+        return ~expression if self.exclude else expression
+
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        min_value = sa.func.min(getattr(self.model, self.field))
+        max_value = sa.func.max(getattr(self.model, self.field))
+        if criteria is not None:
+            min_value, max_value = min_value.filter(criteria), max_value.filter(criteria)
         bundle = Bundle(
             self.field_name,
-            sa.func.min(getattr(self.model, self.field)).label(f"min_{self.field_name}"),
-            sa.func.max(getattr(self.model, self.field)).label(f"max_{self.field_name}"),
+            min_value.label(f"min_{self.field_name}"),
+            max_value.label(f"max_{self.field_name}"),
         )
 
         def parse(result: Any) -> dict:
@@ -514,8 +576,10 @@ class RangeFilter(Filter):
 
         return bundle, parse
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        return self.specs_columns()
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        return self.specs_columns(criteria)
 
     async def specs(self, session: AsyncSession, query: Select) -> dict:
         field = getattr(self.model, self.field)
@@ -555,12 +619,12 @@ class NumberFilter(RangeFilter):
         self.specs_schema = specs_schema
         self.operator = operator
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = self.operator(getattr(self.model, self.field), value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
 
 class BooleanFilter(Filter):
@@ -571,18 +635,20 @@ class BooleanFilter(Filter):
     has_specs_columns: bool = True
     has_facets_columns: bool = True
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         expression = getattr(self.model, self.field).is_(value)
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
 
-    def specs_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def specs_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         bundle = (
             func.array_agg(aggregate_order_by(func.distinct(field), field.desc()))
-            .filter(field.is_not(None))
+            .filter(with_criteria(field.is_not(None), criteria))
             .label(self.field_name)
         )
 
@@ -591,8 +657,10 @@ class BooleanFilter(Filter):
 
         return bundle, parse
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
-        return self.specs_columns()
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
+        return self.specs_columns(criteria)
 
     async def specs(self, session: AsyncSession, query: Select) -> list[bool]:
         field = getattr(self.model, self.field).label("value")
@@ -616,18 +684,20 @@ class CheckboxFilter(Filter):
     has_specs_columns = False
     has_facets_columns = True
 
-    def filter(self, query: Select, value: Any) -> Select:
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
         value = value if not self.exclude else not value
-        expression = getattr(self.model, self.field).is_(value)
-        return query.where(expression)
+        return getattr(self.model, self.field).is_(value)
 
-    def facets_columns(self) -> tuple[Bundle | ColumnElement, Callable]:
+    def facets_columns(
+        self, criteria: ColumnElement | None = None
+    ) -> tuple[Bundle | ColumnElement, Callable]:
         field = getattr(self.model, self.field)
         value = True if not self.exclude else False
+        count = func.count(field).filter(with_criteria(field.is_(value), criteria))
         bundle: ColumnElement = sa.case(
-            [[func.count(field).filter(field.is_(value)) > sa.text("0"), sa.true()]],
+            [[count > sa.text("0"), sa.true()]],
             else_=sa.false(),
         ).label(self.field_name)
 
@@ -666,20 +736,36 @@ class ILikeFilter(BaseFilter):
         self.nullable = nullable
 
     def filter(self, query: Select, value: Any) -> Select:
+        criteria = self.criteria(value)
+        return query if criteria is None else query.where(criteria)
+
+    def criteria(self, value: Any) -> ColumnElement | None:
         if not self.nullable and value in EMPTY_VALUES:
-            return query
+            return None
 
         if "*" in value or "_" in value:
             looking_for = value.replace("_", "__").replace("*", "%").replace("?", "_")
         else:
             looking_for = "%{0}%".format(value)
         expression = sa.or_(
-            *[
-                cast(getattr(self.model, field), sa.String).ilike(looking_for)
-                for field in self.fields
-            ]
+            *[self.get_field_expression(field).ilike(looking_for) for field in self.fields]
         )
-        return query.where(~expression if self.exclude else expression)
+        return ~expression if self.exclude else expression
+
+    def get_field_expression(self, field: str) -> ColumnElement:
+        return cast(getattr(self.model, field), sa.String)
+
+
+class TrigramILikeFilter(ILikeFilter):
+    """Фильтр по поиску в списке полей с использованием GIN индексов pg_trgm.
+    Строковые поля сравниваются без CAST, иначе индекс по колонке не применяется.
+    Для полей нужен индекс с gin_trgm_ops (см. trigram_index)"""
+
+    def get_field_expression(self, field: str) -> ColumnElement:
+        column = getattr(self.model, field)
+        if isinstance(column.type, sa.String):
+            return column
+        return super().get_field_expression(field)
 
 
 class OrderingFilter(BaseFilter):
@@ -719,14 +805,172 @@ class LimitOffsetPagination(BaseFilter):
     """Фильтр для управления limit и offset"""
 
     def filter(self, query: Select, values: Sequence[int]) -> Select:
+        if values in EMPTY_VALUES:
+            return query
+
         offset, limit = values
         return query.offset(offset).limit(limit)
 
 
+class KeysetPagination(BaseFilter):
+    """Пагинация по курсору (keyset). Значение - кортеж (курсор, limit).
+    Сортировка берется из OrderingFilter родительского FilterSet и всегда дополняется
+    уникальным полем, курсор хранит значения ключей сортировки последней записи страницы.
+    Фильтр должен применяться после OrderingFilter"""
+
+    requires_parent = True
+
+    def __init__(
+        self,
+        model: Type[BaseClass],
+        field: str = "id",
+        *,
+        ordering_filter: str = "order",
+    ) -> None:
+        """
+        :param model: Модель для фильтрации
+        :param field: Уникальное поле модели, устраняющее неоднозначность сортировки
+        :param ordering_filter: Название OrderingFilter в родительском FilterSet
+        """
+        super().__init__()
+        self.model = model
+        self.field = field
+        self.ordering_filter = ordering_filter
+
+    def filter(self, query: Select, value: Any) -> Select:
+        if value in EMPTY_VALUES:
+            return query
+
+        cursor, limit = value
+        columns = self.get_sort_columns()
+        query = self.order_query(query, columns)
+        if cursor:
+            values = self.decode_cursor(cursor, [column for column, _ in columns])
+            query = query.where(self._after_cursor_expression(columns, values))
+        return query.limit(limit)
+
+    def get_sort_keys(self) -> list[tuple[Type[BaseClass] | None, Any, bool]]:
+        """Ключи сортировки в виде (модель, поле, обратный порядок)"""
+        from src.common.filters.filterset import BaseFilterSet
+
+        assert isinstance(self.parent, BaseFilterSet)
+
+        keys: list[tuple[Type[BaseClass] | None, Any, bool]] = []
+        ordering = self.parent.filters.get(self.ordering_filter)
+        for v in self.parent.params.get(self.ordering_filter) or []:
+            reverse = v.startswith("-")
+            v = v[1:] if reverse else v
+            if not isinstance(ordering, OrderingFilter) or v not in ordering.fields:
+                continue
+            model, field = ordering.fields[v]
+            keys.append((model, field, reverse))
+
+        if (self.model, self.field) not in [(model, field) for model, field, _ in keys]:
+            keys.append((self.model, self.field, False))
+        return keys
+
+    def get_sort_columns(self) -> list[tuple[Any, bool]]:
+        """Колонки сортировки в виде (колонка, обратный порядок)"""
+        return [
+            (self._get_column(model, field), reverse)
+            for model, field, reverse in self.get_sort_keys()
+        ]
+
+    def order_query(
+        self, query: Select, columns: Sequence[tuple[Any, bool]] | None = None
+    ) -> Select:
+        """Сортировка запроса по ключам курсора, дополненным уникальным полем"""
+        columns = columns if columns is not None else self.get_sort_columns()
+
+        def order(column: Any, reverse: bool) -> ColumnElement:
+            if not self._is_nullable(column):
+                return sa.desc(column) if reverse else sa.asc(column)
+            # Порядок NULL по умолчанию в PostgreSQL, на нем основано условие курсора
+            return sa.desc(column).nulls_first() if reverse else sa.asc(column).nulls_last()
+
+        return query.order_by(None).order_by(
+            *[order(column, reverse) for column, reverse in columns]
+        )
+
+    def encode_cursor(self, obj: Any) -> str | None:
+        """Курсор для записи. None, если ключи сортировки нельзя получить из записи"""
+        values = []
+        for model, field, _ in self.get_sort_keys():
+            if model is None or not isinstance(field, str) or not isinstance(obj, model):
+                return None
+            value = getattr(obj, field)
+            if value is not None and not isinstance(value, (bool, int, float, str)):
+                value = value.value if isinstance(value, Enum) else str(value)
+            values.append(value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str, columns: Sequence[Any]) -> list[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise InvalidCursorException
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursorException
+
+        parsed = []
+        for column, value in zip(columns, values):
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = Any
+            try:
+                parsed.append(None if value is None else parse_obj_as(python_type, value))
+            except ValidationError:
+                raise InvalidCursorException
+        return parsed
+
+    @staticmethod
+    def _get_column(model: Type[BaseClass] | None, field: Any) -> Any:
+        return getattr(model, field) if model and isinstance(field, str) else field
+
+    @staticmethod
+    def _is_nullable(column: Any) -> bool:
+        return getattr(getattr(column, "expression", column), "nullable", True)
+
+    @classmethod
+    def _after_cursor_expression(
+        cls, columns: Sequence[tuple[Any, bool]], values: Sequence[Any]
+    ) -> ColumnElement:
+        directions = {reverse for _, reverse in columns}
+        nullable = any(cls._is_nullable(column) for column, _ in columns)
+        if len(directions) == 1 and not nullable and None not in values:
+            # Сравнение кортежей может использовать составной индекс
+            row = sa.tuple_(*[column for column, _ in columns])
+            return row < sa.tuple_(*values) if directions.pop() else row > sa.tuple_(*values)
+
+        # В PostgreSQL NULL больше любого значения: в конце при ASC и в начале при DESC
+        def after(column: Any, value: Any, reverse: bool) -> ColumnElement:
+            if value is None:
+                return column.is_not(None) if reverse else sa.false()
+            if reverse:
+                return column < value
+            if not cls._is_nullable(column):
+                return column > value
+            return sa.or_(column > value, column.is_(None))
+
+        def equal(column: Any, value: Any) -> ColumnElement:
+            return column.is_(None) if value is None else column == value
+
+        expressions = []
+        for i, ((column, reverse), value) in enumerate(zip(columns, values)):
+            previous = [equal(c, v) for (c, _), v in zip(columns[:i], values[:i])]
+            expressions.append(sa.and_(*previous, after(column, value, reverse)))
+        return sa.or_(*expressions)
+
+
 class MethodFilter(BaseFilter):
     """Фильтр с возможностью задать методы: фильтрации, получения спеков и фасетов в
     родительском FilterSet"""
 
+    requires_parent = True
+    supports_columns_criteria = False
+
     def __init__(
         self,
         method: str,
@@ -805,13 +1049,13 @@ class MethodFilter(BaseFilter):
 
         return await self._facets(session, query)
 
-    def specs_columns(self) -> Any:
-        assert self._specs_columns
+    def specs_columns(self, criteria: ColumnElement | None = None) -> Any:
+        assert self._specs_columns and criteria is None
 
         return self._specs_columns()
 
-    def facets_columns(self) -> Any:
-        assert self._facets_columns
+    def facets_columns(self, criteria: ColumnElement | None = None) -> Any:
+        assert self._facets_columns and criteria is None
 
         return self._facets_columns()
 
@@ -833,6 +1077,10 @@ class ChangedWithRelatedFilter(Filter):
         super().__init__(model=model, field=field)
         self.relation_fields = relation_fields
 
+    def criteria(self, value: Any) -> ColumnElement | None:
+        # Условие требует join связанных моделей
+        return None
+
     def filter(self, query: Select, value: Any) -> Select:
         if value in EMPTY_VALUES:
             return query
@@ -1,7 +1,9 @@
 import abc
 import copy
+import json
 from collections import OrderedDict
-from typing import Any, Callable, Mapping, Sequence
+from functools import partial
+from typing import Any, Awaitable, Callable, Collection, Mapping, Sequence, TypeVar
 
 import sqlalchemy as sa
 from sqlalchemy.engine import Result, Row
@@ -9,12 +11,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Bundle
 from sqlalchemy.sql import ColumnElement, Select
 
-from src.common.filters.filters import BaseFilter, OrderingFilter
+from src.common.database.db import ParallelSessionFactory
+from src.common.database.explain import Explain, ExplainSession
+from src.common.database.queries import selects_whole_table
+from src.common.filters.constants import EMPTY_VALUES
+from src.common.filters.enums import CountMode
+from src.common.filters.filters import (
+    BaseFilter,
+    KeysetPagination,
+    LimitOffsetPagination,
+    OrderingFilter,
+)
 from src.common.filters.interfaces import IFilterSet
 from src.common.utils.concurrency import gather_with_concurrency
 
 CHUNK_SIZE = 100
 
+_T = TypeVar("_T")
+
 
 class FilterSetMetaclass(type):
     """Метакласс для создания FilterSet"""
@@ -23,6 +37,9 @@ class FilterSetMetaclass(type):
         attrs["declared_filters"] = mcs.get_declared_filters(attrs)
         new_class = super().__new__(mcs, name, bases, attrs)
         new_class.base_filters = new_class.get_filters()
+        new_class.parent_bound_filters = tuple(
+            name for name, filter_ in new_class.base_filters.items() if filter_.requires_parent
+        )
 
         return new_class
 
@@ -45,6 +62,12 @@ class BaseFilterSet(IFilterSet):
     """Базовый FilterSet"""
 
     declared_filters: OrderedDict
+    base_filters: OrderedDict
+    parent_bound_filters: tuple[str, ...]
+    single_query_facets: bool = False
+    "Вычислять facets одним запросом с FILTER (WHERE ...) для каждого исключаемого фильтра"
+    estimate_count_threshold: int = 10000
+    "Оценка кол-ва меньше порога перепроверяется точным подсчетом"
 
     def __init__(
         self,
@@ -52,21 +75,25 @@ class BaseFilterSet(IFilterSet):
         session: AsyncSession,
         query: Select,
         enable_optimization: bool = True,
+        parallel_sessions: ParallelSessionFactory | None = None,
     ) -> None:
         """
         :param params: Словарь параметров для фильтрации
         :param session: Сессия базы данных
         :param query: Базовый запрос, на основе которого происходит фильтрация
         :param enable_optimization: Включает оптимизацию запросов при вычислении specs и facets
+        :param parallel_sessions: Фабрика отдельных сессий, в которых подзапросы specs и
+        facets выполняются параллельно. Без нее подзапросы выполняются по очереди в session
         """
         self.params = params
         self.__base_query = query
         self.session = session
-        # self.base_filters = self.get_filters()
-        self.filters = copy.deepcopy(self.base_filters)
+        self.parallel_sessions = parallel_sessions
+        # Фильтры общие для всех экземпляров, копируются только фильтры, которым нужен parent
+        self.filters = self.base_filters.copy()
         self._optimization_enabled = enable_optimization
-        for filter_ in self.filters.values():
-            filter_.parent = self
+        for name in self.parent_bound_filters:
+            self.filters[name] = self.base_filters[name].bind(self)
 
     def get_base_query(self) -> Select:
         return copy.copy(self.__base_query)
@@ -117,23 +144,83 @@ class BaseFilterSet(IFilterSet):
         filters.update(cls.declared_filters)
         return filters
 
-    def filter_query(self) -> Select:
-        """Построение запроса для фильтрации"""
+    @property
+    def active_filters(self) -> tuple[str, ...]:
+        """Названия фильтров с непустыми значениями в порядке объявления.
+        Определяют структуру запроса и ключ кэша скомпилированного SQL"""
+        return tuple(
+            name
+            for name in self.filters
+            if name in self.params and self.params[name] not in EMPTY_VALUES
+        )
+
+    def filter_query(self, exclude: Collection[str] = ()) -> Select:
+        """Построение запроса для фильтрации.
+        Фильтры применяются в порядке объявления, а не в порядке параметров, чтобы
+        одинаковый набор фильтров всегда давал одну структуру запроса и попадал в кэш
+        скомпилированных запросов SQLAlchemy
+        :param exclude: Фильтры, которые не нужно применять
+        """
         query = self.get_base_query()
-        for name, value in self.params.items():
-            if name not in self.filters:
+        for name, filter_ in self.filters.items():
+            if name not in self.params or name in exclude:
                 continue
-            query = self.filters[name].filter(query, value)
+            query = filter_.filter(query, self.params[name])
         return query
 
     async def filter(self) -> Result:
         return await self.session.execute(self.filter_query())
 
+    @property
+    def pagination_filters(self) -> tuple[str, ...]:
+        """Названия фильтров пагинации (LimitOffsetPagination, KeysetPagination)"""
+        return tuple(
+            name
+            for name, filter_ in self.filters.items()
+            if isinstance(filter_, (LimitOffsetPagination, KeysetPagination))
+        )
+
+    @property
+    def keyset_pagination_active(self) -> bool:
+        """Задана ли пагинация по курсору в параметрах фильтрации"""
+        return any(
+            isinstance(filter_, KeysetPagination) and self.params.get(name) not in EMPTY_VALUES
+            for name, filter_ in self.filters.items()
+        )
+
+    @property
+    def cursor_fields(self) -> tuple[tuple[Any, str], ...]:
+        """Поля записей в виде (модель, поле), из которых строится курсор следующей страницы"""
+        for filter_ in self.filters.values():
+            if isinstance(filter_, KeysetPagination):
+                return tuple(
+                    (model, field)
+                    for model, field, _ in filter_.get_sort_keys()
+                    if model is not None and isinstance(field, str)
+                )
+        return ()
+
+    def cursor_ordering(self, query: Select) -> Select:
+        """Сортировка запроса по ключам курсора. Курсор, построенный по странице с offset,
+        продолжает ее без пропусков и повторов, только если сортировка страницы так же
+        дополнена уникальным полем"""
+        for filter_ in self.filters.values():
+            if isinstance(filter_, KeysetPagination):
+                return filter_.order_query(query)
+        return query
+
+    def next_cursor(self, last_obj: Any) -> str | None:
+        """Курсор следующей страницы после записи last_obj"""
+        for filter_ in self.filters.values():
+            if isinstance(filter_, KeysetPagination):
+                return filter_.encode_cursor(last_obj)
+        return None
+
     async def specs(self, excluded_filters: list[str] | None = None) -> dict[str, Any]:
         """Получения specs для данного FilterSet"""
         tasks: list = []
         fields: list = []
-        query = self.filter_query()
+        query = self.filter_query(exclude=self.pagination_filters)
         if self.optimization_enabled:
             tasks.append(self._get_specs_common_columns(excluded_filters))
             query = query.order_by(None)
@@ -144,11 +231,11 @@ class BaseFilterSet(IFilterSet):
             if (
                 self.optimization_enabled
                 and _filter.has_specs_columns
-                and filter_name not in self.params
+                and (filter_name not in self.params or self.single_query_facets)
             ):
                 continue
             if _filter.has_specs:
-                tasks.append(_filter.specs(self.session, query))
+                tasks.append(self._execute_in_session(partial(_filter.specs, query=query)))
                 fields.append(filter_name)
 
         tasks_result = await gather_with_concurrency(CHUNK_SIZE, *tasks)
@@ -158,6 +245,9 @@ class BaseFilterSet(IFilterSet):
 
     async def facets(self, excluded_filters: list[str] | None = None) -> dict[str, Any]:
         """Получения фасетов для данного FilterSet"""
+        if self.single_query_facets and self.optimization_enabled:
+            return await self._get_facets_single_query(excluded_filters)
+
         tasks: list = []
         fields: list = []
 
@@ -176,11 +266,11 @@ class BaseFilterSet(IFilterSet):
             if _filter.has_facets:
                 backup_filters = self.params.copy()
                 self.params.pop(filter_name, None)
-                query = self.filter_query()
+                query = self.filter_query(exclude=self.pagination_filters)
                 if self.optimization_enabled:
                     query = query.order_by(None)
 
-                tasks.append(_filter.facets(self.session, query))
+                tasks.append(self._execute_in_session(partial(_filter.facets, query=query)))
                 fields.append(filter_name)
 
                 self.params = backup_filters
@@ -191,19 +281,74 @@ class BaseFilterSet(IFilterSet):
         return result
 
     async def count(
-        self, attr_name: str = "id", distinct: bool = False, exclude_pagination: bool = True
+        self,
+        attr_name: str = "id",
+        distinct: bool = False,
+        exclude_pagination: bool = True,
+        mode: CountMode = CountMode.EXACT,
     ) -> int:
-        """Получения кол-ва результатов для данного FilterSet"""
-        base_query = self.filter_query().order_by(None)
-        if exclude_pagination:
-            base_query = base_query.limit(None).offset(None)
+        """Получения кол-ва результатов для данного FilterSet
+        :param mode: exact - точный подсчет, estimate - оценка по статистике PostgreSQL.
+        Если оценка меньше estimate_count_threshold, выполняется точный подсчет
+        """
+        exclude = self.pagination_filters if exclude_pagination else ()
+        base_query = self.filter_query(exclude=exclude).order_by(None)
+        if mode == CountMode.ESTIMATE and not distinct:
+            estimate = await self._estimate_count(base_query)
+            if estimate is not None and estimate >= self.estimate_count_threshold:
+                return estimate
         subquery = base_query.alias("s")
         attr = getattr(subquery.c, attr_name)
         if distinct:
             attr = sa.distinct(attr)
-        query = sa.select([sa.func.count(attr)])
+        query = sa.select(sa.func.count(attr))
         return (await self.session.execute(query)).scalar()  # type: ignore
 
+    async def explain(
+        self, analyze: bool = False, buffers: bool = False
+    ) -> dict[str, list[dict[str, Any]]]:
+        """SQL и планы запросов, выполняемых filter, count, specs и facets.
+        Запросы выполняются по очереди в session, без параллельных сессий
+        :param analyze: Использовать EXPLAIN ANALYZE, запросы выполняются дважды
+        :param buffers: Статистика использования буферов, только вместе с analyze
+        """
+        session, parallel_sessions = self.session, self.parallel_sessions
+        explain_session = ExplainSession(session, analyze=analyze, buffers=buffers)
+        self.session, self.parallel_sessions = explain_session, None  # type: ignore
+        result: dict[str, list[dict[str, Any]]] = {}
+        try:
+            for name, run in (
+                ("filter", self.filter),
+                ("count", self.count),
+                ("specs", self.specs),
+                ("facets", self.facets),
+            ):
+                await run()
+                result[name] = explain_session.pop_plans()
+        finally:
+            self.session, self.parallel_sessions = session, parallel_sessions
+        return result
+
+    async def _estimate_count(self, query: Select) -> int | None:
+        """Оценка кол-ва строк: pg_class.reltuples для запроса без фильтров, иначе
+        оценка планировщика из EXPLAIN. None, если статистика таблицы еще не собрана"""
+        if selects_whole_table(query):
+            (table,) = query.get_final_froms()
+            pg_class = sa.table(
+                "pg_class", sa.column("oid"), sa.column("reltuples"), schema="pg_catalog"
+            )
+            reltuples_query = sa.select(pg_class.c.reltuples).where(
+                pg_class.c.oid == sa.func.to_regclass(table.fullname)
+            )
+            reltuples = (await self.session.execute(reltuples_query)).scalar()
+            # -1 - таблица еще не анализировалась
+            return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+        plan = (await self.session.execute(Explain(query))).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def _get_specs_common_columns(
         self, excluded_filters: list[str] | None = None
     ) -> dict[str, Any]:
@@ -214,7 +359,9 @@ class BaseFilterSet(IFilterSet):
         for filter_name, _filter in self.filters.items():
             if excluded_filters is not None and filter_name in excluded_filters:
                 continue
-            if _filter.has_specs_columns and filter_name not in self.params.keys():
+            if _filter.has_specs_columns and (
+                filter_name not in self.params.keys() or self.single_query_facets
+            ):
                 columns, parse = _filter.specs_columns()
                 query_columns.append(columns)
                 field_name_to_parser.update({filter_name: parse})
@@ -243,10 +390,82 @@ class BaseFilterSet(IFilterSet):
         results = await self._fetch_common_columns(query_columns)
         return self._parse_common_columns(results, field_name_to_parser)
 
-    async def _fetch_common_columns(self, columns: Sequence[Bundle | ColumnElement]) -> Row:
-        query = self.filter_query()
-        query = query.with_only_columns(columns).order_by(None)
-        return (await self.session.execute(query)).one()
+    async def _get_facets_single_query(
+        self, excluded_filters: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Получение facets одним запросом. Условия активных фильтров переносятся из WHERE
+        в FILTER (WHERE ...) агрегатов: фасет каждого фильтра считается по условиям всех
+        остальных. Фильтры, условия которых нельзя выделить (MethodFilter, фильтры с join),
+        применяются в WHERE, а их собственные фасеты считаются отдельными запросами"""
+        criteria: OrderedDict[str, ColumnElement] = OrderedDict()
+        for filter_name in self.active_filters:
+            filter_criteria = self._extract_criteria(filter_name)
+            if filter_criteria is not None:
+                criteria[filter_name] = filter_criteria
+
+        def criteria_without(*names: str) -> ColumnElement | None:
+            conditions = [c for name, c in criteria.items() if name not in names]
+            return sa.and_(*conditions) if conditions else None
+
+        count = sa.func.count()
+        if criteria:
+            count = count.filter(criteria_without())
+        query_columns: list[Bundle | ColumnElement] = [count.label("count")]
+        field_name_to_parser: OrderedDict[str, Callable] = OrderedDict({"count": lambda val: val})
+        tasks: list = []
+        fields: list = []
+
+        for filter_name, _filter in self.filters.items():
+            if excluded_filters is not None and filter_name in excluded_filters:
+                continue
+            applied_in_where = filter_name in self.active_filters and filter_name not in criteria
+            filter_criteria = criteria_without(filter_name)
+            if (
+                _filter.has_facets_columns
+                and not applied_in_where
+                and (_filter.supports_columns_criteria or filter_criteria is None)
+            ):
+                columns, parse = _filter.facets_columns(filter_criteria)
+                query_columns.append(columns)
+                field_name_to_parser[filter_name] = parse
+            elif _filter.has_facets:
+                exclude = [filter_name, *self.pagination_filters]
+                query = self.filter_query(exclude=exclude).order_by(None)
+                tasks.append(self._execute_in_session(partial(_filter.facets, query=query)))
+                fields.append(filter_name)
+
+        common_query = self.filter_query(exclude=[*criteria, *self.pagination_filters])
+        if len(criteria) > 1:
+            # Строки, не прошедшие больше одного фильтра, не попадают ни в один фасет
+            common_query = common_query.where(sa.or_(*[criteria_without(n) for n in criteria]))
+        common = self._fetch_common_columns(query_columns, common_query)
+        tasks_result = await gather_with_concurrency(CHUNK_SIZE, common, *tasks)
+        result = self._parse_common_columns(tasks_result.pop(0), field_name_to_parser)
+        result.update(dict(zip(fields, tasks_result)))
+        return result
+
+    def _extract_criteria(self, filter_name: str) -> ColumnElement | None:
+        """Условие WHERE активного фильтра. None, если фильтр меняет запрос иначе"""
+        return self.filters[filter_name].criteria(self.params[filter_name])
+
+    async def _fetch_common_columns(
+        self, columns: Sequence[Bundle | ColumnElement], query: Select | None = None
+    ) -> Row:
+        # Агрегаты считаются по всем результатам: с OFFSET запрос не вернул бы ни одной строки
+        query = query if query is not None else self.filter_query(exclude=self.pagination_filters)
+        query = query.with_only_columns(*columns).order_by(None).limit(None).offset(None)
+
+        async def fetch(session: AsyncSession) -> Row:
+            return (await session.execute(query)).one()
+
+        return await self._execute_in_session(fetch)
+
+    async def _execute_in_session(self, func: Callable[[AsyncSession], Awaitable[_T]]) -> _T:
+        """Выполнение подзапроса в отдельной сессии, если доступны параллельные сессии"""
+        if self.parallel_sessions is None:
+            return await func(self.session)
+        async with self.parallel_sessions.session() as session:
+            return await func(session)
 
     @staticmethod
     def _parse_common_columns(
@@ -0,0 +1,55 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.common.database.profiling import RequestQueryStats, request_query_stats
+
+logger = logging.getLogger(__name__)
+
+DB_STATEMENTS_HEADER = "X-DB-Statements"
+DB_TIME_HEADER = "X-DB-Time-Ms"
+DB_ROWS_HEADER = "X-DB-Rows"
+
+
+class QueryStatsMiddleware:
+    """Сбор статистики запросов к базе данных для каждого HTTP запроса.
+    Статистика передается в заголовках ответа и логируется после завершения запроса.
+    В заголовки попадают запросы, выполненные до начала отправки ответа"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = request_query_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[DB_STATEMENTS_HEADER] = str(stats.statements)
+                headers[DB_TIME_HEADER] = f"{stats.duration_ms:.1f}"
+                headers[DB_ROWS_HEADER] = str(stats.rows)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            request_query_stats.reset(token)
+            logger.info(
+                "%s %s: %d statements, %.1f ms, %d rows",
+                scope["method"],
+                scope["path"],
+                stats.statements,
+                stats.duration_ms,
+                stats.rows,
+                extra={
+                    "db_statements": stats.statements,
+                    "db_time_ms": stats.duration_ms,
+                    "db_rows": stats.rows,
+                },
+            )
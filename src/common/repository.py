@@ -1,15 +1,31 @@
 import copy
-from typing import Generic, Type, Sequence
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    NamedTuple,
+    Type,
+    Sequence,
+    TypeVar,
+)
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, inspect, insert, select, update
 from sqlalchemy.engine import Result
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import MANYTOONE, load_only
 from sqlalchemy.sql import Select
 
+from src.common.cache.query_result import QueryResultCache
+from src.common.database.db import ParallelSessionFactory
+from src.common.database.queries import selects_whole_table
 from src.common.dto import OrmModel
 from src.common.exceptions.repository_exceptions import NotFoundException
 from src.common.filters import FilterSet, Filter, InFilter, OrderingFilter, LimitOffsetPagination
+from src.common.filters.enums import CountMode
 from src.common.types.python_types import (
     FilterSchema,
     IdType,
@@ -18,11 +34,14 @@ from src.common.types.python_types import (
     FacetsSchema,
 )
 
+_T = TypeVar("_T")
+
 
 class AdminFilterSchema(OrmModel, Generic[IdType]):
     id: IdType | None
     ids: list[IdType] | None
     order: list[str] | None
+    cursor: tuple[str, int] | None
     pagination: tuple[int, int] | None
 
 
@@ -33,15 +52,36 @@ class AdminFilterSet(FilterSet):
     pagination: LimitOffsetPagination
 
 
+class ListPage(NamedTuple, Generic[ModelEntity]):
+    items: Sequence[ModelEntity]
+    total_count: int | None
+    "Общее кол-во по фильтрам. None при пагинации по курсору"
+    next_cursor: str | None = None
+    "Курсор следующей страницы, если страница заполнена целиком"
+
+
 class BaseRepo(Generic[ModelEntity, FilterSchema]):
     model: Type[ModelEntity]
     query: Select | None = None
     filter_set: Type[FilterSet] | None = None
     specs_schema: Type[SpecsSchema] | None = None
     facets_schema: Type[FacetsSchema] | None = None
+    cache_tables: tuple[str, ...] = ()
+    "Таблицы, от которых зависят specs и facets. Пустой кортеж - результаты не кэшируются"
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_session: AsyncSession | None = None,
+        parallel_sessions: ParallelSessionFactory | None = None,
+        result_cache: QueryResultCache | None = None,
+    ):
         self.session: AsyncSession = session
+        # Сессия для чтения (list, retrieve, count, specs, facets). Реплика в режиме uow.replica()
+        self.read_session: AsyncSession = read_session if read_session is not None else session
+        # Отдельные сессии для параллельных подзапросов specs и facets
+        self.parallel_sessions = parallel_sessions
+        self.result_cache = result_cache
 
     def get_query(self) -> Select:
         query = self.query if self.query is not None else select(self.model)
@@ -49,10 +89,10 @@ class BaseRepo(Generic[ModelEntity, FilterSchema]):
 
     async def filter(self, params: FilterSchema) -> Result:
         filter_set = self.filter_set(
-            params.dict(exclude_unset=True), self.session, self.get_query()
+            params.dict(exclude_unset=True), self.read_session, self.get_query()
         )
         filtered_query = filter_set.filter_query()
-        return await self.session.execute(filtered_query)
+        return await self.read_session.execute(filtered_query)
 
     async def first(self, params: FilterSchema) -> ModelEntity:
         filtered_query = await self.filter(params)
@@ -65,6 +105,61 @@ class BaseRepo(Generic[ModelEntity, FilterSchema]):
         except NoResultFound:
             raise NotFoundException
 
+    def get_load_only_options(self, fields: Sequence[str], filter_set: FilterSet) -> list[Any]:
+        """load_only для колонок модели из fields и полей курсора следующей страницы.
+        Пустой список, если в fields есть атрибуты не из модели (свойства и т.п.): они могут
+        зависеть от любых колонок"""
+        mapper = inspect(self.model)
+        if any(field not in mapper.attrs for field in fields):
+            return []
+        cursor_fields = [field for model, field in filter_set.cursor_fields if model is self.model]
+        columns = [
+            getattr(self.model, field)
+            for field in dict.fromkeys([*fields, *cursor_fields])
+            if field in mapper.column_attrs
+        ]
+        return [load_only(*columns)] if columns else []
+
+    @property
+    def supports_returning_update(self) -> bool:
+        """Изменение записи одним UPDATE ... RETURNING дает тот же результат, что и retrieve,
+        если базовый запрос выбирает модель без условий, join и опций загрузки"""
+        query = self.get_query()
+        descriptions = query.column_descriptions
+        return (
+            len(descriptions) == 1
+            and descriptions[0]["expr"] is self.model
+            and selects_whole_table(query)
+        )
+
+    @property
+    def supports_returning_delete(self) -> bool:
+        """DELETE без загрузки записи не выполняет каскады ORM (удаление связей
+        многие-ко-многим, обнуление внешних ключей), поэтому возможен только без таких связей"""
+        return self.supports_returning_update and all(
+            relationship.direction is MANYTOONE
+            for relationship in inspect(self.model).relationships
+        )
+
+    async def update_returning(self, object_id: Any, data: dict[str, Any]) -> ModelEntity:
+        """Изменение записи одним UPDATE ... RETURNING. NotFoundException, если записи нет"""
+        query = (
+            update(self.model)
+            .where(self.model.id == object_id)
+            .values(**data)
+            .returning(self.model)
+        )
+        entity = (await self.session.scalars(query)).one_or_none()
+        if entity is None:
+            raise NotFoundException
+        return entity
+
+    async def delete_returning(self, object_id: Any) -> None:
+        """Удаление записи одним DELETE ... RETURNING. NotFoundException, если записи нет"""
+        query = delete(self.model).where(self.model.id == object_id).returning(self.model.id)
+        if (await self.session.scalars(query)).one_or_none() is None:
+            raise NotFoundException
+
     def update(self, obj: ModelEntity, data: dict):
         for key, val in data.items():
             setattr(obj, key, val)
@@ -75,28 +170,171 @@ class BaseRepo(Generic[ModelEntity, FilterSchema]):
         filtered_query = await self.filter(params)
         return filtered_query.scalars().all()
 
+    async def list_with_count(
+        self,
+        params: FilterSchema,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Sequence[str] | None = None,
+    ) -> ListPage[ModelEntity]:
+        """Страница результатов и общее кол-во по фильтрам за один запрос (count(*) over ()).
+        При пагинации по курсору кол-во не считается: оно потребовало бы полного прохода.
+        В режиме estimate кол-во берется из статистики PostgreSQL отдельным запросом
+        :param fields: Атрибуты, которые нужны от записей. Остальные колонки не загружаются
+        """
+        filter_params = params.dict(exclude_unset=True)
+        filter_set = self.filter_set(filter_params, self.read_session, self.get_query())
+        query = filter_set.filter_query()
+        if query._limit is not None and not filter_set.keyset_pagination_active:  # type: ignore
+            # По заполненной странице возвращается курсор следующей
+            query = filter_set.cursor_ordering(query)
+        if fields:
+            query = query.options(*self.get_load_only_options(fields, filter_set))
+        items: Sequence[ModelEntity]
+        total_count: int | None = None
+        if filter_set.keyset_pagination_active:
+            items = (await self.read_session.execute(query)).scalars().all()
+        elif query._distinct or count_mode == CountMode.ESTIMATE:  # type: ignore
+            # Оконная функция считается до DISTINCT и требует полного прохода по результатам,
+            # поэтому кол-во получаем отдельно
+            items = (await self.read_session.execute(query)).scalars().all()
+            total_count = await self._count(filter_set, filter_params, count_mode)
+        else:
+            window_query = query.add_columns(func.count().over().label("total_count"))
+            rows = (await self.read_session.execute(window_query)).all()
+            items = [row[0] for row in rows]
+            if rows:
+                total_count = rows[0].total_count
+            else:
+                # Страница за пределами результатов: окно пустое, кол-во получаем отдельно
+                if query._offset:  # type: ignore
+                    total_count = await self._count(filter_set, filter_params, CountMode.EXACT)
+                else:
+                    total_count = 0
+
+        limit = query._limit  # type: ignore
+        next_cursor = filter_set.next_cursor(items[-1]) if limit and len(items) >= limit else None
+        return ListPage(items, total_count, next_cursor)
+
+    async def bulk_create(self, values: Sequence[dict[str, Any]]) -> Sequence[Any]:
+        """Создание записей одним INSERT. Возвращает id в порядке values"""
+        query = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        return (await self.session.scalars(query, values)).all()
+
+    async def bulk_update(self, values: Sequence[dict[str, Any]]) -> Sequence[Any]:
+        """Обновление записей по первичному ключу, каждый словарь содержит id. Записи с
+        одинаковым набором полей обновляются одним executemany. Возвращает id"""
+        # Записи без изменяемых полей не участвуют в UPDATE
+        changed_values = [value for value in values if len(value) > 1]
+        if changed_values:
+            await self.session.execute(update(self.model), changed_values)
+        return [value["id"] for value in values]
+
+    async def bulk_delete(self, ids: Sequence[Any]) -> Sequence[Any]:
+        """Удаление записей одним DELETE. Возвращает id удаленных записей.
+        Каскады ORM не выполняются, см. supports_returning_delete"""
+        query = delete(self.model).where(self.model.id.in_(ids)).returning(self.model.id)
+        return (await self.session.scalars(query)).all()
+
+    async def existing_ids(self, ids: Sequence[Any]) -> set[Any]:
+        query = select(self.model.id).where(self.model.id.in_(ids))
+        return set((await self.session.scalars(query)).all())
+
+    async def stream(
+        self, params: FilterSchema, batch_size: int = 1000
+    ) -> AsyncIterator[ModelEntity]:
+        """Все записи по фильтрам без пагинации через серверный курсор. В памяти
+        одновременно находится не больше batch_size записей"""
+        filter_set = self.filter_set(
+            params.dict(exclude_unset=True), self.read_session, self.get_query()
+        )
+        query = filter_set.filter_query(exclude=filter_set.pagination_filters)
+        result = await self.read_session.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for entity in result:
+            yield entity
+
     def add(self, entity: ModelEntity) -> None:
         self.session.add(entity)
 
     async def delete(self, entity: ModelEntity) -> None:
         await self.session.delete(entity)
 
+    async def delete_all(self, entities: Sequence[ModelEntity]) -> Sequence[Any]:
+        """Удаление загруженных записей через ORM с каскадами, как в delete. Возвращает id"""
+        for entity in entities:
+            await self.session.delete(entity)
+        await self.session.flush()
+        return [entity.id for entity in entities]  # type: ignore
+
     async def add_all(self, *entities: ModelEntity) -> None:
         self.session.add_all([*entities])
 
-    async def count(self, params: FilterSchema) -> int:
-        query = self.get_query()
-        filter_set = self.filter_set(params.dict(exclude_unset=True), self.session, query)
-        return await filter_set.count()
+    async def count(self, params: FilterSchema, mode: CountMode = CountMode.EXACT) -> int:
+        filter_params = params.dict(exclude_unset=True)
+        filter_set = self.filter_set(filter_params, self.read_session, self.get_query())
+        return await self._count(filter_set, filter_params, mode)
 
     async def specs(self, params: FilterSchema, excluded_filters: None = None) -> SpecsSchema:
-        query = self.get_query()
-        filter_set = self.filter_set(params.dict(exclude_unset=True), self.session, query)
-        specs = await filter_set.specs(excluded_filters=excluded_filters)
+        filter_params = params.dict(exclude_unset=True)
+
+        async def get_specs() -> dict[str, Any]:
+            filter_set = self.filter_set(
+                filter_params,
+                self.read_session,
+                self.get_query(),
+                parallel_sessions=self.parallel_sessions,
+            )
+            return await filter_set.specs(excluded_filters=excluded_filters)
+
+        specs = await self._cached("specs", filter_params, excluded_filters, get_specs)
         return self.specs_schema(**specs)
 
     async def facets(self, params: FilterSchema, excluded_filters: None = None) -> FacetsSchema:
-        query = self.get_query()
-        filter_set = self.filter_set(params.dict(exclude_unset=True), self.session, query)
-        facets = await filter_set.facets(excluded_filters=excluded_filters)
+        filter_params = params.dict(exclude_unset=True)
+
+        async def get_facets() -> dict[str, Any]:
+            filter_set = self.filter_set(
+                filter_params,
+                self.read_session,
+                self.get_query(),
+                parallel_sessions=self.parallel_sessions,
+            )
+            return await filter_set.facets(excluded_filters=excluded_filters)
+
+        facets = await self._cached("facets", filter_params, excluded_filters, get_facets)
         return self.facets_schema(**facets)
+
+    async def explain(
+        self, params: FilterSchema, analyze: bool = False, buffers: bool = False
+    ) -> dict[str, Sequence[dict[str, Any]]]:
+        """SQL и планы запросов filter, count, specs и facets для параметров фильтрации"""
+        filter_set = self.filter_set(
+            params.dict(exclude_unset=True), self.read_session, self.get_query()
+        )
+        return await filter_set.explain(analyze=analyze, buffers=buffers)
+
+    async def _count(self, filter_set: FilterSet, params: dict[str, Any], mode: CountMode) -> int:
+        """Кол-во по фильтрам. Не зависит от сортировки и пагинации, поэтому они не входят
+        в ключ кэша"""
+        ignored = {
+            *filter_set.pagination_filters,
+            *(name for name, f in filter_set.filters.items() if isinstance(f, OrderingFilter)),
+        }
+        count_params = {key: value for key, value in params.items() if key not in ignored}
+        count = partial(filter_set.count, mode=mode)
+        return await self._cached(f"count_{mode.value}", count_params, None, count)
+
+    async def _cached(
+        self,
+        method: str,
+        params: dict[str, Any],
+        excluded_filters: Sequence[str] | None,
+        func: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        if self.result_cache is None or not self.cache_tables:
+            return await func()
+
+        namespace = f"{type(self).__name__}.{method}"
+        cache_params = {**params, "__excluded_filters": sorted(excluded_filters or [])}
+        return await self.result_cache.get_or_set(namespace, self.cache_tables, cache_params, func)
@@ -1,17 +1,57 @@
 from types import TracebackType
-from typing import Type
+from typing import Any, Type
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
+from src.common.cache.query_result import QueryResultCache
+from src.common.database.changes import mark_changed, pop_changed_tables
+from src.common.database.db import ParallelSessionFactory
 from src.common.repository import ModelEntity
 
 
 class BaseUnitOfWork:
-    def __init__(self, scoped_session: AsyncSession):
+    def __init__(
+        self,
+        scoped_session: AsyncSession,
+        replica_scoped_session: AsyncSession | None = None,
+        parallel_sessions: ParallelSessionFactory | None = None,
+        result_cache: QueryResultCache | None = None,
+    ):
         self.scoped_session = scoped_session
+        self.replica_scoped_session = replica_scoped_session
+        self.parallel_sessions = parallel_sessions
+        self.result_cache = result_cache
+        self.use_replica = False
+
+    def replica(self) -> "BaseUnitOfWork":
+        """Чтение через репозитории выполняется на реплике, если она настроена.
+        Запись и commit остаются на основной базе данных, независимые запросы specs и
+        facets выполняются в параллельных сессиях, если они настроены.
+        Пример: async with self.uow.replica(): ..."""
+        self.use_replica = True
+        return self
 
     async def __aenter__(self) -> None:
         self.session: AsyncSession = self.scoped_session
+        self.read_session: AsyncSession = (
+            self.replica_scoped_session
+            if self.use_replica and self.replica_scoped_session is not None
+            else self.session
+        )
+        # Отдельные сессии не видят незафиксированных изменений, поэтому только для чтения
+        self.read_parallel_sessions: ParallelSessionFactory | None = (
+            self.parallel_sessions if self.use_replica else None
+        )
+
+    @property
+    def repository_kwargs(self) -> dict[str, Any]:
+        """Аргументы для создания репозиториев"""
+        return {
+            "session": self.session,
+            "read_session": self.read_session,
+            "parallel_sessions": self.read_parallel_sessions,
+            "result_cache": self.result_cache,
+        }
 
     async def __aexit__(
         self,
@@ -19,13 +59,30 @@ class BaseUnitOfWork:
         exc_v: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        pop_changed_tables(self.session)  # type: ignore
         await self.session.close()
+        if self.read_session is not self.session:
+            await self.read_session.close()
+        self.use_replica = False
 
     async def commit(self) -> None:
         await self.session.commit()
+        # Таблицы собираются и при flush внутри commit, поэтому читаются после него
+        changed_tables = pop_changed_tables(self.session)  # type: ignore
+        if self.result_cache is not None and changed_tables:
+            await self.result_cache.invalidate(*changed_tables)
 
     async def rollback(self) -> None:
         await self.session.rollback()
+        pop_changed_tables(self.session)  # type: ignore
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """Вложенная транзакция (SAVEPOINT). Пример: async with self.uow.savepoint(): ..."""
+        return self.session.begin_nested()
+
+    def mark_changed(self, *tables: str) -> None:
+        """Отметка таблиц, измененных запросами вне ORM, для инвалидации кэша при commit"""
+        mark_changed(self.session, *tables)  # type: ignore
 
     async def refresh(self, obj: ModelEntity) -> None:
         await self.session.refresh(obj)
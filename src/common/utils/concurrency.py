@@ -1,6 +1,9 @@
 import asyncio
+import logging
 from asyncio import Future
-from typing import Awaitable, TypeVar, Union
+from typing import Any, Awaitable, Callable, TypeVar, Union
+
+logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 _FutureT = Union[Future[_T], Awaitable[_T]]
@@ -22,3 +25,14 @@ async def gather_with_concurrency(limit: int, *tasks: _FutureT[_T]) -> list[_T]:
             return await task
 
     return await gather_with_safe_exceptions(*(sem_task(task) for task in tasks))
+
+
+async def run_periodically(interval: float, func: Callable[[], Awaitable[Any]]) -> None:
+    """Бесконечный запуск корутины с заданным интервалом. Ошибки логируются и не
+    прерывают цикл"""
+    while True:
+        try:
+            await func()
+        except Exception:
+            logger.exception("Periodic task %r failed", func)
+        await asyncio.sleep(interval)
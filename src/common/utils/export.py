@@ -0,0 +1,47 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Sequence
+
+
+async def iter_csv(
+    rows: AsyncIterator[dict[str, Any]], fields: Sequence[str], chunk_size: int = 500
+) -> AsyncIterator[str]:
+    """CSV с заголовком из fields. Строки отдаются блоками по chunk_size,
+    вложенные значения записываются в JSON"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    async for row in rows:
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in row.items()
+            }
+        )
+        count += 1
+        if count % chunk_size == 0:
+            yield _flush(buffer)
+    yield _flush(buffer)
+
+
+async def iter_ndjson(
+    rows: AsyncIterator[dict[str, Any]], chunk_size: int = 500
+) -> AsyncIterator[str]:
+    """JSON объект на строку. Строки отдаются блоками по chunk_size"""
+    lines: list[str] = []
+    async for row in rows:
+        lines.append(json.dumps(row, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _flush(buffer: io.StringIO) -> str:
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return value
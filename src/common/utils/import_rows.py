@@ -0,0 +1,66 @@
+import csv
+import json
+from itertools import count, islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+
+class RowParseError(ValueError):
+    """Файл не читается: неверная кодировка или формат CSV"""
+
+    def __init__(self, row: int, message: str) -> None:
+        """
+        :param row: Номер строки данных начиная с 1, на которой возникла ошибка
+        :param message: Описание ошибки
+        """
+        super().__init__(f"Row {row}: {message}")
+        self.row = row
+        self.message = message
+
+
+def iter_csv_rows(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Строки CSV с заголовком. Пустые значения не передаются, чтобы применялись значения
+    по умолчанию схемы. Некорректные кавычки и ошибки декодирования - RowParseError"""
+    for row in _raise_row_errors(csv.DictReader(lines, strict=True)):
+        yield {key: value for key, value in row.items() if key is not None and value != ""}
+
+
+def iter_ndjson_rows(lines: Iterable[str]) -> Iterator[Any]:
+    """Объекты NDJSON. Для строки, которая не разбирается, возвращается None"""
+    return _raise_row_errors(_parse_ndjson(lines))
+
+
+def _parse_ndjson(lines: Iterable[str]) -> Iterator[Any]:
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+def _raise_row_errors(rows: Iterable[_T]) -> Iterator[_T]:
+    """Ошибки чтения файла как RowParseError с номером строки данных"""
+    iterator = iter(rows)
+    for row_number in count(1):
+        try:
+            row = next(iterator)
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise RowParseError(row_number, str(e)) from e
+        yield row
+
+
+ROW_PARSERS: dict[str, Callable[[Iterable[str]], Iterator[Any]]] = {
+    "csv": iter_csv_rows,
+    "ndjson": iter_ndjson_rows,
+}
+
+
+def batched(iterable: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -14,6 +14,16 @@ class AppSettings(EnvBaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expires_minutes: int = 60
     refresh_token_expires_minutes: int = 60
+    stateless_access_tokens: bool = False
+    stateless_access_token_expires_minutes: int = 5
+    jwt_token_cache_maxsize: int = 10000
+    jwt_token_cache_ttl_seconds: int = 300
+    jwt_token_reaper_batch_size: int = 1000
+    jwt_token_reaper_interval_seconds: int = 0
+    password_hasher_executor: str = "thread"
+    password_hasher_max_workers: int = 4
+    query_result_cache_maxsize: int = 1000
+    query_result_cache_ttl_seconds: int = 60
 
     class Config:
         env_prefix = "app_"
@@ -27,6 +37,16 @@ class PostgresSettings(EnvBaseSettings):
     password: str = "postgres"
     db: str = "postgres"
     dsn: Optional[PostgresDsn] = None
+    replica_dsn: Optional[PostgresDsn] = None
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+    query_cache_size: int = 500
+    parallel_sessions_limit: int = 0
+    slow_query_threshold_ms: float = 500
 
     class Config:
         env_prefix = "postgres_"
@@ -19,7 +19,9 @@ class Container(containers.DeclarativeContainer):
     )
     gateways = providers.Container(Gateways, config=config)
     repositories = providers.Container(Repositories, gateways=gateways)
-    use_cases = providers.Container(UseCases, repositories=repositories, config=config)
+    use_cases = providers.Container(
+        UseCases, gateways=gateways, repositories=repositories, config=config
+    )
 
 
 container = Container()
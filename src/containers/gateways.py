@@ -1,8 +1,64 @@
 from dependency_injector import containers, providers
 
-from src.common.database.db import get_db_session
+from src.common.database.db import (
+    get_db_session,
+    get_parallel_session_factory,
+    get_replica_db_session,
+)
+from src.common.cache.memory import InMemoryCacheBackend
+from src.common.cache.query_result import QueryResultCache
+from src.common.database.profiling import QueryProfiler
+from src.common.database.stats import QueryCacheStats
+from src.domain.jwt_token.cache import JwtTokenStatusCache
+from src.domain.jwt_token.codec import JwtTokenCodec
+from src.utils.security import PasswordHasher
 
 
 class Gateways(containers.DeclarativeContainer):
     config = providers.Configuration()
-    db = providers.Singleton(get_db_session, config=config.database)
+    query_cache_stats = providers.Singleton(QueryCacheStats)
+    query_profiler = providers.Singleton(
+        QueryProfiler, slow_query_threshold_ms=config.database.slow_query_threshold_ms
+    )
+    db = providers.Singleton(
+        get_db_session,
+        config=config.database,
+        query_cache_stats=query_cache_stats,
+        query_profiler=query_profiler,
+    )
+    replica_db = providers.Singleton(
+        get_replica_db_session,
+        config=config.database,
+        query_cache_stats=query_cache_stats,
+        query_profiler=query_profiler,
+    )
+    parallel_sessions = providers.Singleton(
+        get_parallel_session_factory,
+        config=config.database,
+        scoped_session=db,
+        replica_scoped_session=replica_db,
+    )
+    jwt_token_status_cache = providers.Singleton(
+        JwtTokenStatusCache,
+        maxsize=config.app.jwt_token_cache_maxsize,
+        ttl=config.app.jwt_token_cache_ttl_seconds,
+    )
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        executor_type=config.app.password_hasher_executor,
+        max_workers=config.app.password_hasher_max_workers,
+    )
+    jwt_token_codec = providers.Singleton(
+        JwtTokenCodec,
+        secret_key=config.app.secret_key,
+        algorithm=config.app.jwt_algorithm,
+    )
+    query_result_cache = providers.Singleton(
+        QueryResultCache,
+        backend=providers.Singleton(
+            InMemoryCacheBackend,
+            maxsize=config.app.query_result_cache_maxsize,
+            ttl=config.app.query_result_cache_ttl_seconds,
+        ),
+        ttl=config.app.query_result_cache_ttl_seconds,
+    )
@@ -5,4 +5,10 @@ from src.data.uow import UnitOfWork
 
 class Repositories(containers.DeclarativeContainer):
     gateways = providers.DependenciesContainer()
-    uow = providers.Factory(UnitOfWork, scoped_session=gateways.db)
+    uow = providers.Factory(
+        UnitOfWork,
+        scoped_session=gateways.db,
+        replica_scoped_session=gateways.replica_db,
+        parallel_sessions=gateways.parallel_sessions,
+        result_cache=gateways.query_result_cache,
+    )
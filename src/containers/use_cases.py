@@ -3,6 +3,7 @@ from dependency_injector import containers, providers
 from src.domain.jwt_token.use_cases.add_jwt_tokens_to_blacklist import AddJwtTokensToBlacklist
 from src.domain.jwt_token.use_cases.create_jwt_tokens import CreateJwtTokens
 from src.domain.jwt_token.use_cases.decode_jwt_token import DecodeJwtToken
+from src.domain.jwt_token.use_cases.delete_expired_jwt_tokens import DeleteExpiredJwtTokens
 from src.domain.products.product_category.admin_use_cases.link_measure_category import (
     AdminLinkMeasureCategoryToProductCategory,
 )
@@ -10,27 +11,64 @@ from src.domain.products.product_category.admin_use_cases.link_product_modificat
     AdminProductModificationToProductCategory,
 )
 from src.domain.user.admin_use_cases.change_password import ChangePasswordAdmin
+from src.domain.user.admin_use_cases.create_user import CreateUserAdmin
 from src.domain.user.use_cases.authenticate import Authenticate
 from src.domain.user.use_cases.register import Register
 from src.domain.user.use_cases.retrieve_user import RetrieveUser
+from src.domain.user.use_cases.retrieve_user_by_jwt_token import RetrieveUserByJwtToken
 
 
 class UseCases(containers.DeclarativeContainer):
+    gateways = providers.DependenciesContainer()
     repositories = providers.DependenciesContainer()
     config = providers.Configuration()
 
-    register = providers.Factory(Register, uow=repositories.uow)
-    authenticate = providers.Factory(Authenticate, uow=repositories.uow)
-    create_jwt_tokens = providers.Factory(CreateJwtTokens, uow=repositories.uow, config=config.app)
-    decode_jwt_token = providers.Factory(DecodeJwtToken, uow=repositories.uow, config=config.app)
-    add_jwt_tokens_to_blacklist = providers.Factory(AddJwtTokensToBlacklist, uow=repositories.uow)
+    register = providers.Factory(
+        Register, uow=repositories.uow, password_hasher=gateways.password_hasher
+    )
+    authenticate = providers.Factory(
+        Authenticate, uow=repositories.uow, password_hasher=gateways.password_hasher
+    )
+    create_jwt_tokens = providers.Factory(
+        CreateJwtTokens,
+        uow=repositories.uow,
+        config=config.app,
+        token_codec=gateways.jwt_token_codec,
+    )
+    decode_jwt_token = providers.Factory(
+        DecodeJwtToken,
+        uow=repositories.uow,
+        config=config.app,
+        token_cache=gateways.jwt_token_status_cache,
+        token_codec=gateways.jwt_token_codec,
+    )
+    add_jwt_tokens_to_blacklist = providers.Factory(
+        AddJwtTokensToBlacklist,
+        uow=repositories.uow,
+        config=config.app,
+        token_cache=gateways.jwt_token_status_cache,
+    )
+    delete_expired_jwt_tokens = providers.Factory(
+        DeleteExpiredJwtTokens, uow=repositories.uow, config=config.app
+    )
     retrieve_user = providers.Factory(RetrieveUser, uow=repositories.uow)
+    retrieve_user_by_jwt_token = providers.Factory(
+        RetrieveUserByJwtToken,
+        uow=repositories.uow,
+        decode_jwt_token=decode_jwt_token,
+        token_cache=gateways.jwt_token_status_cache,
+    )
 
     # Admin extra action use cases
-    change_password_admin = providers.Factory(ChangePasswordAdmin, uow=repositories.uow)
+    change_password_admin = providers.Factory(
+        ChangePasswordAdmin, uow=repositories.uow, password_hasher=gateways.password_hasher
+    )
     link_measure_category_to_product_category = providers.Factory(
         AdminLinkMeasureCategoryToProductCategory, uow=repositories.uow
     )
     link_product_modification_to_product_category = providers.Factory(
         AdminProductModificationToProductCategory, uow=repositories.uow
     )
+
+    # Admin CRUD use cases
+    create_user_admin = providers.Factory(CreateUserAdmin, password_hasher=gateways.password_hasher)
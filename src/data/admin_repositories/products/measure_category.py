@@ -1,6 +1,15 @@
 from sqlalchemy import select, Select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter, MethodFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    MethodFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import MeasureCategory, ProductCategoryMeasureCategory
 from src.domain.products.measure_category.dto.admin import MeasureCategoryAdminFilterSchema
@@ -8,8 +17,17 @@ from src.domain.products.measure_category.dto.admin import MeasureCategoryAdminF
 
 class MeasureCategoryAdminFilterSet(FilterSet):
     id = Filter(MeasureCategory, "id")
-    name = ILikeFilter(MeasureCategory, "name")
+    ids = InFilter(MeasureCategory, "id")
+    name = TrigramILikeFilter(MeasureCategory, "name")
     product_categories = MethodFilter("filter_product_categories")
+    order = OrderingFilter(
+        {
+            "id": (MeasureCategory, "id"),
+            "name": (MeasureCategory, "name"),
+        }
+    )
+    cursor = KeysetPagination(MeasureCategory)
+    pagination = LimitOffsetPagination()
 
     def filter_product_categories(self, query: Select, values: list[int]) -> Select:
         return query.join(ProductCategoryMeasureCategory).filter(
@@ -21,3 +39,7 @@ class MeasureCategoryAdminRepo(BaseRepo[MeasureCategory, MeasureCategoryAdminFil
     model = MeasureCategory
     query = select(MeasureCategory)
     filter_set = MeasureCategoryAdminFilterSet
+    cache_tables = (
+        MeasureCategory.__tablename__,
+        ProductCategoryMeasureCategory.__tablename__,
+    )
@@ -1,6 +1,14 @@
 from sqlalchemy import select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import MeasureValue
 from src.domain.products.measure_value.dto.admin import MeasureValueAdminFilterSchema
@@ -8,11 +16,22 @@ from src.domain.products.measure_value.dto.admin import MeasureValueAdminFilterS
 
 class MeasureValueAdminFilterSet(FilterSet):
     id = Filter(MeasureValue, "id")
-    name = ILikeFilter(MeasureValue, "name")
+    ids = InFilter(MeasureValue, "id")
+    name = TrigramILikeFilter(MeasureValue, "name")
     category_id = Filter(MeasureValue, "category_id")
+    order = OrderingFilter(
+        {
+            "id": (MeasureValue, "id"),
+            "name": (MeasureValue, "name"),
+            "category_id": (MeasureValue, "category_id"),
+        }
+    )
+    cursor = KeysetPagination(MeasureValue)
+    pagination = LimitOffsetPagination()
 
 
 class MeasureValueAdminRepo(BaseRepo[MeasureValue, MeasureValueAdminFilterSchema]):
     model = MeasureValue
     query = select(MeasureValue)
     filter_set = MeasureValueAdminFilterSet
+    cache_tables = (MeasureValue.__tablename__,)
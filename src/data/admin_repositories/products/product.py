@@ -1,19 +1,43 @@
 from sqlalchemy import select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter, NumberFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    NumberFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import Product
 from src.domain.products.product.dto.admin import ProductAdminFilterSchema
 
 
 class ProductAdminFilterSet(FilterSet):
+    single_query_facets = True
+
     id = Filter(Product, "id")
-    name = ILikeFilter(Product, "name")
+    ids = InFilter(Product, "id")
+    name = TrigramILikeFilter(Product, "name")
     base_price = NumberFilter(Product, "base_price")
     product_category_id = Filter(Product, "product_category_id")
+    order = OrderingFilter(
+        {
+            "id": (Product, "id"),
+            "name": (Product, "name"),
+            "base_price": (Product, "base_price"),
+            "price_multiplier": (Product, "price_multiplier"),
+            "product_category_id": (Product, "product_category_id"),
+        }
+    )
+    cursor = KeysetPagination(Product)
+    pagination = LimitOffsetPagination()
 
 
 class ProductAdminRepo(BaseRepo[Product, ProductAdminFilterSchema]):
     model = Product
     query = select(Product)
     filter_set = ProductAdminFilterSet
+    cache_tables = (Product.__tablename__,)
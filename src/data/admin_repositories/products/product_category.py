@@ -1,6 +1,14 @@
 from sqlalchemy import select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import ProductCategory
 from src.domain.products.product_category.dto.admin import ProductCategoryAdminFilterSchema
@@ -8,10 +16,20 @@ from src.domain.products.product_category.dto.admin import ProductCategoryAdminF
 
 class ProductCategoryAdminFilterSet(FilterSet):
     id = Filter(ProductCategory, "id")
-    name = ILikeFilter(ProductCategory, "name")
+    ids = InFilter(ProductCategory, "id")
+    name = TrigramILikeFilter(ProductCategory, "name")
+    order = OrderingFilter(
+        {
+            "id": (ProductCategory, "id"),
+            "name": (ProductCategory, "name"),
+        }
+    )
+    cursor = KeysetPagination(ProductCategory)
+    pagination = LimitOffsetPagination()
 
 
 class ProductCategoryAdminRepo(BaseRepo[ProductCategory, ProductCategoryAdminFilterSchema]):
     model = ProductCategory
     query = select(ProductCategory)
     filter_set = ProductCategoryAdminFilterSet
+    cache_tables = (ProductCategory.__tablename__,)
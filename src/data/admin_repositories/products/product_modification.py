@@ -1,6 +1,15 @@
 from sqlalchemy import select, Select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter, MethodFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    MethodFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import ProductModification, ProductCategoryModification
 from src.domain.products.product_modification.dto.admin import ProductModificationAdminFilterSchema
@@ -8,8 +17,17 @@ from src.domain.products.product_modification.dto.admin import ProductModificati
 
 class ProductModificationAdminFilterSet(FilterSet):
     id = Filter(ProductModification, "id")
-    name = ILikeFilter(ProductModification, "name")
+    ids = InFilter(ProductModification, "id")
+    name = TrigramILikeFilter(ProductModification, "name")
     product_categories = MethodFilter("filter_product_categories")
+    order = OrderingFilter(
+        {
+            "id": (ProductModification, "id"),
+            "name": (ProductModification, "name"),
+        }
+    )
+    cursor = KeysetPagination(ProductModification)
+    pagination = LimitOffsetPagination()
 
     def filter_product_categories(self, query: Select, values: list[int]) -> Select:
         return query.join(ProductCategoryModification).filter(
@@ -23,3 +41,7 @@ class ProductModificationAdminRepo(
     model = ProductModification
     query = select(ProductModification)
     filter_set = ProductModificationAdminFilterSet
+    cache_tables = (
+        ProductModification.__tablename__,
+        ProductCategoryModification.__tablename__,
+    )
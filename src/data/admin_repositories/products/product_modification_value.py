@@ -1,6 +1,15 @@
 from sqlalchemy import select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter, RangeFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    RangeFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.product import ProductModificationValue
 from src.domain.products.product_modification.dto.admin import ProductModificationAdminFilterSchema
@@ -8,9 +17,20 @@ from src.domain.products.product_modification.dto.admin import ProductModificati
 
 class ProductModificationValueAdminFilterSet(FilterSet):
     id = Filter(ProductModificationValue, "id")
-    name = ILikeFilter(ProductModificationValue, "name")
+    ids = InFilter(ProductModificationValue, "id")
+    name = TrigramILikeFilter(ProductModificationValue, "name")
     price = RangeFilter(ProductModificationValue, "price")
     modification_id = Filter(ProductModificationValue, "modification_id")
+    order = OrderingFilter(
+        {
+            "id": (ProductModificationValue, "id"),
+            "name": (ProductModificationValue, "name"),
+            "price": (ProductModificationValue, "price"),
+            "modification_id": (ProductModificationValue, "modification_id"),
+        }
+    )
+    cursor = KeysetPagination(ProductModificationValue)
+    pagination = LimitOffsetPagination()
 
 
 class ProductModificationValueAdminRepo(
@@ -19,3 +39,4 @@ class ProductModificationValueAdminRepo(
     model = ProductModificationValue
     query = select(ProductModificationValue)
     filter_set = ProductModificationValueAdminFilterSet
+    cache_tables = (ProductModificationValue.__tablename__,)
@@ -1,6 +1,14 @@
 from sqlalchemy import select
 
-from src.common.filters import FilterSet, Filter, ILikeFilter
+from src.common.filters import (
+    FilterSet,
+    Filter,
+    TrigramILikeFilter,
+    InFilter,
+    OrderingFilter,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from src.common.repository import BaseRepo
 from src.data.database.models.user import User
 from src.domain.user.dto.admin import UserAdminFilterSchema
@@ -8,8 +16,21 @@ from src.domain.user.dto.admin import UserAdminFilterSchema
 
 class UserAdminFilterSet(FilterSet):
     id = Filter(User, "id")
-    email = ILikeFilter(User, "email")
-    phone = ILikeFilter(User, "phone")
+    ids = InFilter(User, "id")
+    email = TrigramILikeFilter(User, "email")
+    phone = TrigramILikeFilter(User, "phone")
+    order = OrderingFilter(
+        {
+            "id": (User, "id"),
+            "first_name": (User, "first_name"),
+            "last_name": (User, "last_name"),
+            "email": (User, "email"),
+            "phone": (User, "phone"),
+            "birth_date": (User, "birth_date"),
+        }
+    )
+    cursor = KeysetPagination(User)
+    pagination = LimitOffsetPagination()
 
 
 class UserAdminRepo(BaseRepo[User, UserAdminFilterSchema]):
@@ -0,0 +1,25 @@
+"""jwt token lookup indexes
+
+Revision ID: 5d0c7e1f9a3b
+Revises: 2bb1ae3d8557
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d0c7e1f9a3b'
+down_revision = '2bb1ae3d8557'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_outstanding_tokens_user_id'), 'outstanding_tokens', ['user_id'], unique=False)
+    op.create_index(op.f('ix_blacklist_tokens_outstanding_token_id'), 'blacklist_tokens', ['outstanding_token_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_blacklist_tokens_outstanding_token_id'), table_name='blacklist_tokens')
+    op.drop_index(op.f('ix_outstanding_tokens_user_id'), table_name='outstanding_tokens')
@@ -0,0 +1,23 @@
+"""outstanding tokens expires_at index
+
+Revision ID: 8a4f2b6c1d7e
+Revises: 5d0c7e1f9a3b
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4f2b6c1d7e'
+down_revision = '5d0c7e1f9a3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_outstanding_tokens_expires_at'), 'outstanding_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_outstanding_tokens_expires_at'), table_name='outstanding_tokens')
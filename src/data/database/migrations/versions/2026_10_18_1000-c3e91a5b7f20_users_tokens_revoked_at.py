@@ -0,0 +1,24 @@
+"""users tokens_revoked_at
+
+Revision ID: c3e91a5b7f20
+Revises: 8a4f2b6c1d7e
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e91a5b7f20'
+down_revision = '8a4f2b6c1d7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('tokens_revoked_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'tokens_revoked_at')
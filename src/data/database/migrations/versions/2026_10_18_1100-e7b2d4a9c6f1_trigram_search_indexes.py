@@ -0,0 +1,45 @@
+"""trigram search indexes
+
+Revision ID: e7b2d4a9c6f1
+Revises: c3e91a5b7f20
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b2d4a9c6f1'
+down_revision = 'c3e91a5b7f20'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_COLUMNS = (
+    ('products', 'name'),
+    ('product_categories', 'name'),
+    ('product_modifications', 'name'),
+    ('product_modification_values', 'name'),
+    ('measure_categories', 'name'),
+    ('measure_values', 'name'),
+    ('users', 'email'),
+    ('users', 'phone'),
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table_name, column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'ix_{table_name}_{column}_trgm',
+            table_name,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    # Расширение pg_trgm не удаляется: оно может использоваться вне приложения
+    for table_name, column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f'ix_{table_name}_{column}_trgm', table_name=table_name)
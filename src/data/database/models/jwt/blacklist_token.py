@@ -13,7 +13,7 @@ class BlacklistToken(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "blacklist_tokens"
 
     outstanding_token_id: Mapped[int] = mapped_column(
-        ForeignKey("outstanding_tokens.id"),
+        ForeignKey("outstanding_tokens.id"), index=True
     )
     outstanding_token: Mapped["OutstandingToken"] = relationship(
         back_populates="blacklist_token", uselist=False
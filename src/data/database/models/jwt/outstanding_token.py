@@ -13,10 +13,12 @@ if TYPE_CHECKING:
 class OutstandingToken(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "outstanding_tokens"
 
-    user_id: Mapped[int] = mapped_column(nullable=False)
+    user_id: Mapped[int] = mapped_column(nullable=False, index=True)
     jti: Mapped[str] = mapped_column(nullable=False, index=True)
     token: Mapped[str] = mapped_column(nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
     blacklist_token: Mapped["BlacklistToken"] = relationship(
         back_populates="outstanding_token", uselist=False
     )
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, IdPrimaryKeyMixin, TimestampMixin
 
 if TYPE_CHECKING:
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
 
 class MeasureCategory(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "measure_categories"
+    __table_args__ = (trigram_index(__tablename__, "name"),)
 
     name: Mapped[str] = mapped_column(nullable=False, doc="Название")
     product_categories: Mapped[list["ProductCategory"]] = relationship(
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, TimestampMixin, IdPrimaryKeyMixin
 
 if TYPE_CHECKING:
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
 
 class MeasureValue(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "measure_values"
+    __table_args__ = (trigram_index(__tablename__, "name"),)
 
     name: Mapped[str] = mapped_column(nullable=False, doc="Название")
     category_id: Mapped[int] = mapped_column(ForeignKey("measure_categories.id"), nullable=False)
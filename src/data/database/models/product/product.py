@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import Numeric, ForeignKey
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, IdPrimaryKeyMixin, TimestampMixin
 
 if TYPE_CHECKING:
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
 
 class Product(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "products"
+    __table_args__ = (trigram_index(__tablename__, "name"),)
 
     name: Mapped[str] = mapped_column(nullable=False, doc="Название")
     base_price: Mapped[Decimal] = mapped_column(Numeric(precision=9, scale=6), doc="Базовая цена")
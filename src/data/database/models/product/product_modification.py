@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, IdPrimaryKeyMixin, TimestampMixin
 
 if TYPE_CHECKING:
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
 
 class ProductModification(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "product_modifications"
+    __table_args__ = (trigram_index(__tablename__, "name"),)
 
     name: Mapped[str] = mapped_column(nullable=False, doc="Название")
     icon: Mapped[str] = mapped_column(nullable=True, doc="Иконка")
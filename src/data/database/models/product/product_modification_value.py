@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, IdPrimaryKeyMixin, TimestampMixin
 
 if TYPE_CHECKING:
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
 
 class ProductModificationValue(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "product_modification_values"
+    __table_args__ = (trigram_index(__tablename__, "name"),)
 
     name: Mapped[str] = mapped_column(nullable=False, doc="Название")
     price: Mapped[Decimal] = mapped_column(Numeric(precision=9, scale=6))
@@ -3,11 +3,13 @@ from datetime import datetime
 from sqlalchemy import DateTime, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.common.database.indexes import trigram_index
 from src.common.database.mixins import BaseClass, IdPrimaryKeyMixin, TimestampMixin
 
 
 class User(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     __tablename__ = "users"
+    __table_args__ = (trigram_index(__tablename__, "email"), trigram_index(__tablename__, "phone"))
 
     first_name: Mapped[str] = mapped_column(nullable=False)
     last_name: Mapped[str] = mapped_column(nullable=False)
@@ -25,3 +27,7 @@ class User(IdPrimaryKeyMixin, TimestampMixin, BaseClass):
     street: Mapped[str | None] = mapped_column(nullable=True, default=None)
     city: Mapped[str | None] = mapped_column(nullable=True, default=None)
     country: Mapped[str | None] = mapped_column(nullable=True, default=None)
+
+    tokens_revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
@@ -1,3 +1,4 @@
+import sqlalchemy as sa
 from sqlalchemy import select
 
 from src.common.filters import FilterSet, Filter
@@ -14,3 +15,25 @@ class BlacklistTokenRepo(BaseRepo[BlacklistToken, BlacklistTokenFilterSchema]):
     model = BlacklistToken
     query = select(BlacklistToken).join(OutstandingToken)
     filter_set = BlacklistTokenFilterSet
+
+    async def add_user_tokens(self, user_id: int) -> int:
+        """Добавление всех еще не отозванных токенов пользователя в черный список одним
+        INSERT ... SELECT. Возвращает кол-во добавленных токенов"""
+        not_in_blacklist = ~sa.exists().where(
+            BlacklistToken.outstanding_token_id == OutstandingToken.id
+        )
+        query = sa.insert(BlacklistToken).from_select(
+            ["outstanding_token_id"],
+            select(OutstandingToken.id).where(
+                OutstandingToken.user_id == user_id, not_in_blacklist
+            ),
+        )
+        result = await self.session.execute(query)
+        return result.rowcount
+
+    async def delete_by_outstanding_token_ids(self, outstanding_token_ids: list[int]) -> int:
+        query = sa.delete(BlacklistToken).where(
+            BlacklistToken.outstanding_token_id.in_(outstanding_token_ids)
+        )
+        result = await self.session.execute(query)
+        return result.rowcount
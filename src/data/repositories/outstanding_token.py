@@ -1,3 +1,6 @@
+from datetime import datetime
+
+import sqlalchemy as sa
 from sqlalchemy import select, Select
 
 from src.common.filters import FilterSet, Filter, MethodFilter
@@ -27,3 +30,20 @@ class OutstandingTokenRepo(BaseRepo[OutstandingToken, OutstandingTokenFilterSche
     model = OutstandingToken
     query = select(OutstandingToken)
     filter_set = OutstandingTokenFilterSet
+
+    async def lock_expired_ids(self, expired_before: datetime, limit: int) -> list[int]:
+        """Блокировка пачки истекших токенов для удаления. Заблокированные другим
+        процессом строки пропускаются"""
+        query = (
+            select(OutstandingToken.id)
+            .where(OutstandingToken.expires_at < expired_before)
+            .order_by(OutstandingToken.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list((await self.session.execute(query)).scalars().all())
+
+    async def delete_by_ids(self, ids: list[int]) -> int:
+        query = sa.delete(OutstandingToken).where(OutstandingToken.id.in_(ids))
+        result = await self.session.execute(query)
+        return result.rowcount
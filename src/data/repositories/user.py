@@ -1,7 +1,12 @@
+from datetime import datetime
+
+import sqlalchemy as sa
 from sqlalchemy import select
 
+from src.common.exceptions.repository_exceptions import NotFoundException
 from src.common.filters import FilterSet, Filter
 from src.common.repository import BaseRepo
+from src.data.database.models.jwt import BlacklistToken, OutstandingToken
 from src.data.database.models.user import User
 from src.domain.user.dto.filter import UserFilterSchema
 
@@ -15,3 +20,26 @@ class UserRepo(BaseRepo[User, UserFilterSchema]):
     model = User
     query = select(User)
     filter_set = UserFilterSet
+
+    async def retrieve_by_jwt_token(self, jti: str, user_id: int) -> tuple[User, bool]:
+        """Получение пользователя и признака нахождения токена в черном списке одним запросом"""
+        in_blacklist = (
+            sa.exists()
+            .where(BlacklistToken.outstanding_token_id == OutstandingToken.id)
+            .label("in_blacklist")
+        )
+        query = (
+            select(User, in_blacklist)
+            .join(OutstandingToken, OutstandingToken.user_id == User.id)
+            .where(OutstandingToken.jti == jti, OutstandingToken.user_id == user_id)
+            .limit(1)
+        )
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            raise NotFoundException
+        return row.User, row.in_blacklist
+
+    async def revoke_tokens(self, user_id: int, revoked_at: datetime) -> None:
+        """Токены пользователя, выпущенные до revoked_at, считаются отозванными"""
+        query = sa.update(User).where(User.id == user_id).values(tokens_revoked_at=revoked_at)
+        await self.session.execute(query)
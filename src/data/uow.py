@@ -14,18 +14,17 @@ from src.data.repositories.user import UserRepo
 class UnitOfWork(BaseUnitOfWork):
     async def __aenter__(self) -> None:
         await super().__aenter__()
+        repository_kwargs = self.repository_kwargs
 
-        self.user = UserRepo(session=self.session)
-        self.outstanding_token = OutstandingTokenRepo(session=self.session)
-        self.blacklist_token = BlacklistTokenRepo(session=self.session)
+        self.user = UserRepo(**repository_kwargs)
+        self.outstanding_token = OutstandingTokenRepo(**repository_kwargs)
+        self.blacklist_token = BlacklistTokenRepo(**repository_kwargs)
 
         # Admin repos
-        self.user_admin = UserAdminRepo(session=self.session)
-        self.measure_category_admin = MeasureCategoryAdminRepo(session=self.session)
-        self.measure_value_admin = MeasureValueAdminRepo(session=self.session)
-        self.product_admin = ProductAdminRepo(session=self.session)
-        self.product_category_admin = ProductCategoryAdminRepo(session=self.session)
-        self.product_modification_admin = ProductModificationAdminRepo(session=self.session)
-        self.product_modification_value_admin = ProductModificationValueAdminRepo(
-            session=self.session
-        )
+        self.user_admin = UserAdminRepo(**repository_kwargs)
+        self.measure_category_admin = MeasureCategoryAdminRepo(**repository_kwargs)
+        self.measure_value_admin = MeasureValueAdminRepo(**repository_kwargs)
+        self.product_admin = ProductAdminRepo(**repository_kwargs)
+        self.product_category_admin = ProductCategoryAdminRepo(**repository_kwargs)
+        self.product_modification_admin = ProductModificationAdminRepo(**repository_kwargs)
+        self.product_modification_value_admin = ProductModificationValueAdminRepo(**repository_kwargs)
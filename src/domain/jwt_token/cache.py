@@ -0,0 +1,84 @@
+from collections import defaultdict
+from datetime import datetime
+
+from src.common.cache.memory import InMemoryTTLCache
+
+
+class JwtTokenStatusCache:
+    """
+    Кэш статуса токенов (находится ли токен в черном списке) в памяти процесса.
+    Запись хранится по jti не дольше срока жизни токена и не дольше ttl, так как
+    инвалидация происходит только в текущем процессе.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        """
+        :param maxsize: Максимальное кол-во токенов в кэше
+        :param ttl: Максимальное время жизни записи в секундах
+        """
+        self._statuses: InMemoryTTLCache[str, tuple[int, bool]] = InMemoryTTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._user_tokens: defaultdict[int, set[str]] = defaultdict(set)
+        # Кол-во jti в индексе пользователей, включая уже вытесненные из кэша
+        self._index_size = 0
+
+    def get(self, jti: str, user_id: int) -> bool | None:
+        """Возвращает признак нахождения токена в черном списке или None, если его нет в кэше"""
+        cached = self._statuses.get(jti)
+        if cached is None:
+            self._discard(jti, user_id)
+            return None
+
+        cached_user_id, in_blacklist = cached
+        if cached_user_id != user_id:
+            return None
+        return in_blacklist
+
+    def set(self, jti: str, user_id: int, in_blacklist: bool, expires_at: datetime) -> None:
+        self._statuses.set(jti, (user_id, in_blacklist), expires_at=expires_at.timestamp())
+        if not self._statuses.has(jti):
+            return
+        # Вместе с новым токеном из индекса пользователя удаляются вытесненные из кэша
+        tokens = self._user_tokens.get(user_id, set())
+        alive = {token for token in tokens if self._statuses.has(token)}
+        alive.add(jti)
+        self._user_tokens[user_id] = alive
+        self._index_size += len(alive) - len(tokens)
+        self._prune_user_index()
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Удаляет из кэша все токены пользователя"""
+        tokens = self._user_tokens.pop(user_id, set())
+        self._index_size -= len(tokens)
+        for jti in tokens:
+            self._statuses.delete(jti)
+
+    def clear(self) -> None:
+        self._statuses.clear()
+        self._user_tokens.clear()
+        self._index_size = 0
+
+    def _discard(self, jti: str, user_id: int) -> None:
+        tokens = self._user_tokens.get(user_id)
+        if tokens is None:
+            return
+        if jti in tokens:
+            tokens.discard(jti)
+            self._index_size -= 1
+        if not tokens:
+            del self._user_tokens[user_id]
+
+    def _prune_user_index(self) -> None:
+        # Вытесненные из кэша jti удаляются из индекса, когда он вдвое превышает размер кэша,
+        # поэтому индекс ограничен 2 * maxsize, а полный проход выполняется не чаще,
+        # чем раз на maxsize добавлений
+        if self._index_size <= 2 * self._statuses.maxsize:
+            return
+        for user_id in list(self._user_tokens):
+            alive = {jti for jti in self._user_tokens[user_id] if self._statuses.has(jti)}
+            if alive:
+                self._user_tokens[user_id] = alive
+            else:
+                del self._user_tokens[user_id]
+        self._index_size = sum(len(tokens) for tokens in self._user_tokens.values())
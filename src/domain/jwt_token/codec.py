@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+from jose import jwk, jwt
+from jose.exceptions import JWTClaimsError
+
+from src.domain.jwt_token.dto.output import JwtTokenSchema
+from src.domain.jwt_token.enums import JwtTokenType
+
+
+class JwtTokenCodec:
+    """
+    Кодирование и декодирование JWT токенов. Ключ подписи создается один раз,
+    payload собирается и разбирается без валидации через pydantic.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        """
+        :param secret_key: Секретный ключ подписи
+        :param algorithm: Алгоритм подписи
+        """
+        self.algorithm = algorithm
+        self._algorithms = [algorithm]
+        self._key = jwk.construct(secret_key, algorithm)
+
+    def encode(self, token: JwtTokenSchema) -> str:
+        payload = {
+            "token_type": token.token_type.value,
+            "jti": token.jti,
+            "user_id": token.user_id,
+            "exp": token.exp,
+        }
+        if token.iat is not None:
+            payload["iat"] = token.iat
+        return jwt.encode(payload, self._key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> JwtTokenSchema:
+        """Проверка подписи и срока действия токена.
+        При некорректном токене выбрасывается jose.JWTError"""
+        payload = jwt.decode(token, self._key, algorithms=self._algorithms)
+        try:
+            token_type = JwtTokenType(payload["token_type"])
+            jti, user_id, exp = payload["jti"], payload["user_id"], payload["exp"]
+            iat = payload.get("iat")
+            if not isinstance(jti, str) or not isinstance(user_id, int):
+                raise TypeError
+            return JwtTokenSchema.construct(
+                token_type=token_type,
+                jti=jti,
+                user_id=user_id,
+                exp=datetime.fromtimestamp(exp, tz=timezone.utc),
+                iat=float(iat) if iat is not None else None,
+            )
+        except (KeyError, TypeError, ValueError, OverflowError):
+            raise JWTClaimsError("Invalid token payload")
@@ -11,6 +11,7 @@ class JwtTokenSchema(OrmModel):
     jti: str
     user_id: int
     exp: datetime
+    iat: float | None = None
 
 
 class JwtTokensOutSchema(BaseModel):
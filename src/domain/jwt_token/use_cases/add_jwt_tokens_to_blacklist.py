@@ -1,24 +1,24 @@
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
-from src.data.database.models.jwt import BlacklistToken
 from src.data.uow import UnitOfWork
-from src.domain.jwt_token.dto.filter import OutstandingTokenFilterSchema
+from src.domain.jwt_token.cache import JwtTokenStatusCache
 
 
 @dataclass
 class AddJwtTokensToBlacklist:
     uow: UnitOfWork
+    config: dict
+    token_cache: JwtTokenStatusCache
 
     async def __call__(self, user_id: int) -> None:
         async with self.uow:
-            outstanding_tokens = await self.uow.outstanding_token.list(
-                OutstandingTokenFilterSchema(user_id=user_id, in_blacklist=False)
-            )
-            if not outstanding_tokens:
+            added = await self.uow.blacklist_token.add_user_tokens(user_id)
+            if self.config["stateless_access_tokens"]:
+                await self.uow.user.revoke_tokens(user_id, datetime.now(timezone.utc))
+            elif not added:
                 return
 
-            for outstanding_token in outstanding_tokens:
-                blacklist_token = BlacklistToken(outstanding_token_id=outstanding_token.id)
-                self.uow.blacklist_token.add(blacklist_token)
-
             await self.uow.commit()
+
+        self.token_cache.invalidate_user(user_id)
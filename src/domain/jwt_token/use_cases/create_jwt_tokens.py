@@ -1,11 +1,11 @@
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-from jose import jwt
-
 from src.data.database.models.jwt import OutstandingToken
 from src.data.uow import UnitOfWork
+from src.domain.jwt_token.codec import JwtTokenCodec
 from src.domain.jwt_token.dto.output import JwtTokensOutSchema, JwtTokenSchema
 from src.domain.jwt_token.enums import JwtTokenType
 
@@ -14,37 +14,36 @@ from src.domain.jwt_token.enums import JwtTokenType
 class CreateJwtTokens:
     uow: UnitOfWork
     config: dict
-
-    def _encode_payload(self, token_data: JwtTokenSchema) -> str:
-        encoded_jwt = jwt.encode(
-            token_data.dict(),
-            self.config["secret_key"],
-            algorithm=self.config["jwt_algorithm"],
-        )
-        return encoded_jwt
+    token_codec: JwtTokenCodec
 
     async def __call__(self, user_id: int) -> JwtTokensOutSchema:
+        stateless_access_tokens = self.config["stateless_access_tokens"]
         access_jti = uuid4().hex
         refresh_jti = uuid4().hex
+        issued_at = time.time()
 
         access_exp = datetime.utcnow() + timedelta(
-            minutes=self.config["access_token_expires_minutes"]
+            minutes=self.config["stateless_access_token_expires_minutes"]
+            if stateless_access_tokens
+            else self.config["access_token_expires_minutes"]
         )
         refresh_exp = datetime.utcnow() + timedelta(
             minutes=self.config["refresh_token_expires_minutes"]
         )
 
-        access_token_payload = JwtTokenSchema(
+        access_token_payload = JwtTokenSchema.construct(
             user_id=user_id,
             token_type=JwtTokenType.ACCESS,
             exp=access_exp,
             jti=access_jti,
+            iat=issued_at,
         )
-        refresh_token_payload = JwtTokenSchema(
+        refresh_token_payload = JwtTokenSchema.construct(
             user_id=user_id,
             token_type=JwtTokenType.REFRESH,
             exp=refresh_exp,
             jti=refresh_jti,
+            iat=issued_at,
         )
 
         async with self.uow:
@@ -52,15 +51,19 @@ class CreateJwtTokens:
                 jti=access_jti,
                 user_id=user_id,
                 expires_at=access_exp,
-                token=self._encode_payload(access_token_payload),
+                token=self.token_codec.encode(access_token_payload),
             )
             refresh_token = OutstandingToken(
                 jti=refresh_jti,
                 user_id=user_id,
                 expires_at=refresh_exp,
-                token=self._encode_payload(refresh_token_payload),
+                token=self.token_codec.encode(refresh_token_payload),
             )
-            await self.uow.outstanding_token.add_all(access_token, refresh_token)
+            if stateless_access_tokens:
+                # Access токен проверяется только по подписи и сроку действия
+                self.uow.outstanding_token.add(refresh_token)
+            else:
+                await self.uow.outstanding_token.add_all(access_token, refresh_token)
             await self.uow.commit()
 
         return JwtTokensOutSchema(
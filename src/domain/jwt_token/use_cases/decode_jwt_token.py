@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 
 from jose import jwt
-from pydantic import ValidationError
 
 from src.common.exceptions.error_codes import ErrorCode
 from src.common.exceptions.use_case_exceptions import UseCaseHTTPException
 from src.data.uow import UnitOfWork
+from src.domain.jwt_token.cache import JwtTokenStatusCache
+from src.domain.jwt_token.codec import JwtTokenCodec
 from src.domain.jwt_token.dto.filter import OutstandingTokenFilterSchema, BlacklistTokenFilterSchema
 from src.domain.jwt_token.dto.output import JwtTokenSchema
 from src.domain.jwt_token.enums import JwtTokenType
@@ -15,20 +16,47 @@ from src.domain.jwt_token.enums import JwtTokenType
 class DecodeJwtToken:
     uow: UnitOfWork
     config: dict
+    token_cache: JwtTokenStatusCache
+    token_codec: JwtTokenCodec
 
-    async def __call__(self, token: str, token_type: JwtTokenType) -> tuple[JwtTokenSchema, bool]:
+    def decode(self, token: str, token_type: JwtTokenType) -> JwtTokenSchema:
+        """Проверка подписи, срока действия и типа токена без обращения к базе данных"""
         try:
-            payload = jwt.decode(
-                token, self.config["secret_key"], algorithms=[self.config["jwt_algorithm"]]
-            )
-            decoded_token = JwtTokenSchema(**payload)
-        except (jwt.JWTError, ValidationError):
+            decoded_token = self.token_codec.decode(token)
+        except jwt.JWTError:
             raise UseCaseHTTPException(
                 error_code=ErrorCode.AUTH_ERROR,
                 message="Could not validate credentials",
             )
 
-        token_in_blacklist = False
+        if decoded_token.token_type != token_type:
+            raise UseCaseHTTPException(
+                error_code=ErrorCode.AUTH_ERROR,
+                message="Token has incorrect type",
+            )
+        return decoded_token
+
+    def is_stateless(self, token_type: JwtTokenType) -> bool:
+        """Токен не хранится в базе данных и отзывается через User.tokens_revoked_at"""
+        return token_type == JwtTokenType.ACCESS and self.config["stateless_access_tokens"]
+
+    @staticmethod
+    def is_status_cached(token_type: JwtTokenType) -> bool:
+        """Статус в черном списке кэшируется только для токенов доступа. Refresh токен
+        используется один раз, а инвалидация кэша действует только в текущем процессе"""
+        return token_type == JwtTokenType.ACCESS
+
+    async def __call__(self, token: str, token_type: JwtTokenType) -> tuple[JwtTokenSchema, bool]:
+        decoded_token = self.decode(token, token_type)
+        if self.is_stateless(token_type):
+            return decoded_token, False
+
+        use_cache = self.is_status_cached(token_type)
+        if use_cache:
+            token_in_blacklist = self.token_cache.get(decoded_token.jti, decoded_token.user_id)
+            if token_in_blacklist is not None:
+                return decoded_token, token_in_blacklist
+
         async with self.uow:
             outstanding_token = await self.uow.outstanding_token.retrieve(
                 OutstandingTokenFilterSchema(jti=decoded_token.jti, user_id=decoded_token.user_id)
@@ -36,13 +64,13 @@ class DecodeJwtToken:
             blacklist_token = await self.uow.blacklist_token.first(
                 BlacklistTokenFilterSchema(outstanding_token_id=outstanding_token.id)
             )
-            if blacklist_token:
-                token_in_blacklist = True
-
-            if decoded_token.token_type != token_type:
-                raise UseCaseHTTPException(
-                    error_code=ErrorCode.AUTH_ERROR,
-                    message="Token has incorrect type",
-                )
+            token_in_blacklist = blacklist_token is not None
 
+        if use_cache:
+            self.token_cache.set(
+                decoded_token.jti,
+                decoded_token.user_id,
+                token_in_blacklist,
+                expires_at=decoded_token.exp,
+            )
         return decoded_token, token_in_blacklist
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.data.uow import UnitOfWork
+
+
+@dataclass
+class DeleteExpiredJwtTokens:
+    uow: UnitOfWork
+    config: dict
+
+    async def __call__(self, batch_size: int | None = None) -> int:
+        """Удаление истекших токенов пачками, каждая пачка в отдельной транзакции.
+        Возвращает кол-во удаленных токенов"""
+        batch_size = batch_size or self.config["jwt_token_reaper_batch_size"]
+        expired_before = datetime.now(timezone.utc)
+        deleted = 0
+
+        while True:
+            async with self.uow:
+                ids = await self.uow.outstanding_token.lock_expired_ids(expired_before, batch_size)
+                if not ids:
+                    break
+
+                await self.uow.blacklist_token.delete_by_outstanding_token_ids(ids)
+                deleted += await self.uow.outstanding_token.delete_by_ids(ids)
+                await self.uow.commit()
+
+            if len(ids) < batch_size:
+                break
+
+        return deleted
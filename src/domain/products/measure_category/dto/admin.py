@@ -1,4 +1,5 @@
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class MeasureCategoryAdminBaseInSchema(BaseInSchema):
@@ -21,7 +22,7 @@ class MeasureCategoryListSchema(MeasureCategoryOutSchema):
     pass
 
 
-class MeasureCategoryAdminFilterSchema(OrmModel):
+class MeasureCategoryAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
     product_categories: list[int] | None = None
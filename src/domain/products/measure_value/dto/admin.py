@@ -1,4 +1,5 @@
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class MeasureValueAdminBaseInSchema(BaseInSchema):
@@ -22,7 +23,7 @@ class MeasureValueListSchema(MeasureValueOutSchema):
     pass
 
 
-class MeasureValueAdminFilterSchema(OrmModel):
+class MeasureValueAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
     category_id: int | None = None
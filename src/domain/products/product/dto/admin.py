@@ -1,6 +1,7 @@
 from decimal import Decimal
 
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class ProductAdminBaseInSchema(BaseInSchema):
@@ -36,7 +37,7 @@ class ProductListSchema(BaseOutSchema):
     product_category_id: int
 
 
-class ProductAdminFilterSchema(OrmModel):
+class ProductAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
     base_price: Decimal | None = None
@@ -1,4 +1,5 @@
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class ProductCategoryAdminBaseInSchema(BaseInSchema):
@@ -21,6 +22,6 @@ class ProductCategoryListSchema(ProductCategoryOutSchema):
     pass
 
 
-class ProductCategoryAdminFilterSchema(OrmModel):
+class ProductCategoryAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
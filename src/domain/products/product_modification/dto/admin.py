@@ -1,4 +1,5 @@
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class ProductModificationAdminBaseInSchema(BaseInSchema):
@@ -23,7 +24,7 @@ class ProductModificationListSchema(ProductModificationOutSchema):
     pass
 
 
-class ProductModificationAdminFilterSchema(OrmModel):
+class ProductModificationAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
     product_categories: list[int] | None = None
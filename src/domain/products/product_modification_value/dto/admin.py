@@ -1,6 +1,7 @@
 from decimal import Decimal
 
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class ProductModificationValueAdminBaseInSchema(BaseInSchema):
@@ -27,7 +28,7 @@ class ProductModificationValueListSchema(ProductModificationValueOutSchema):
     pass
 
 
-class ProductModificationValueAdminFilterSchema(OrmModel):
+class ProductModificationValueAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     name: str | None = None
     price: Decimal | None = None
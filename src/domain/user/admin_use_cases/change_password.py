@@ -8,14 +8,17 @@ from src.domain.user.dto.admin import (
     UserAdminFilterSchema,
     UserAdminUpdatePasswordSchema,
 )
-from src.utils.security import get_password_hash
+from src.utils.security import PasswordHasher
 
 
 @dataclass
 class ChangePasswordAdmin:
     uow: UnitOfWork
+    password_hasher: PasswordHasher
 
     async def __call__(self, pk: int, data: UserAdminUpdatePasswordSchema) -> None:
+        hashed_password = await self.password_hasher.hash(data.password)
+
         async with self.uow:
             try:
                 user = await self.uow.user_admin.retrieve(UserAdminFilterSchema(id=pk))
@@ -25,6 +28,6 @@ class ChangePasswordAdmin:
                     message="User not found",
                 )
 
-            user.hashed_password = get_password_hash(data.password)
+            user.hashed_password = hashed_password
             self.uow.user_admin.add(user)
             await self.uow.commit()
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from sqlalchemy.exc import IntegrityError
 
 from src.common.admin.interfaces import IAdminCreateUseCase
@@ -6,16 +8,21 @@ from src.common.exceptions.use_case_exceptions import UseCaseHTTPException
 from src.common.repository import BaseRepo
 from src.data.database.models.user import User
 from src.domain.user.dto.admin import UserAdminCreateSchema
-from src.utils.security import get_password_hash
+from src.utils.security import PasswordHasher
 
 
+@dataclass
 class CreateUserAdmin(IAdminCreateUseCase[UserAdminCreateSchema, User]):
+    password_hasher: PasswordHasher
+
     async def __call__(self, new_object: UserAdminCreateSchema) -> User:
+        hashed_password = await self.password_hasher.hash(new_object.password)
+
         async with self.uow:
             repository: BaseRepo = getattr(self.uow, self.repository_attr_name)
             user_data = {
                 **new_object.dict(exclude_unset=True, exclude={"password", "password_repeat"}),
-                "hashed_password": get_password_hash(new_object.password),
+                "hashed_password": hashed_password,
             }
             user = User(**user_data)
             repository.add(user)
@@ -2,7 +2,8 @@ from datetime import datetime
 
 from pydantic import EmailStr, Field, validator
 
-from src.common.dto import BaseOutSchema, OrmModel, BaseInSchema
+from src.common.dto import BaseOutSchema, BaseInSchema
+from src.common.repository import AdminFilterSchema
 
 
 class UserAdminBaseInSchema(BaseInSchema):
@@ -65,7 +66,7 @@ class UserAdminListSchema(BaseOutSchema):
     birth_date: datetime | None = None
 
 
-class UserAdminFilterSchema(OrmModel):
+class UserAdminFilterSchema(AdminFilterSchema[int]):
     id: int | None = None
     email: str | None = None
     phone: str | None = None
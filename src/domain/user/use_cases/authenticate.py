@@ -6,16 +6,20 @@ from src.data.database.models.user import User
 from src.data.uow import UnitOfWork
 from src.domain.user.dto.filter import UserFilterSchema
 from src.domain.user.dto.input import AuthInSchema
-from src.utils.security import verify_password
+from src.utils.security import PasswordHasher
 
 
 @dataclass
 class Authenticate:
     uow: UnitOfWork
+    password_hasher: PasswordHasher
 
     async def __call__(self, data: AuthInSchema) -> User:
         async with self.uow:
             user_db = await self.uow.user.first(params=UserFilterSchema(email=data.email))
-            if not user_db or not verify_password(data.password, user_db.hashed_password):
-                raise UseCaseHTTPException(message="User not found", error_code=ErrorCode.NOT_FOUND)
-            return user_db
+
+        if not user_db or not await self.password_hasher.verify(
+            data.password, user_db.hashed_password
+        ):
+            raise UseCaseHTTPException(message="User not found", error_code=ErrorCode.NOT_FOUND)
+        return user_db
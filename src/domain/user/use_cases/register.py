@@ -7,20 +7,23 @@ from src.common.exceptions.use_case_exceptions import UseCaseHTTPException
 from src.data.database.models.user import User
 from src.data.uow import UnitOfWork
 from src.domain.user.dto.input import RegisterInSchema
-from src.utils.security import get_password_hash
+from src.utils.security import PasswordHasher
 
 
 @dataclass
 class Register:
     uow: UnitOfWork
+    password_hasher: PasswordHasher
 
     async def __call__(self, data: RegisterInSchema) -> None:
+        hashed_password = await self.password_hasher.hash(data.password)
+
         async with self.uow:
             obj = User(
                 email=data.email,
                 first_name=data.first_name,
                 last_name=data.last_name,
-                hashed_password=get_password_hash(data.password),
+                hashed_password=hashed_password,
             )
 
             self.uow.user.add(obj)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.exceptions.repository_exceptions import NotFoundException
+from src.common.exceptions.use_case_exceptions import UseCaseHTTPException
+from src.data.database.models.user import User
+from src.data.uow import UnitOfWork
+from src.domain.jwt_token.cache import JwtTokenStatusCache
+from src.domain.jwt_token.dto.output import JwtTokenSchema
+from src.domain.jwt_token.enums import JwtTokenType
+from src.domain.jwt_token.use_cases.decode_jwt_token import DecodeJwtToken
+from src.domain.user.dto.filter import UserFilterSchema
+
+
+@dataclass
+class RetrieveUserByJwtToken:
+    uow: UnitOfWork
+    decode_jwt_token: DecodeJwtToken
+    token_cache: JwtTokenStatusCache
+
+    async def __call__(self, token: str, token_type: JwtTokenType) -> tuple[User | None, bool]:
+        decoded_token = self.decode_jwt_token.decode(token, token_type)
+
+        if self.decode_jwt_token.is_stateless(token_type):
+            async with self.uow:
+                user = await self._retrieve_user(decoded_token.user_id)
+            return user, self._is_revoked(user, decoded_token)
+
+        use_cache = self.decode_jwt_token.is_status_cached(token_type)
+        token_in_blacklist = (
+            self.token_cache.get(decoded_token.jti, decoded_token.user_id) if use_cache else None
+        )
+        if token_in_blacklist:
+            return None, True
+
+        async with self.uow:
+            if token_in_blacklist is not None:
+                return await self._retrieve_user(decoded_token.user_id), False
+
+            try:
+                user, token_in_blacklist = await self.uow.user.retrieve_by_jwt_token(
+                    jti=decoded_token.jti, user_id=decoded_token.user_id
+                )
+            except NotFoundException:
+                raise UseCaseHTTPException(
+                    error_code=ErrorCode.AUTH_ERROR,
+                    message="Could not validate credentials",
+                )
+
+        if use_cache:
+            self.token_cache.set(
+                decoded_token.jti,
+                decoded_token.user_id,
+                token_in_blacklist,
+                expires_at=decoded_token.exp,
+            )
+        return user, token_in_blacklist
+
+    async def _retrieve_user(self, user_id: int) -> User:
+        try:
+            return await self.uow.user.retrieve(UserFilterSchema(id=user_id))
+        except NotFoundException:
+            raise UseCaseHTTPException(
+                error_code=ErrorCode.AUTH_ERROR,
+                message="Could not validate credentials",
+            )
+
+    @staticmethod
+    def _is_revoked(user: User, decoded_token: JwtTokenSchema) -> bool:
+        if user.tokens_revoked_at is None:
+            return False
+        if decoded_token.iat is None:
+            return True
+        return decoded_token.iat <= user.tokens_revoked_at.timestamp()
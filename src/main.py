@@ -1,14 +1,45 @@
+import asyncio
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from src.common.admin.api.types import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from src.common.exceptions.handlers.fastapi_exception_handlers import (
     use_case_http_exception_handler,
 )
+from src.common.middlewares.query_stats import (
+    DB_ROWS_HEADER,
+    DB_STATEMENTS_HEADER,
+    DB_TIME_HEADER,
+    QueryStatsMiddleware,
+)
+from src.common.utils.concurrency import run_periodically
 from .api.router import include_endpoint_routers, include_admin_endpoint_routers
 from .common.exceptions.base_exceptions import BaseHTTPException
 from .containers import container
 
 
+def add_background_tasks(application: FastAPI) -> None:
+    tasks: set[asyncio.Task] = set()
+    reaper_interval = container.config.app.jwt_token_reaper_interval_seconds()
+
+    async def start_tasks() -> None:
+        if reaper_interval:
+            reaper = run_periodically(
+                reaper_interval, lambda: container.use_cases.delete_expired_jwt_tokens()()
+            )
+            tasks.add(asyncio.create_task(reaper))
+
+    async def stop_tasks() -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        container.gateways.password_hasher().shutdown()
+
+    application.add_event_handler("startup", start_tasks)
+    application.add_event_handler("shutdown", stop_tasks)
+
+
 def create_app() -> FastAPI:
     application = FastAPI(debug=container.config.app.debug())
     application.container = container
@@ -18,13 +49,22 @@ def create_app() -> FastAPI:
 
     application.add_exception_handler(BaseHTTPException, use_case_http_exception_handler)
 
+    application.add_middleware(QueryStatsMiddleware)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[
+            TOTAL_COUNT_HEADER,
+            NEXT_CURSOR_HEADER,
+            DB_STATEMENTS_HEADER,
+            DB_TIME_HEADER,
+            DB_ROWS_HEADER,
+        ],
     )
+    add_background_tasks(application)
 
     return application
 
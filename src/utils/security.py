@@ -1,3 +1,7 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property
+
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -9,3 +13,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    Выполнение bcrypt в пуле потоков или процессов, чтобы не блокировать event loop.
+    Пул потоков помогает, только если passlib использует пакет bcrypt: backend os_crypt
+    держит GIL на время хеширования
+    """
+
+    def __init__(self, executor_type: str = "thread", max_workers: int | None = None) -> None:
+        """
+        :param executor_type: Тип пула: "thread" или "process"
+        :param max_workers: Размер пула
+        """
+        if executor_type not in ("thread", "process"):
+            raise ValueError("executor_type must be one of: thread, process")
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+
+    @cached_property
+    def executor(self) -> Executor:
+        if self.executor_type == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, verify_password, plain_password, hashed_password
+        )
+
+    async def hash(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, get_password_hash, password)
+
+    def shutdown(self) -> None:
+        """Остановка пула, если он был создан. После остановки пул создается заново"""
+        executor = self.__dict__.pop("executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
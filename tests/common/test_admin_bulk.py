@@ -0,0 +1,229 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from src.common.admin.use_cases.bulk import (
+    AdminBulkCreateUseCase,
+    AdminBulkDeleteUseCase,
+    execute_bulk_with_errors,
+)
+from src.common.admin.use_cases.delete import AdminDeleteUseCase
+from src.common.admin.use_cases.update import AdminUpdateUseCase
+from src.common.dto import BaseInSchema
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.exceptions.use_case_exceptions import (
+    BulkOperationHTTPException,
+    NotFoundHTTPException,
+)
+from src.common.filters import FilterSet, Filter, InFilter
+from src.common.repository import AdminFilterSchema, BaseRepo
+from src.common.uow import BaseUnitOfWork
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Category(Base):
+    __tablename__ = "test_bulk_categories"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+tags = sa.Table(
+    "test_bulk_item_tags",
+    Base.metadata,
+    sa.Column("tagged_item_id", sa.ForeignKey("test_bulk_tagged_items.id"), primary_key=True),
+    sa.Column("category_id", sa.ForeignKey("test_bulk_categories.id"), primary_key=True),
+)
+
+
+class Item(Base):
+    __tablename__ = "test_bulk_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(unique=True)
+    category_id: Mapped[int | None] = mapped_column(sa.ForeignKey(Category.id))
+    category: Mapped[Category | None] = relationship()
+
+
+class TaggedItem(Base):
+    __tablename__ = "test_bulk_tagged_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tags: Mapped[list[Category]] = relationship(secondary=tags)
+
+
+class ItemFilterSet(FilterSet):
+    id = Filter(Item, "id")
+    ids = InFilter(Item, "id")
+
+
+class TaggedItemFilterSet(FilterSet):
+    id = Filter(TaggedItem, "id")
+    ids = InFilter(TaggedItem, "id")
+
+
+class ItemRepo(BaseRepo[Item, AdminFilterSchema]):
+    model = Item
+    filter_set = ItemFilterSet
+
+
+class TaggedItemRepo(BaseRepo[TaggedItem, AdminFilterSchema]):
+    model = TaggedItem
+    filter_set = TaggedItemFilterSet
+
+
+class UnitOfWork(BaseUnitOfWork):
+    async def __aenter__(self) -> None:
+        await super().__aenter__()
+        self.item = ItemRepo(**self.repository_kwargs)
+        self.tagged_item = TaggedItemRepo(**self.repository_kwargs)
+
+
+class ItemCreateSchema(BaseInSchema):
+    name: str
+    category_id: int | None = None
+
+
+class ItemUpdateSchema(BaseInSchema):
+    name: str | None = None
+
+
+FilterSchema = AdminFilterSchema[int]
+
+
+def run_with_uow(dsn: str, test: Callable[[UnitOfWork, list[str]], Awaitable[None]]) -> None:
+    """Запуск теста с unit of work на пустых таблицах. Второй аргумент test - выполненные
+    запросы"""
+
+    async def run() -> None:
+        engine = create_async_engine(dsn)
+        statements: list[str] = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(sa.insert(Category).values(id=1))
+            await conn.execute(sa.insert(Item).values(id=1, name="existing", category_id=1))
+        try:
+            session = AsyncSession(engine, expire_on_commit=False)
+            statements.clear()
+            await test(UnitOfWork(session), statements)  # type: ignore
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+async def item_names(uow: UnitOfWork) -> list[str]:
+    async with uow:
+        return list((await uow.session.scalars(sa.select(Item.name).order_by(Item.id))).all())
+
+
+def test_bulk_errors_have_item_indices(postgres_dsn: str) -> None:
+    async def test(uow: UnitOfWork, statements: list[str]) -> None:
+        values: list[dict[str, Any]] = [
+            {"name": "a"},
+            {"name": "existing"},
+            {"name": "b", "category_id": 1},
+            {"name": "c", "category_id": 999},
+            {"name": "d"},
+        ]
+        async with uow:
+            ids, errors = await execute_bulk_with_errors(uow, uow.item.bulk_create, values)
+            await uow.commit()
+
+        assert len(ids) == 3
+        assert [(e["index"], e["error_code"], e["field"]) for e in errors] == [
+            (1, ErrorCode.UNIQUE_ERROR, "name"),
+            (3, ErrorCode.FOREIGN_KEY_ERROR, "category_id"),
+        ]
+        assert await item_names(uow) == ["existing", "a", "b", "d"]
+
+    run_with_uow(postgres_dsn, test)
+
+
+def test_bulk_create_rolls_back_whole_transaction(postgres_dsn: str) -> None:
+    async def test(uow: UnitOfWork, statements: list[str]) -> None:
+        use_case = AdminBulkCreateUseCase(uow, "item", FilterSchema)
+        new_objects = [
+            ItemCreateSchema(name="a"),
+            ItemCreateSchema(name="b"),
+            ItemCreateSchema(name="a"),
+        ]
+        with pytest.raises(BulkOperationHTTPException) as exc_info:
+            await use_case(new_objects)
+
+        assert [error["index"] for error in exc_info.value.errors] == [2]
+        assert await item_names(uow) == ["existing"]
+
+    run_with_uow(postgres_dsn, test)
+
+
+def test_supports_returning() -> None:
+    session: Any = None
+    assert ItemRepo(session).supports_returning_update
+    assert ItemRepo(session).supports_returning_delete
+    assert TaggedItemRepo(session).supports_returning_update
+    # DELETE без ORM не удалил бы строки связи многие-ко-многим
+    assert not TaggedItemRepo(session).supports_returning_delete
+
+
+def test_update_uses_single_returning_statement(postgres_dsn: str) -> None:
+    async def test(uow: UnitOfWork, statements: list[str]) -> None:
+        use_case = AdminUpdateUseCase(uow, "item", FilterSchema)
+        entity = await use_case(1, ItemUpdateSchema(name="renamed"))
+
+        assert entity.name == "renamed"
+        assert [s.split()[0] for s in statements if s != "BEGIN"] == ["UPDATE"]
+        assert "RETURNING" in statements[-1]
+        assert await item_names(uow) == ["renamed"]
+
+        with pytest.raises(NotFoundHTTPException):
+            await use_case(999, ItemUpdateSchema(name="missing"))
+
+    run_with_uow(postgres_dsn, test)
+
+
+def test_delete_uses_single_returning_statement(postgres_dsn: str) -> None:
+    async def test(uow: UnitOfWork, statements: list[str]) -> None:
+        use_case = AdminDeleteUseCase(uow, "item", FilterSchema)
+        await use_case(1)
+
+        assert [s.split()[0] for s in statements if s != "BEGIN"] == ["DELETE"]
+        assert "RETURNING" in statements[-1]
+        assert await item_names(uow) == []
+
+        with pytest.raises(NotFoundHTTPException):
+            await use_case(1)
+
+    run_with_uow(postgres_dsn, test)
+
+
+def test_bulk_delete_removes_many_to_many_links(postgres_dsn: str) -> None:
+    async def test(uow: UnitOfWork, statements: list[str]) -> None:
+        async with uow:
+            category = await uow.session.get(Category, 1)
+            uow.session.add_all([TaggedItem(id=1, tags=[category]), TaggedItem(id=2)])
+            await uow.commit()
+
+        await AdminBulkDeleteUseCase(uow, "tagged_item", FilterSchema)([1, 2])
+
+        async with uow:
+            assert (await uow.session.scalar(sa.select(sa.func.count()).select_from(tags))) == 0
+            remaining = await uow.session.scalars(sa.select(TaggedItem.id))
+            assert remaining.all() == []
+
+    run_with_uow(postgres_dsn, test)
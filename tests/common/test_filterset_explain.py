@@ -0,0 +1,77 @@
+import asyncio
+import json
+from typing import Any, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.exc import NoResultFound
+
+from src.common.database.explain import Explain
+from src.data.admin_repositories.products.product import ProductAdminFilterSet
+from src.data.database.models.product import Product
+
+PLAN = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1}}])
+
+
+class EmptyBundle:
+    def __getattr__(self, name: str) -> Any:
+        return None
+
+
+class FakeRow:
+    """Строка агрегатов с пустыми значениями Bundle"""
+
+    def __getattr__(self, name: str) -> Any:
+        return EmptyBundle()
+
+    def __iter__(self) -> Iterator[None]:
+        # Распаковка min и max в RangeFilter.specs
+        return iter((None, None))
+
+
+class FakeResult:
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+    def scalar(self) -> Any:
+        return PLAN if isinstance(self.statement, Explain) else 0
+
+    def one(self) -> FakeRow:
+        # Как в PostgreSQL: агрегат без GROUP BY с OFFSET > 0 не возвращает строк
+        if self.statement._offset:
+            raise NoResultFound
+        return FakeRow()
+
+    def unique(self) -> "FakeResult":
+        return self
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list:
+        return []
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        self.statements.append(statement)
+        return FakeResult(statement)
+
+
+def test_explain_with_offset_pagination() -> None:
+    session = FakeSession()
+    filter_set = ProductAdminFilterSet(
+        {"name": "chair", "base_price": (100, None), "pagination": (10, 10)},
+        session,  # type: ignore
+        select(Product),
+    )
+
+    plans = asyncio.run(filter_set.explain())
+
+    assert set(plans) == {"filter", "count", "specs", "facets"}
+    assert "OFFSET" in plans["filter"][0]["sql"]
+    for name in ("count", "specs", "facets"):
+        assert plans[name]
+        assert all("OFFSET" not in plan["sql"] for plan in plans[name])
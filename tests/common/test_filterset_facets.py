@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ColumnElement
+
+from src.common.filters import (
+    FilterSet,
+    InFilter,
+    NumberFilter,
+    RangeFilter,
+    TrigramILikeFilter,
+)
+from src.data.admin_repositories.products.product import ProductAdminFilterSet
+from src.data.database.models.product import Product
+from tests.common.test_filterset_explain import FakeSession
+
+
+def compile_sql(statement: Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class JoinedPriceFilter(NumberFilter):
+    """Фильтр, условие которого нельзя выделить, как у фильтров с join"""
+
+    def criteria(self, value: Any) -> ColumnElement | None:
+        return None
+
+    def filter(self, query: Any, value: Any) -> Any:
+        return query.where(Product.base_price == value)
+
+
+class FallbackFilterSet(FilterSet):
+    single_query_facets = True
+
+    name = TrigramILikeFilter(Product, "name")
+    base_price = JoinedPriceFilter(Product, "base_price")
+    price_multiplier = NumberFilter(Product, "price_multiplier")
+
+
+def test_single_query_facets_use_one_statement() -> None:
+    session = FakeSession()
+    filter_set = ProductAdminFilterSet(
+        {"name": "chair", "base_price": 100, "product_category_id": 1},
+        session,  # type: ignore
+        select(Product),
+    )
+
+    asyncio.run(filter_set.facets())
+
+    assert len(session.statements) == 1
+    sql = compile_sql(session.statements[0])
+    # Условия фильтров перенесены в FILTER (WHERE ...) агрегатов фасета base_price
+    assert "FILTER (WHERE products.name ILIKE" in sql
+    assert "FILTER (WHERE products.base_price =" not in sql
+
+
+def test_single_query_facets_fall_back_to_separate_query() -> None:
+    session = FakeSession()
+    filter_set = FallbackFilterSet(
+        {"name": "chair", "base_price": 100, "price_multiplier": 2},
+        session,  # type: ignore
+        select(Product),
+    )
+
+    asyncio.run(filter_set.facets())
+
+    # Общий запрос и отдельный запрос фасета фильтра без criteria
+    assert len(session.statements) == 2
+    common_sql, base_price_sql = map(compile_sql, session.statements)
+    assert "WHERE products.base_price =" in common_sql
+    assert "FILTER (WHERE products.name ILIKE" in common_sql
+    assert "products.price_multiplier =" in base_price_sql
+    assert "products.base_price =" not in base_price_sql
+
+
+@pytest.mark.parametrize(
+    "filter_, value, expected",
+    [
+        (InFilter(Product, "id"), [1, 2], "products.id IN"),
+        (InFilter(Product, "id", exclude=True), [1, 2], "(products.id NOT IN"),
+        (NumberFilter(Product, "base_price"), 100, "products.base_price ="),
+        (TrigramILikeFilter(Product, "name"), "chair", "products.name ILIKE"),
+    ],
+)
+def test_criteria(filter_: Any, value: Any, expected: str) -> None:
+    assert compile_sql(filter_.criteria(value)).startswith(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ((100, None), "products.base_price >="),
+        ((None, 200), "products.base_price <="),
+        ((100, 200), "products.base_price >= %(base_price_1)s AND products.base_price <="),
+    ],
+)
+def test_range_criteria(value: tuple, expected: str) -> None:
+    assert compile_sql(RangeFilter(Product, "base_price").criteria(value)).startswith(expected)
+
+
+@pytest.mark.parametrize("value", [None, [], (None, None)])
+def test_empty_value_has_no_criteria(value: Any) -> None:
+    filter_ = (
+        RangeFilter(Product, "base_price") if value == (None, None) else InFilter(Product, "id")
+    )
+    assert filter_.criteria(value) is None
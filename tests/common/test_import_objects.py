@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator
+
+import sqlalchemy as sa
+from pydantic import Field
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from src.common.admin.use_cases.import_objects import AdminImportUseCase
+from src.common.dto import BaseInSchema
+from src.common.exceptions.error_codes import ErrorCode
+from src.common.repository import AdminFilterSchema, BaseRepo
+from src.common.uow import BaseUnitOfWork
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    price: Mapped[int]
+
+
+class ItemRepo(BaseRepo[Item, AdminFilterSchema]):
+    model = Item
+
+
+class ItemCreateSchema(BaseInSchema):
+    name: str = Field(..., min_length=1)
+    price: int = Field(..., ge=0)
+
+
+class AsyncSessionAdapter:
+    """Синхронная сессия SQLite с интерфейсом AsyncSession, нужным импорту"""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    @property
+    def info(self) -> dict:
+        return self.session.info
+
+    async def scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.session.scalars(statement, *args, **kwargs)
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        with self.session.begin_nested():
+            yield
+
+    async def commit(self) -> None:
+        self.session.commit()
+
+    async def close(self) -> None:
+        self.session.close()
+
+
+class UnitOfWork(BaseUnitOfWork):
+    async def __aenter__(self) -> None:
+        await super().__aenter__()
+        self.item = ItemRepo(**self.repository_kwargs)
+
+
+def make_use_case(max_errors: int = 1000) -> tuple[AdminImportUseCase, Session]:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    uow = UnitOfWork(AsyncSessionAdapter(session))  # type: ignore
+    use_case = AdminImportUseCase(
+        uow, "item", ItemCreateSchema, batch_size=2, max_errors=max_errors
+    )
+    return use_case, session
+
+
+def test_failed_counts_rows_and_errors_are_per_field() -> None:
+    use_case, session = make_use_case()
+    rows = [
+        {"name": "a", "price": "1"},
+        {"name": "", "price": "-1"},
+        None,
+        {"name": "b", "price": "2"},
+        {"name": "c", "price": "x"},
+    ]
+
+    report = asyncio.run(use_case(rows))
+
+    assert (report.total, report.created, report.failed) == (5, 2, 3)
+    assert [(e["row"], e["field"]) for e in report.errors] == [
+        (2, "name"),
+        (2, "price"),
+        (3, "__root__"),
+        (5, "price"),
+    ]
+    assert all(e["error_code"] == ErrorCode.VALIDATION_ERROR for e in report.errors)
+    assert session.scalars(sa.select(Item.name).order_by(Item.id)).all() == ["a", "b"]
+
+
+def test_max_errors_limits_report_but_not_failed() -> None:
+    use_case, _ = make_use_case(max_errors=3)
+    rows = [{"name": "", "price": "-1"} for _ in range(4)]
+
+    report = asyncio.run(use_case(rows))
+
+    assert report.failed == 4
+    assert [(e["row"], e["field"]) for e in report.errors] == [
+        (1, "name"),
+        (1, "price"),
+        (2, "name"),
+    ]
+
+
+def test_rows_are_read_outside_event_loop_thread() -> None:
+    use_case, _ = make_use_case()
+    threads: set[threading.Thread] = set()
+
+    def rows() -> Iterator[dict[str, Any]]:
+        for i in range(5):
+            threads.add(threading.current_thread())
+            yield {"name": str(i), "price": i}
+
+    report = asyncio.run(use_case(rows()))
+
+    assert report.created == 5
+    assert threading.main_thread() not in threads
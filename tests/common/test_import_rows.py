@@ -0,0 +1,47 @@
+import codecs
+from typing import Any, Iterator
+
+import pytest
+
+from src.common.utils.import_rows import ROW_PARSERS, RowParseError, iter_csv_rows
+
+
+def decode(data: bytes) -> Iterator[str]:
+    """Чтение загруженного файла, как в import_view"""
+    return codecs.iterdecode(iter(data.splitlines(keepends=True)), "utf-8-sig")
+
+
+def test_csv_rows_skip_empty_values() -> None:
+    rows = list(iter_csv_rows(decode(b'\xef\xbb\xbfname,price\n"a, b",10\nc,\n')))
+    assert rows == [{"name": "a, b", "price": "10"}, {"name": "c"}]
+
+
+def test_csv_is_strict() -> None:
+    rows = iter_csv_rows(decode(b'name,price\na,1\n"b"x,2\n'))
+    assert next(rows) == {"name": "a", "price": "1"}
+    with pytest.raises(RowParseError) as exc_info:
+        next(rows)
+    assert exc_info.value.row == 2
+
+
+def test_ndjson_invalid_line_is_none() -> None:
+    rows = list(ROW_PARSERS["ndjson"](decode(b'{"name": "a"}\n\n{"name": \n[1]\n')))
+    # Невалидная строка попадает в результат и учитывается use case как ошибка строки
+    assert rows == [{"name": "a"}, None, [1]]
+
+
+@pytest.mark.parametrize(
+    "file_format, data",
+    [
+        ("csv", b"name\na\nb\n\xff\n"),
+        ("ndjson", b'{"name": "a"}\n{"name": "b"}\n{"name": "\xff"}\n'),
+    ],
+)
+def test_decode_error_has_row_number(file_format: str, data: bytes) -> None:
+    rows: list[Any] = []
+    with pytest.raises(RowParseError) as exc_info:
+        rows.extend(ROW_PARSERS[file_format](decode(data)))
+
+    assert len(rows) == 2
+    assert exc_info.value.row == 3
+    assert str(exc_info.value).startswith("Row 3: 'utf-8' codec can't decode")
@@ -0,0 +1,161 @@
+import asyncio
+import base64
+import json
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from src.common.exceptions.repository_exceptions import InvalidCursorException
+from src.common.filters import (
+    Filter,
+    FilterSet,
+    KeysetPagination,
+    LimitOffsetPagination,
+    OrderingFilter,
+)
+from src.common.repository import AdminFilterSchema, BaseRepo
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    # BIGINT PRIMARY KEY в SQLite не совпадает с rowid: записи с одинаковым name без
+    # сортировки по id возвращаются в порядке вставки
+    id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    name: Mapped[str]
+
+
+class ItemFilterSet(FilterSet):
+    id = Filter(Item, "id")
+    order = OrderingFilter({"id": (Item, "id"), "name": (Item, "name")})
+    cursor = KeysetPagination(Item)
+    pagination = LimitOffsetPagination()
+
+
+class ItemRepo(BaseRepo[Item, AdminFilterSchema]):
+    model = Item
+    filter_set = ItemFilterSet
+
+
+class AsyncSessionAdapter:
+    """Синхронная сессия SQLite с интерфейсом AsyncSession, нужным репозиторию"""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.session.execute(statement, *args, **kwargs)
+
+
+@pytest.fixture
+def repo() -> ItemRepo:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    for id_, name in [(1, "a"), (5, "b"), (4, "b"), (3, "b"), (2, "b"), (6, "c")]:
+        session.add(Item(id=id_, name=name))
+        session.flush()
+    session.commit()
+    return ItemRepo(AsyncSessionAdapter(session))  # type: ignore
+
+
+def test_cursor_after_offset_page_does_not_skip_duplicate_sort_values(repo: ItemRepo) -> None:
+    schema = AdminFilterSchema[int]
+    page = asyncio.run(repo.list_with_count(schema(order=["name"], pagination=(0, 2))))
+    ids = [item.id for item in page.items]
+    assert page.total_count == 6
+    assert page.next_cursor is not None
+
+    while page.next_cursor:
+        page = asyncio.run(
+            repo.list_with_count(schema(order=["name"], cursor=(page.next_cursor, 2)))
+        )
+        ids.extend(item.id for item in page.items)
+
+    assert ids == [1, 2, 3, 4, 5, 6]
+
+
+class NullableItem(Base):
+    __tablename__ = "nullable_items"
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    name: Mapped[str | None]
+
+
+class NullableItemFilterSet(FilterSet):
+    order = OrderingFilter({"id": (NullableItem, "id"), "name": (NullableItem, "name")})
+    cursor = KeysetPagination(NullableItem)
+
+
+class NullableItemRepo(BaseRepo[NullableItem, AdminFilterSchema]):
+    model = NullableItem
+    filter_set = NullableItemFilterSet
+
+
+NULLABLE_ITEMS = [(1, "b"), (2, None), (3, "a"), (4, None), (5, "b"), (6, "a"), (7, None)]
+
+
+@pytest.fixture
+def nullable_repo() -> NullableItemRepo:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all([NullableItem(id=id_, name=name) for id_, name in NULLABLE_ITEMS])
+    session.commit()
+    return NullableItemRepo(AsyncSessionAdapter(session))  # type: ignore
+
+
+def expected_ids(order: list[str]) -> list[int]:
+    """Порядок записей как в PostgreSQL: NULL больше любого значения"""
+    items = list(NULLABLE_ITEMS)
+    for v in reversed(order):
+        i = ["id", "name"].index(v.lstrip("-"))
+        items.sort(key=lambda item: (item[i] is None, item[i] or 0), reverse=v.startswith("-"))
+    return [id_ for id_, _ in items]
+
+
+@pytest.mark.parametrize(
+    "order",
+    [["name"], ["-name"], ["-name", "-id"], ["name", "-id"], ["-name", "id"], ["-id"]],
+)
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_cursor_pages_cover_all_rows_in_order(
+    nullable_repo: NullableItemRepo, order: list[str], limit: int
+) -> None:
+    schema = AdminFilterSchema[int]
+    expected = expected_ids(order if "id" in {v.lstrip("-") for v in order} else [*order, "id"])
+
+    ids: list[int] = []
+    cursor = ""
+    while True:
+        page = asyncio.run(
+            nullable_repo.list_with_count(schema(order=order, cursor=(cursor, limit)))
+        )
+        ids.extend(item.id for item in page.items)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert ids == expected
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(json.dumps({"id": 1}).encode()).decode(),
+        base64.urlsafe_b64encode(json.dumps(["a"]).encode()).decode(),
+        base64.urlsafe_b64encode(json.dumps(["a", "not id"]).encode()).decode(),
+    ],
+)
+def test_invalid_cursor_raises(nullable_repo: NullableItemRepo, cursor: str) -> None:
+    schema = AdminFilterSchema[int]
+    with pytest.raises(InvalidCursorException):
+        asyncio.run(nullable_repo.list_with_count(schema(order=["name"], cursor=(cursor, 2))))
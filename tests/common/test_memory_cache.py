@@ -0,0 +1,74 @@
+import pytest
+
+from src.common.cache import memory
+from src.common.cache.memory import InMemoryTTLCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(memory.time, "time", clock)
+    return clock
+
+
+def test_entry_expires_after_ttl(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    clock.now += 59
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is None
+
+
+def test_expires_at_caps_ttl(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, expires_at=clock.now + 10)
+
+    clock.now += 10
+    assert cache.get("a") is None
+
+
+def test_expired_expires_at_is_not_stored(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, expires_at=clock.now)
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert list(cache) == ["a", "c"]
+
+
+def test_has_does_not_change_eviction_order(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.has("a")
+    assert "a" in cache
+    cache.set("c", 3)
+
+    assert list(cache) == ["b", "c"]
+
+
+def test_has_drops_expired_entry(clock: Clock) -> None:
+    cache: InMemoryTTLCache[str, int] = InMemoryTTLCache(maxsize=2, ttl=1)
+    cache.set("a", 1)
+    clock.now += 1
+
+    assert not cache.has("a")
+    assert len(cache) == 0
@@ -0,0 +1,79 @@
+import asyncio
+from time import perf_counter
+
+import pytest
+from passlib.hash import bcrypt
+
+from src.utils.security import PasswordHasher, get_password_hash
+
+CONCURRENT_VERIFIES = 8
+TICK_SECONDS = 0.005
+
+
+async def verify_with_max_loop_lag(hasher: PasswordHasher, hashed_password: str) -> float:
+    """Запускает параллельные verify и возвращает максимальную задержку event loop"""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while not done.is_set():
+            started_at = perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            max_lag = max(max_lag, perf_counter() - started_at - TICK_SECONDS)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    results = await asyncio.gather(
+        *(hasher.verify("secret", hashed_password) for _ in range(CONCURRENT_VERIFIES))
+    )
+    done.set()
+    await ticker_task
+    assert all(results)
+    return max_lag
+
+
+@pytest.fixture(scope="module")
+def hashed_password() -> str:
+    return get_password_hash("secret")
+
+
+@pytest.mark.parametrize(
+    "executor_type",
+    [
+        pytest.param(
+            "thread",
+            marks=pytest.mark.skipif(
+                bcrypt.get_backend() != "bcrypt",
+                reason="Backend passlib без пакета bcrypt не отпускает GIL",
+            ),
+        ),
+        "process",
+    ],
+)
+def test_concurrent_verify_does_not_block_event_loop(
+    executor_type: str, hashed_password: str
+) -> None:
+    hasher = PasswordHasher(executor_type=executor_type, max_workers=4)
+    started_at = perf_counter()
+    verify_password_seconds = 0.0
+    try:
+        max_lag = asyncio.run(verify_with_max_loop_lag(hasher, hashed_password))
+        verify_password_seconds = (perf_counter() - started_at) / CONCURRENT_VERIFIES
+    finally:
+        hasher.shutdown()
+
+    # Синхронный bcrypt блокировал бы loop на время всех проверок
+    assert max_lag < 0.1
+    assert max_lag < verify_password_seconds * CONCURRENT_VERIFIES / 2
+
+
+def test_shutdown_recreates_executor(hashed_password: str) -> None:
+    hasher = PasswordHasher(max_workers=1)
+    hasher.shutdown()
+    executor = hasher.executor
+    hasher.shutdown()
+
+    assert hasher.executor is not executor
+    assert asyncio.run(hasher.verify("secret", hashed_password))
+    hasher.shutdown()
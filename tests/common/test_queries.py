@@ -0,0 +1,39 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+
+from src.common.database.queries import selects_whole_table
+from src.data.database.models.product import Product
+
+query = sa.select(Product)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        query,
+        query.order_by(Product.name),
+        query.execution_options(populate_existing=True),
+        sa.select(Product.id, Product.name),
+    ],
+)
+def test_selects_whole_table(statement: Select) -> None:
+    assert selects_whole_table(statement)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        query.where(Product.id == 1),
+        query.join(Product.product_category),
+        query.select_from(sa.table("other")),
+        query.group_by(Product.id),
+        query.distinct(),
+        query.limit(10),
+        query.offset(10),
+        query.options(load_only(Product.name)),
+    ],
+)
+def test_does_not_select_whole_table(statement: Select) -> None:
+    assert not selects_whole_table(statement)
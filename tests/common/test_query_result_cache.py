@@ -0,0 +1,160 @@
+import asyncio
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from src.common.cache.memory import InMemoryCacheBackend
+from src.common.cache.query_result import QueryResultCache
+from src.common.dto import OrmModel
+from src.common.filters import FilterSet, LimitOffsetPagination, RangeFilter
+from src.common.filters.schemas import NumberFilterSpecsSchema
+from src.common.repository import AdminFilterSchema, BaseRepo
+from src.common.uow import BaseUnitOfWork
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    price: Mapped[int]
+
+
+class ItemFilterSet(FilterSet):
+    price = RangeFilter(Item, "price")
+    pagination = LimitOffsetPagination()
+
+
+class ItemSpecsSchema(OrmModel):
+    price: NumberFilterSpecsSchema
+
+
+class ItemRepo(BaseRepo[Item, AdminFilterSchema]):
+    model = Item
+    filter_set = ItemFilterSet
+    specs_schema = ItemSpecsSchema
+    cache_tables = (Item.__tablename__,)
+
+
+class AsyncSessionAdapter:
+    """Синхронная сессия SQLite с интерфейсом AsyncSession, нужным unit of work"""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    @property
+    def info(self) -> dict:
+        return self.session.info
+
+    def add(self, obj: Any) -> None:
+        self.session.add(obj)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return self.session.execute(statement, *args, **kwargs)
+
+    async def flush(self) -> None:
+        self.session.flush()
+
+    async def commit(self) -> None:
+        self.session.commit()
+
+    async def rollback(self) -> None:
+        self.session.rollback()
+
+    async def close(self) -> None:
+        self.session.close()
+
+
+class RecordingQueryResultCache(QueryResultCache):
+    def __init__(self) -> None:
+        super().__init__(InMemoryCacheBackend(maxsize=100))
+        self.invalidated: list[str] = []
+
+    async def invalidate(self, *tables: str) -> None:
+        self.invalidated.extend(tables)
+        await super().invalidate(*tables)
+
+
+@pytest.fixture
+def cache() -> RecordingQueryResultCache:
+    return RecordingQueryResultCache()
+
+
+@pytest.fixture
+def uow(cache: RecordingQueryResultCache) -> BaseUnitOfWork:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Item(id=1, price=10))
+        session.commit()
+    return BaseUnitOfWork(AsyncSessionAdapter(Session(engine)), result_cache=cache)  # type: ignore
+
+
+async def count_and_max_price(uow: BaseUnitOfWork) -> tuple[int | None, float | None]:
+    repo = ItemRepo(**uow.repository_kwargs)
+    schema = AdminFilterSchema[int]
+    # Страница за пределами результатов: кол-во считается отдельным кэшируемым запросом
+    page = await repo.list_with_count(schema(pagination=(100, 10)))
+    specs = await repo.specs(schema())
+    return page.total_count, specs.price.max  # type: ignore
+
+
+def test_commit_of_orm_changes_invalidates_cached_results(
+    uow: BaseUnitOfWork, cache: RecordingQueryResultCache
+) -> None:
+    async def run() -> None:
+        async with uow:
+            assert await count_and_max_price(uow) == (1, 10)
+
+            # Изменение вне ORM без mark_changed не инвалидирует кэш
+            await uow.session.execute(sa.insert(Item).values(id=2, price=20))
+            await uow.commit()
+            assert cache.invalidated == []
+            assert await count_and_max_price(uow) == (1, 10)
+
+            uow.session.add(Item(id=3, price=30))
+            await uow.commit()
+            assert cache.invalidated == ["items"]
+            assert await count_and_max_price(uow) == (3, 30)
+
+    asyncio.run(run())
+
+
+def test_commit_of_marked_changes_invalidates_cached_results(
+    uow: BaseUnitOfWork, cache: RecordingQueryResultCache
+) -> None:
+    async def run() -> None:
+        async with uow:
+            assert await count_and_max_price(uow) == (1, 10)
+
+            await uow.session.execute(sa.insert(Item).values(id=2, price=20))
+            uow.mark_changed(Item.__tablename__)
+            await uow.commit()
+            assert cache.invalidated == ["items"]
+            assert await count_and_max_price(uow) == (2, 20)
+
+    asyncio.run(run())
+
+
+def test_rollback_does_not_invalidate_cached_results(
+    uow: BaseUnitOfWork, cache: RecordingQueryResultCache
+) -> None:
+    async def run() -> None:
+        async with uow:
+            assert await count_and_max_price(uow) == (1, 10)
+
+            uow.session.add(Item(id=2, price=20))
+            await uow.session.flush()
+            await uow.rollback()
+            # Таблицы, собранные при flush, сбрасываются вместе с транзакцией
+            await uow.commit()
+
+            assert cache.invalidated == []
+            assert await count_and_max_price(uow) == (1, 10)
+
+    asyncio.run(run())
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def postgres_dsn() -> str:
+    """asyncpg DSN отдельной базы данных для тестов, которым нужен PostgreSQL.
+    Тесты создают и удаляют свои таблицы. Без TEST_POSTGRES_DSN тесты пропускаются"""
+    dsn = os.environ.get("TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    return dsn
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.common.cache import memory
+from src.domain.jwt_token.cache import JwtTokenStatusCache
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    now = datetime(2026, 1, 1, 12, 0)
+    monkeypatch.setattr(memory.time, "time", now.timestamp)
+    return now
+
+
+def test_entry_lives_until_token_expiration(monkeypatch: pytest.MonkeyPatch, now: datetime) -> None:
+    cache = JwtTokenStatusCache(maxsize=10, ttl=300)
+    cache.set("jti", 1, False, expires_at=now + timedelta(seconds=30))
+    assert cache.get("jti", 1) is False
+
+    monkeypatch.setattr(memory.time, "time", (now + timedelta(seconds=30)).timestamp)
+    assert cache.get("jti", 1) is None
+
+
+def test_entry_lives_no_longer_than_ttl(monkeypatch: pytest.MonkeyPatch, now: datetime) -> None:
+    cache = JwtTokenStatusCache(maxsize=10, ttl=300)
+    cache.set("jti", 1, True, expires_at=now + timedelta(days=1))
+    assert cache.get("jti", 1) is True
+
+    monkeypatch.setattr(memory.time, "time", (now + timedelta(seconds=300)).timestamp)
+    assert cache.get("jti", 1) is None
+
+
+def test_get_ignores_token_of_another_user(now: datetime) -> None:
+    cache = JwtTokenStatusCache(maxsize=10)
+    cache.set("jti", 1, False, expires_at=now + timedelta(hours=1))
+
+    assert cache.get("jti", 2) is None
+
+
+def test_invalidate_user_drops_only_their_tokens(now: datetime) -> None:
+    cache = JwtTokenStatusCache(maxsize=10)
+    expires_at = now + timedelta(hours=1)
+    cache.set("a1", 1, False, expires_at)
+    cache.set("a2", 1, False, expires_at)
+    cache.set("b1", 2, False, expires_at)
+
+    cache.invalidate_user(1)
+
+    assert cache.get("a1", 1) is None
+    assert cache.get("a2", 1) is None
+    assert cache.get("b1", 2) is False
+
+
+def test_user_index_is_bounded_after_eviction(now: datetime) -> None:
+    maxsize = 10
+    cache = JwtTokenStatusCache(maxsize=maxsize)
+    expires_at = now + timedelta(hours=1)
+    for user_id in range(3):
+        for i in range(1000):
+            cache.set(f"{user_id}-{i}", user_id, False, expires_at)
+
+    assert len(cache._statuses) == maxsize
+    indexed = sum(len(tokens) for tokens in cache._user_tokens.values())
+    assert indexed == cache._index_size
+    assert indexed <= 2 * maxsize
+
+
+def test_set_keeps_eviction_order_of_other_tokens(now: datetime) -> None:
+    cache = JwtTokenStatusCache(maxsize=3)
+    expires_at = now + timedelta(hours=1)
+    cache.set("a1", 1, False, expires_at)
+    cache.set("b1", 2, False, expires_at)
+    # Добавление токена пользователя 1 не должно продлевать жизнь его старым токенам
+    cache.set("a2", 1, False, expires_at)
+    cache.set("c1", 3, False, expires_at)
+
+    assert list(cache._statuses) == ["b1", "a2", "c1"]
+    assert cache.get("a1", 1) is None